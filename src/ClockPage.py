@@ -1,16 +1,27 @@
 import time
 import math
+from array import array
 from ui_framework import Page, get_colors, calc_centered_pos
-from picovector import HALIGN_CENTER, VALIGN_MIDDLE, HALIGN_RIGHT, HALIGN_LEFT
+from picovector import HALIGN_CENTER, VALIGN_MIDDLE, HALIGN_RIGHT, HALIGN_LEFT, Polygon, Transform
 from param_store import get_params
 
 class ClockPage(Page):
+    TRACKS_DAMAGE = True
+    REFRESH_MS = 1000
+    ALIGN_TO_SECOND = True
+
     def __init__(self, app_manager):
         super().__init__("Clock", app_manager)
         self.colors = get_colors(app_manager.display)
-        self.dim_white = app_manager.display.create_pen(170, 170, 170)
+        self.dim_white = self.colors["DIM_WHITE"]
         self.params = get_params()
         self.mode = self.params.get("clock_mode", 0)  # 0=Digital, 1=Analog
+        self._last_second = -1
+
+        # Analog face geometry, see face_geometry()
+        self._face_size = None
+        self._transform = Transform()
+        self._identity = Transform()
 
         # Subscribe to parameter changes
         self.params.subscribe("timezone_offset", self._on_timezone_change)
@@ -18,15 +29,40 @@ class ClockPage(Page):
 
     def _on_timezone_change(self, new_val, old_val):
         print(f"ClockPage: Timezone changed from {old_val} to {new_val}")
+        self.invalidate()
 
     def _on_mode_change(self, new_val, old_val):
         self.mode = new_val
+        self.invalidate()
         print(f"ClockPage: Mode changed to {'Analog' if new_val == 1 else 'Digital'}")
+
+    def release(self):
+        # The param store would otherwise keep this page alive
+        self.params.unsubscribe("timezone_offset", self._on_timezone_change)
+        self.params.unsubscribe("clock_mode", self._on_mode_change)
         
     def on_tap(self):
         new_mode = 1 - self.mode  # Toggle 0 <-> 1
         self.params.set("clock_mode", new_mode)  # This triggers _on_mode_change
 
+    async def update(self):
+        now = time.time()
+        if now == self._last_second:
+            return
+        # In digital mode only the seconds row changes, unless the minute rolls over
+        # and in analog mode only the face changes
+        if self.mode == 0 and self._last_second >= 0 and now // 60 == self._last_second // 60:
+            width, height = self.app.display.get_bounds()
+            sec_y = int(height * 0.70)
+            self.invalidate((0, sec_y - 25, width, 50))
+        elif self.mode == 1 and self._last_second >= 0:
+            width, height = self.app.display.get_bounds()
+            self.face_geometry(width, height)
+            self.invalidate(self.face_rect())
+        else:
+            self.invalidate()
+        self._last_second = now
+
     def draw(self, display, vector, offset_x=0):
         # Get Time with configurable timezone offset
         tz_offset = self.params.get("timezone_offset", 8)
@@ -45,10 +81,10 @@ class ClockPage(Page):
         hh = t[3]
         mm = t[4]
         ss = t[5]
-        date_str = f"{t[0]}-{t[1]:02d}-{t[2]:02d}"
+        date_str = self.strings.format("date", "{}-{:02d}-{:02d}", t[0], t[1], t[2])
         
         # Main Time (HH:MM)
-        time_str = f"{hh:02d}:{mm:02d}"
+        time_str = self.strings.format("time", "{:02d}:{:02d}", hh, mm)
         
         # Layout
         time_y = int(height * 0.45)
@@ -72,57 +108,84 @@ class ClockPage(Page):
         # Just drawing the seconds number clearly.
         vector.set_font_size(40)
         display.set_pen(self.colors["ORANGE"])
-        vector.text(f":{ss:02d}", (width // 2) + offset_x, sec_y)
+        vector.text(self.strings.format("seconds", ":{:02d}", ss), (width // 2) + offset_x, sec_y)
 
-    def draw_analog(self, display, vector, t, offset_x):
-        width, height = display.get_bounds()
-        center_x = (width // 2) + offset_x
-        center_y = int(height * 0.5)-10
+    def face_geometry(self, width, height):
+        """
+        Centre (at offset 0), radius and tables for the analog face, built
+        once per screen size: tick endpoints relative to the centre and
+        hand polygons pointing at 12 o'clock around the origin.
+        """
+        if self._face_size == (width, height):
+            return
+        self._face_size = (width, height)
+        self.face_cx = width // 2
+        self.face_cy = int(height * 0.5) - 10
         radius = int(min(width, height) * 0.4)
-        
-        # Face
+        self.face_radius = radius
+
+        # 12 ticks as (x1, y1, x2, y2) from the centre
+        self._ticks = array('h')
+        for i in range(12):
+            angle = math.radians(i * 30)
+            s, c = math.sin(angle), math.cos(angle)
+            self._ticks.append(int(s * (radius - 20)))
+            self._ticks.append(-int(c * (radius - 20)))
+            self._ticks.append(int(s * (radius - 5)))
+            self._ticks.append(-int(c * (radius - 5)))
+
+        # Hands are rotated into place by a Transform each frame
+        self._hour_hand = Polygon().rectangle(-3, -int(radius * 0.5), 6, int(radius * 0.5) + 6)
+        self._minute_hand = Polygon().rectangle(-2, -int(radius * 0.75), 4, int(radius * 0.75) + 6)
+        self._second_hand = Polygon().rectangle(-1, -int(radius * 0.85), 2, int(radius * 0.85) + 12)
+
+    def face_rect(self):
+        """Screen area covered by the analog face (at offset 0)."""
+        r = self.face_radius + 1
+        return (self.face_cx - r, self.face_cy - r, 2 * r + 1, 2 * r + 1)
+
+    def draw_face(self, display, center_x, center_y):
+        radius = self.face_radius
         display.set_pen(self.dim_white)
         display.circle(center_x, center_y, radius)
         display.set_pen(self.colors["BLACK"])
         display.circle(center_x, center_y, radius - 4)
-        
-        # Update Ticks (12 hours)
+
         display.set_pen(self.colors["GRAY"])
-        for i in range(12):
-            angle = math.radians(i * 30)
-            x1 = center_x + int(math.sin(angle) * (radius - 20))
-            y1 = center_y - int(math.cos(angle) * (radius - 20))
-            x2 = center_x + int(math.sin(angle) * (radius - 5))
-            y2 = center_y - int(math.cos(angle) * (radius - 5))
-            display.line(x1, y1, x2, y2)
+        ticks = self._ticks
+        for i in range(0, 48, 4):
+            display.line(center_x + ticks[i], center_y + ticks[i + 1],
+                         center_x + ticks[i + 2], center_y + ticks[i + 3])
+
+    def draw_hand(self, vector, hand, center_x, center_y, angle):
+        transform = self._transform
+        transform.reset()
+        transform.translate(center_x, center_y)
+        transform.rotate(angle, (0, 0))
+        vector.draw(hand)
 
-        # Hands
+    def draw_analog(self, display, vector, t, offset_x):
+        width, height = display.get_bounds()
+        self.face_geometry(width, height)
+        center_x = self.face_cx + offset_x
+        center_y = self.face_cy
+
+        # Face: two circles and 12 lines, drawn directly (a cached copy
+        # of it would take about 300KB at 480x480)
+        self.draw_face(display, center_x, center_y)
+
+        # Hands, on 6 degree steps (the hour hand moves every 12 minutes)
         hh = t[3] % 12
         mm = t[4]
         ss = t[5]
-        
-        # Hour Hand
-        h_angle = math.radians((hh * 30) + (mm * 0.5))
-        hx = center_x + int(math.sin(h_angle) * (radius * 0.5))
-        hy = center_y - int(math.cos(h_angle) * (radius * 0.5))
+        vector.set_transform(self._transform)
         display.set_pen(self.colors["WHITE"])
-        # Draw thick line (simulated by multiple lines or vector polygon if available)
-        # Using simple line for now, maybe 2px offset if possible?
-        display.line(center_x, center_y, hx, hy)
-        
-        # Minute Hand
-        m_angle = math.radians(mm * 6)
-        mx = center_x + int(math.sin(m_angle) * (radius * 0.75))
-        my = center_y - int(math.cos(m_angle) * (radius * 0.75))
+        self.draw_hand(vector, self._hour_hand, center_x, center_y, (hh * 5 + mm // 12) * 6)
         display.set_pen(self.colors["CYAN"])
-        display.line(center_x, center_y, mx, my)
-        
-        # Second Hand
-        s_angle = math.radians(ss * 6)
-        sx = center_x + int(math.sin(s_angle) * (radius * 0.85))
-        sy = center_y - int(math.cos(s_angle) * (radius * 0.85))
+        self.draw_hand(vector, self._minute_hand, center_x, center_y, mm * 6)
         display.set_pen(self.colors["ORANGE"])
-        display.line(center_x, center_y, sx, sy)
+        self.draw_hand(vector, self._second_hand, center_x, center_y, ss * 6)
+        vector.set_transform(self._identity)
         
         # Center Hub
         display.set_pen(self.colors["WHITE"])
@@ -1,12 +1,14 @@
 import time
-import uasyncio as asyncio
-import json
-from simple_websocket import WebSocket
+from data_service import get_store
 from ui_framework import Page, get_colors
 from picovector import HALIGN_LEFT, HALIGN_CENTER, HALIGN_RIGHT, VALIGN_MIDDLE
-from config import UIConfig
 
 class CryptoPage(Page):
+    SNAPSHOT = False  # Prices keep ticking during slides
+    TRACKS_DAMAGE = True
+    MAX_FPS = 20  # Trades can arrive far faster than this
+    STORE_KEYS = ("crypto", "crypto_live")
+
     def __init__(self, app_manager):
         super().__init__("Crypto", app_manager)
         self.colors = get_colors(app_manager.display)
@@ -16,90 +18,59 @@ class CryptoPage(Page):
         self.flash_state = {} 
         self.FLASH_DURATION = 500 # ms
         
-        self.ws_task = None
-        self.ws_client = None
+        self.store = get_store()
+        self._version = -1  # Store price version last applied
         self.last_error = None
         self.is_connected = False
+        self._shown_status = None
 
-    def enter(self):
-        super().enter()
-        self.last_error = None
-        # Defers WS connection to update() to prevent freezing the transition
-
+    async def update(self):
+        # CryptoSource publishes every trade into the store
+        version = self.store.version("crypto")
+        if version != self._version:
+            self._version = version
+            prices = self.store.get("crypto")
+            if prices:
+                for key in ("bitcoin", "ethereum"):
+                    self.apply_price(key, prices.get(key, 0.0))
 
-    def exit(self):
-        super().exit()
-        if self.ws_task:
-            self.ws_task.cancel()
-            self.ws_task = None
-        if self.ws_client:
-            self.ws_client.close()
-            self.ws_client = None
-        self.is_connected = False
+        # Connection state or error text changed -> redraw everything
+        self.is_connected = self.store.get("crypto_live", False)
+        self.last_error = self.store.error("crypto")
+        if self._shown_status is None or self._shown_status != (self.is_connected, self.last_error):
+            self._shown_status = (self.is_connected, self.last_error)
+            self.invalidate()
 
-    async def update(self):
-        # Start WS task here, after transition is complete (UI_STATE_NORMAL)
-        if self.ws_task is None:
-            self.ws_task = asyncio.create_task(self.params_ws_loop()) 
+        # Expire price flashes
+        now = time.ticks_ms()
+        for key in list(self.flash_state):
+            if time.ticks_diff(now, self.flash_state[key]['time']) >= self.FLASH_DURATION:
+                del self.flash_state[key]
+                self.invalidate_row(key)
 
-    async def params_ws_loop(self):
-        while True:
-            try:
-                print("CryptoPage: Connecting to Binance WS...")
-                self.is_connected = False
-                
-                self.ws_client = WebSocket(UIConfig.CRYPTO_WS_URL)
-                await self.ws_client.connect()
-                
-                self.is_connected = True
-                self.last_error = None 
-                print("CryptoPage: Connected!")
+    def frame_interval(self):
+        # Wake in time to end a price flash, otherwise check status once a second
+        return 50 if self.flash_state else 1000
 
-                while True:
-                    msg = await self.ws_client.recv()
-                    if msg:
-                        self.process_message(msg)
-                    else:
-                        print("CryptoPage: WS closed")
-                        break
-            except asyncio.CancelledError:
-                print("CryptoPage: WS Task Cancelled")
-                if self.ws_client:
-                    self.ws_client.close()
-                return
-            except Exception as e:
-                self.last_error = f"{str(e)}"
-                self.is_connected = False
-                print(f"CryptoPage: WS Error: {e}")
-                if self.ws_client:
-                    self.ws_client.close()
-                await asyncio.sleep(5) 
+    def invalidate_row(self, key):
+        """Invalidate the price row of the given coin."""
+        width, height = self.app.display.get_bounds()
+        row_y = int(height * (0.35 if key == "bitcoin" else 0.50))
+        self.invalidate((0, row_y - 20, width, 40))
 
-    def process_message(self, msg):
-        try:
-            data = json.loads(msg)
-            if not isinstance(data, dict):
-                return
-            
-            stream_data = data.get("data", {})
-            symbol = stream_data.get("s")
-            price_str = stream_data.get("p")
-            
-            if symbol and price_str:
-                price = float(price_str)
-                key = "bitcoin" if "BTC" in symbol else "ethereum"
-                
-                old_price = self.prices.get(key, 0.0)
-                self.prices[key] = price
-                
-                if old_price > 0:
-                    if price > old_price:
-                        self.flash_state[key] = {'color': self.colors["GREEN"], 'time': time.ticks_ms()}
-                    elif price < old_price:
-                        self.flash_state[key] = {'color': self.colors["RED"], 'time': time.ticks_ms()}
-                        
-        except Exception as e:
-            print(f"CryptoPage: Parse error: {e}")
+    def apply_price(self, key, price):
+        """Take a new price for key, flashing the row green/red on a change."""
+        old_price = self.prices.get(key, 0.0)
+        if price == old_price:
+            return
+        self.prices[key] = price
+        if old_price == 0:
+            # First price replaces the "Connecting..." message
+            self.invalidate()
+            return
+        self.invalidate_row(key)
+        color = self.colors["GREEN"] if price > old_price else self.colors["RED"]
+        self.flash_state[key] = {'color': color, 'time': time.ticks_ms()}
 
     def draw_label_value(self, display, vector, label, value, y_pos, base_color, width, height, offset_x, flash_key=None):
         label_x = int(width * 0.1) + offset_x
@@ -152,7 +123,7 @@ class CryptoPage(Page):
         eth_price = self.prices.get("ethereum", 0)
 
         if self.last_error:
-            self.draw_error(display, vector, f"{self.last_error}", width, height, offset_x)
+            self.draw_error(display, vector, self.last_error, width, height, offset_x)
             if btc_price == 0: return 
         
         if not self.is_connected and btc_price == 0 and not self.last_error:
@@ -162,8 +133,8 @@ class CryptoPage(Page):
         row1_y = int(height * 0.35)
         row2_y = int(height * 0.50)
         
-        self.draw_label_value(display, vector, "BTC:", f"${btc_price:,.2f}", row1_y, self.colors["YELLOW"], width, height, offset_x, "bitcoin")
-        self.draw_label_value(display, vector, "ETH:", f"${eth_price:,.2f}", row2_y, self.colors["CYAN"], width, height, offset_x, "ethereum")
+        self.draw_label_value(display, vector, "BTC:", self.strings.format("bitcoin", "${:,.2f}", btc_price), row1_y, self.colors["YELLOW"], width, height, offset_x, "bitcoin")
+        self.draw_label_value(display, vector, "ETH:", self.strings.format("ethereum", "${:,.2f}", eth_price), row2_y, self.colors["CYAN"], width, height, offset_x, "ethereum")
 
         # Footer
         footer_y = int(height * 0.85)
@@ -11,6 +11,9 @@ class SettingsPage(Page):
     - Tap elsewhere to exit edit mode
     """
 
+    TRACKS_DAMAGE = True
+    REFRESH_MS = None  # Only redraws on taps
+
     def __init__(self, app_manager):
         super().__init__("Settings", app_manager)
         self.colors = get_colors(app_manager.display)
@@ -80,8 +83,10 @@ class SettingsPage(Page):
 
     def on_tap(self):
         """Handle tap events from AppManager."""
-        touch = self.app.touch
-        x, y = touch.x, touch.y
+        # Any tap can change selection, edit mode or a value
+        self.invalidate()
+
+        x, y = self.app.tap_x, self.app.tap_y
         width, _ = self.app.display.get_bounds()
 
         # Check button area (edit mode only)
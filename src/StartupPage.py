@@ -1,26 +1,61 @@
 import time
-from ui_framework import Page, get_colors
+from ui_framework import Page, get_colors, get_text_metrics
 from picovector import HALIGN_LEFT, VALIGN_MIDDLE
 from config import UIConfig
 
 class StartupPage(Page):
+    TRACKS_DAMAGE = True
+    REFRESH_MS = 33  # Smooth loading bar
+
     def __init__(self, app_manager):
         super().__init__("Startup", app_manager)
         self.colors = get_colors(app_manager.display)
+        self.metrics = get_text_metrics()
         self.start_time = 0
         self.duration = UIConfig.STARTUP_DURATION
         self.switched = False
+        self.progress = 0.0  # Shown bar fill, eased towards target_progress()
+        self._drawn = False
 
     def enter(self):
         super().enter()
         self.start_time = time.ticks_ms()
         self.switched = False
+        self.progress = 0.0
+
+    def target_progress(self, elapsed):
+        """Boot step readiness, or a plain timer when no boot sequence is attached."""
+        boot = self.app.boot
+        if boot is None:
+            return min(1.0, elapsed / self.duration)
+        return boot.progress()
+
+    def is_ready(self, elapsed):
+        boot = self.app.boot
+        if boot is None:
+            return elapsed > self.duration
+        if elapsed > UIConfig.BOOT_TIMEOUT_MS:
+            return True
+        return boot.done and elapsed >= UIConfig.BOOT_MIN_MS
 
     async def update(self):
-        # Check timer
-        if not self.switched and time.ticks_diff(time.ticks_ms(), self.start_time) > self.duration:
+        elapsed = time.ticks_diff(time.ticks_ms(), self.start_time)
+        target = self.target_progress(elapsed)
+        if target != self.progress:
+            # Ease so steps finishing in bursts still animate
+            self.progress += (target - self.progress) * 0.3
+            if abs(target - self.progress) < 0.01:
+                self.progress = target
+            # Only the loading bar moves
+            width, height = self.app.display.get_bounds()
+            self.invalidate((width // 2 - 100, height - 60, 200, 4))
+
+        if not self.switched and self.is_ready(elapsed):
             # Auto-advance to the next page (usually StatusPage at index 1)
             self.switched = True
+            boot = self.app.boot
+            if boot is not None:
+                boot.mark("dashboard")  # Completes the boot timeline report
             self.app.switch_page(1)
 
     def draw(self, display, vector, offset_x=0):
@@ -36,15 +71,14 @@ class StartupPage(Page):
         display.set_pen(self.colors["WHITE"])
         
         text1 = "Pimoroni"
-        # measure_text returns (x, y, w, h)
-        _, _, w1, _ = vector.measure_text(text1)
+        w1 = self.metrics.width(vector, text1, 36)
         x1 = int((width - w1) // 2) + offset_x
         vector.text(text1, x1, height // 2 - 20)
         
         # Subtitle
         vector.set_font_size(28)
         text2 = "Presto"
-        _, _, w2, _ = vector.measure_text(text2)
+        w2 = self.metrics.width(vector, text2, 28)
         x2 = int((width - w2) // 2) + offset_x
         
         display.set_pen(self.colors["BLUE"])
@@ -53,8 +87,10 @@ class StartupPage(Page):
         # Loading bar
         display.set_pen(self.colors["GRAY"])
         bar_width = 200
-        progress = min(1.0, time.ticks_diff(time.ticks_ms(), self.start_time) / self.duration)
-        
         display.rectangle((width//2 - bar_width//2) + offset_x, height - 60, bar_width, 4)
         display.set_pen(self.colors["GREEN"])
-        display.rectangle((width//2 - bar_width//2) + offset_x, height - 60, int(bar_width * progress), 4)
+        display.rectangle((width//2 - bar_width//2) + offset_x, height - 60, int(bar_width * self.progress), 4)
+
+        if not self._drawn and self.app.boot is not None:
+            self._drawn = True
+            self.app.boot.mark("first_frame")
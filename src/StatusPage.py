@@ -10,6 +10,9 @@ from config import WiFiConfig
 CONFIRM_TIMEOUT_MS = 3000
 
 class StatusPage(Page):
+    TRACKS_DAMAGE = True
+    REFRESH_MS = 500  # Poll WiFi state
+
     def __init__(self, app_manager):
         super().__init__("Status", app_manager)
         self.colors = get_colors(app_manager.display)
@@ -28,6 +31,9 @@ class StatusPage(Page):
         self.confirm_pending = False
         self.confirm_start_time = 0
 
+        # Last drawn (status, ip, confirm) to detect changes
+        self._shown_state = None
+
     def draw_label_value(self, display, vector, label, value, y_pos, value_color, width, height, offset_x):
         # Apply offset_x
         label_x = int(width * 0.1) + offset_x
@@ -64,15 +70,29 @@ class StatusPage(Page):
         # Store bounds for tap detection
         self.button_bounds = (x, y, w, h)
 
+    async def update(self):
+        # Check confirmation timeout
+        if self.confirm_pending:
+            if time.ticks_diff(time.ticks_ms(), self.confirm_start_time) > CONFIRM_TIMEOUT_MS:
+                self.confirm_pending = False
+
+        # Redraw only when something shown on the page changed
+        config = self.wm.get_config()
+        ip = config[0] if config else "0.0.0.0"
+        status_code = self.wm.get_status()
+        if (self._shown_state is None or status_code != self._shown_state[0]
+                or ip != self._shown_state[1] or self.confirm_pending != self._shown_state[2]):
+            self._shown_state = (status_code, ip, self.confirm_pending)
+            self.invalidate()
+
     def on_tap(self):
         """Handle tap events - check if button was tapped."""
         if self.button_bounds is None:
             return
         
-        # Get touch position from app manager
-        touch = self.app.touch
-        touch_x = touch.x
-        touch_y = touch.y
+        # Get tap position from app manager
+        touch_x = self.app.tap_x
+        touch_y = self.app.tap_y
         
         bx, by, bw, bh = self.button_bounds
         
@@ -102,11 +122,6 @@ class StatusPage(Page):
     def draw(self, display, vector, offset_x=0):
         width, height = display.get_bounds()
         
-        # Check confirmation timeout
-        if self.confirm_pending:
-            if time.ticks_diff(time.ticks_ms(), self.confirm_start_time) > CONFIRM_TIMEOUT_MS:
-                self.confirm_pending = False
-        
         # Get status to determine layout
         status_code = self.wm.get_status()
         status_text, status_color = self.status_map.get(status_code, ("UNKNOWN", self.colors["GRAY"]))
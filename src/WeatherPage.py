@@ -1,22 +1,61 @@
-import time
-import urequests
-import uasyncio as asyncio
+from array import array
 from ui_framework import Page, get_colors
 from picovector import HALIGN_LEFT, HALIGN_CENTER, VALIGN_MIDDLE, HALIGN_RIGHT
 from config import UIConfig, WeatherConfig
-from param_store import get_params
+from data_service import get_store
+
+# Sub-views, switched by vertical swipes
+VIEW_NOW = 0
+VIEW_HOURLY = 1
+VIEW_DAILY = 2
+VIEW_COUNT = 3
 
 class WeatherPage(Page):
+    """
+    Current conditions, plus hourly and daily forecast views reached by
+    swiping up and down. With several locations configured, a tap shows
+    the next one from the data already fetched.
+
+    Forecast geometry (sparkline points, range bars) and labels are laid
+    out once per published forecast into small arrays, so a frame only
+    walks them. A view switch or a new forecast invalidates the content
+    area below the header; the header is left alone.
+    """
+    TRACKS_DAMAGE = True
+    REFRESH_MS = None  # Store updates wake the render loop
+    STORE_KEYS = ("weather", "forecast")
+
     def __init__(self, app_manager):
         super().__init__("Weather", app_manager)
         self.colors = get_colors(app_manager.display)
-        self.params = get_params()
 
+        self.locations = []         # Published per-location records
+        self.forecasts = []
+        self.location_index = 0
+        self.location_name = ""
+        self.lat = 0.0
+        self.lon = 0.0
         self.temp = 0.0
         self.wmo_code = -1
         self.is_day = 1
         self.last_fetch_time = 0
         self.last_error = None
+        self.has_data = False
+        self.stale = False  # Showing cached data, or the last refresh failed
+        self.store = get_store()
+        self._version = -1  # Store version last drawn
+        self.view = VIEW_NOW
+
+        # Forecast layout, rebuilt by layout_forecast()
+        self.forecast = None
+        self._forecast_version = -1
+        self._layout_size = None        # (width, height) laid out for
+        self._spark = array("h")        # x0, y0, x1, y1, ... per hour
+        self._hour_labels = []          # (x, text) every 6 hours
+        self._spark_hi = None           # (x, y, text) of the warmest hour
+        self._spark_lo = None
+        self._day_bars = array("h")     # x_low, x_high per day
+        self._day_labels = []           # (weekday, low text, high text)
         
         self.weather_map = {
             0: "Clear Sky",
@@ -29,51 +68,114 @@ class WeatherPage(Page):
             95: "Thunderstorm", 96: "Thunderstorm", 99: "Thunderstorm"
         }
 
-    async def enter(self):
-        super().enter()
-        # Trigger fetch if data is stale or never fetched
-        fetch_interval = self.params.get("weather_interval", 900)
-        if time.time() - self.last_fetch_time > fetch_interval or self.last_fetch_time == 0:
-            await self.fetch_weather()
+    def content_rect(self):
+        """Everything below the header."""
+        width, height = self.app.display.get_bounds()
+        top = int(height * 0.2)
+        return (0, top, width, height - top)
+
+    def on_swipe_vertical(self, step):
+        self.view = (self.view + step) % VIEW_COUNT
+        self.invalidate(self.content_rect())
+
+    def on_tap(self):
+        # Next location, from the data already fetched
+        if len(self.locations) > 1:
+            self.location_index = (self.location_index + 1) % len(self.locations)
+            self.select_location()
+            self.invalidate(self.content_rect())
+
+    def select_location(self):
+        """Load the fields drawn from the record at location_index."""
+        if self.location_index >= len(self.locations):
+            self.location_index = 0
+        if self.locations:
+            data = self.locations[self.location_index]
+            self.location_name = data["name"]
+            self.lat = data["lat"]
+            self.lon = data["lon"]
+            self.temp = data["temp"]
+            self.wmo_code = data["code"]
+            self.is_day = data["is_day"]
+            self.has_data = True
+        forecasts = self.forecasts
+        self.forecast = forecasts[self.location_index] if self.location_index < len(forecasts) else None
+        self._layout_size = None
 
     async def update(self):
-        # Periodic fetch
-        fetch_interval = self.params.get("weather_interval", 900)
-        if time.time() - self.last_fetch_time > fetch_interval:
-            await self.fetch_weather()
+        # WeatherSource publishes into the store; redraw when it changed
+        version = self.store.version("forecast")
+        if version != self._forecast_version:
+            self._forecast_version = version
+            self.forecasts = self.store.get("forecast") or []
+            self.select_location()
+            if self.view != VIEW_NOW:
+                self.invalidate(self.content_rect())
 
-    async def fetch_weather(self):
-        print("WeatherPage: Fetching data...")
-        self.last_error = None
-        try:
-            # Get location from params
-            lat = self.params.get("weather_latitude", 25.0330)
-            lon = self.params.get("weather_longitude", 121.5654)
-            # Construct URL for Open-Meteo
-            url = f"{WeatherConfig.API_URL}?latitude={lat}&longitude={lon}&current_weather=true"
-            
-            headers = {'User-Agent': 'PicoreW/1.0'}
-            res = urequests.get(url, headers=headers)
-            
-            if res.status_code != 200:
-                self.last_error = f"HTTP {res.status_code}"
-                res.close()
-                return
+        version = self.store.version("weather")
+        if version == self._version:
+            return
+        self._version = version
+        data = self.store.get("weather")
+        if data:
+            self.locations = data
+            self.select_location()
+            self.last_fetch_time = self.store.updated("weather")
+        self.last_error = self.store.error("weather")
+        self.stale = self.store.is_stale("weather") or self.last_error is not None
+        self.invalidate()
 
-            data = res.json()
-            res.close()
-            
-            current = data.get("current_weather", {})
-            self.temp = current.get("temperature", 0.0)
-            self.wmo_code = current.get("weathercode", 0)
-            self.is_day = current.get("is_day", 1)
-            
-            self.last_fetch_time = time.time()
-            print(f"WeatherPage: Updated Temp={self.temp}, Code={self.wmo_code}")
-            
-        except Exception as e:
-            self.last_error = str(e)
-            print(f"WeatherPage: Fetch failed: {e}")
+    def layout_forecast(self, width, height):
+        """Compute sparkline and bar geometry for the current forecast (once per forecast)."""
+        forecast = self.forecast
+        size = self._layout_size
+        if forecast is None or (size and size[0] == width and size[1] == height):
+            return
+        self._layout_size = (width, height)
+
+        # Hourly sparkline inside [left, right] x [top, bottom]
+        left, right = int(width * 0.12), int(width * 0.85)
+        top, bottom = int(height * 0.36), int(height * 0.62)
+        n = forecast.hours
+        spark = array("h", [0] * (2 * n))
+        labels = []
+        self._spark_hi = self._spark_lo = None
+        rng = forecast.hour_range()
+        if rng:
+            lo, hi = rng
+            span = (hi - lo) or 1.0
+            step = (right - left) / max(n - 1, 1)
+            for i in range(n):
+                x = int(left + i * step)
+                y = int(bottom - (forecast.hour_temp[i] - lo) * (bottom - top) / span)
+                spark[2 * i] = x
+                spark[2 * i + 1] = y
+                if i % 6 == 0:
+                    labels.append((x, "{:02d}h".format(forecast.hour_of(i))))
+                if forecast.hour_temp[i] == hi and self._spark_hi is None:
+                    self._spark_hi = (x, y - 18, "{:.0f}".format(hi))
+                if forecast.hour_temp[i] == lo and self._spark_lo is None:
+                    self._spark_lo = (x, y + 18, "{:.0f}".format(lo))
+        self._spark = spark
+        self._hour_labels = labels
+
+        # Daily range bars over [bar_left, bar_right]
+        bar_left, bar_right = int(width * 0.36), int(width * 0.72)
+        bars = array("h", [0] * (2 * forecast.days))
+        day_labels = []
+        rng = forecast.day_range()
+        if rng:
+            lo, hi = rng
+            span = (hi - lo) or 1.0
+            scale = (bar_right - bar_left) / span
+            for i in range(forecast.days):
+                bars[2 * i] = int(bar_left + (forecast.day_min[i] - lo) * scale)
+                bars[2 * i + 1] = int(bar_left + (forecast.day_max[i] - lo) * scale)
+                day_labels.append((forecast.weekday(i),
+                                   "{:.0f}".format(forecast.day_min[i]),
+                                   "{:.0f}".format(forecast.day_max[i])))
+        self._day_bars = bars
+        self._day_labels = day_labels
 
     def get_weather_desc(self, code):
         return self.weather_map.get(code, "Unknown")
@@ -94,15 +196,104 @@ class WeatherPage(Page):
         display.set_pen(self.colors["WHITE"])
         vector.text("Weather", int(width * 0.1) + offset_x, header_y)
 
-        if self.last_error:
-            self.draw_error(display, vector, f"Error: {self.last_error}", width, height, offset_x)
+        # Old data beats an error message; it is only marked as stale
+        if self.last_error and not self.has_data:
+            self.draw_error(display, vector, self.strings.format("error", "Error: {}", self.last_error), width, height, offset_x)
             return
 
-        if self.last_fetch_time == 0:
+        if not self.has_data:
             self.draw_error(display, vector, "Loading Data...", width, height, offset_x)
             return
 
-        # Main Temperature Display
+        if self.stale:
+            vector.set_font_size(16)
+            vector.set_font_align(HALIGN_RIGHT | VALIGN_MIDDLE)
+            display.set_pen(self.colors["GRAY"])
+            vector.text("Cached", int(width * 0.9) + offset_x, header_y)
+
+        self.draw_view_dots(display, width, height, offset_x)
+        if self.view == VIEW_HOURLY:
+            self.draw_hourly(display, vector, width, height, offset_x)
+        elif self.view == VIEW_DAILY:
+            self.draw_daily(display, vector, width, height, offset_x)
+        else:
+            self.draw_now(display, vector, width, height, offset_x)
+
+    def draw_view_dots(self, display, width, height, offset_x):
+        x = int(width * 0.95) + offset_x
+        y = int(height * 0.5) - 12
+        for i in range(VIEW_COUNT):
+            display.set_pen(self.colors["WHITE"] if i == self.view else self.colors["DOT_INACTIVE"])
+            display.circle(x, y + i * 12, 3)
+
+    def draw_subtitle(self, display, vector, text, width, height, offset_x):
+        y = int(height * 0.25)
+        vector.set_font_size(18)
+        vector.set_font_align(HALIGN_LEFT | VALIGN_MIDDLE)
+        display.set_pen(self.colors["DIM_WHITE"])
+        vector.text(text, int(width * 0.1) + offset_x, y)
+        if self.location_name:
+            vector.set_font_size(16)
+            vector.set_font_align(HALIGN_RIGHT | VALIGN_MIDDLE)
+            display.set_pen(self.colors["GRAY"])
+            vector.text(self.location_name, int(width * 0.9) + offset_x, y)
+
+    def draw_hourly(self, display, vector, width, height, offset_x):
+        self.draw_subtitle(display, vector, "Next 24 hours", width, height, offset_x)
+        self.layout_forecast(width, height)
+        spark = self._spark
+        if len(spark) < 4:
+            self.draw_error(display, vector, "No forecast", width, height, offset_x)
+            return
+
+        display.set_pen(self.colors["CYAN"])
+        for i in range(0, len(spark) - 2, 2):
+            display.line(spark[i] + offset_x, spark[i + 1], spark[i + 2] + offset_x, spark[i + 3], 2)
+
+        vector.set_font_size(16)
+        vector.set_font_align(HALIGN_CENTER | VALIGN_MIDDLE)
+        display.set_pen(self.colors["ORANGE"])
+        x, y, text = self._spark_hi
+        vector.text(text, x + offset_x, y)
+        display.set_pen(self.colors["BLUE"])
+        x, y, text = self._spark_lo
+        vector.text(text, x + offset_x, y)
+
+        label_y = int(height * 0.72)
+        display.set_pen(self.colors["DIM_WHITE"])
+        for x, text in self._hour_labels:
+            vector.text(text, x + offset_x, label_y)
+
+    def draw_daily(self, display, vector, width, height, offset_x):
+        self.draw_subtitle(display, vector, "Next 7 days", width, height, offset_x)
+        self.layout_forecast(width, height)
+        labels = self._day_labels
+        if not labels:
+            self.draw_error(display, vector, "No forecast", width, height, offset_x)
+            return
+
+        bars = self._day_bars
+        top = int(height * 0.33)
+        row_h = int(height * 0.5) // len(labels)
+        vector.set_font_size(16)
+        for i in range(len(labels)):
+            day, low, high = labels[i]
+            y = top + i * row_h
+            vector.set_font_align(HALIGN_LEFT | VALIGN_MIDDLE)
+            display.set_pen(self.colors["WHITE"])
+            vector.text(day, int(width * 0.1) + offset_x, y)
+            display.set_pen(self.colors["BLUE"])
+            vector.set_font_align(HALIGN_RIGHT | VALIGN_MIDDLE)
+            vector.text(low, int(width * 0.32) + offset_x, y)
+            display.set_pen(self.colors["ORANGE"])
+            vector.set_font_align(HALIGN_LEFT | VALIGN_MIDDLE)
+            vector.text(high, int(width * 0.76) + offset_x, y)
+            x0 = bars[2 * i] + offset_x
+            x1 = bars[2 * i + 1] + offset_x
+            display.set_pen(self.colors["CYAN"])
+            display.rectangle(x0, y - 3, max(x1 - x0, 2), 6)
+
+    def draw_now(self, display, vector, width, height, offset_x):
         # Main Temperature Display
         temp_y = int(height * 0.50)
         vector.set_font_size(60)
@@ -116,7 +307,7 @@ class WeatherPage(Page):
         else:
             display.set_pen(self.colors["GREEN"])
             
-        vector.text(f"{self.temp:.1f}c", ((width // 2)-20) + offset_x, temp_y)
+        vector.text(self.strings.format("temp", "{:.1f}c", self.temp), ((width // 2)-20) + offset_x, temp_y)
 
         # Condition Text
         cond_y = int(height * 0.70)
@@ -126,11 +317,15 @@ class WeatherPage(Page):
         display.set_pen(self.colors["WHITE"])
         vector.text(condition_text, (width // 2) + offset_x, cond_y)
 
-        # Footer - show dynamic location
+        # Footer - show the location, and which one of several
         footer_y = int(height * 0.85)
-        lat = self.params.get("weather_latitude", 25.0330)
-        lon = self.params.get("weather_longitude", 121.5654)
-        location_str = f"Lat: {lat:.2f}, Lon: {lon:.2f}"
+        if self.location_name:
+            location_str = self.strings.format("location", "{}", self.location_name)
+        else:
+            location_str = self.strings.format("location", "Lat: {:.2f}, Lon: {:.2f}", self.lat, self.lon)
+        if len(self.locations) > 1:
+            location_str = self.strings.format("location_n", "{} ({}/{})", location_str,
+                                               self.location_index + 1, len(self.locations))
         vector.set_font_size(16)
         vector.set_font_align(HALIGN_CENTER | VALIGN_MIDDLE)
         display.set_pen(self.colors["GRAY"])
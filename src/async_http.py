@@ -0,0 +1,271 @@
+import uasyncio as asyncio
+import json
+import time
+from reactor import get_reactor, close_stream
+from config import HTTPConfig
+
+# Singleton instance
+_http_instance = None
+
+def get_http():
+    """Get the shared HTTPClient (and its connection pool)."""
+    global _http_instance
+    if _http_instance is None:
+        _http_instance = HTTPClient()
+    return _http_instance
+
+
+def parse_url(url):
+    """
+    Split an http(s) URL.
+
+    Returns:
+        (ssl, host, port, path)
+    """
+    proto, _, rest = url.partition("://")
+    if proto == "https":
+        ssl, port = True, 443
+    elif proto == "http":
+        ssl, port = False, 80
+    else:
+        raise ValueError(f"Unsupported URL: {url}")
+    host, slash, path = rest.partition("/")
+    path = slash + path if slash else "/"
+    if ":" in host:
+        host, port = host.split(":", 1)
+        port = int(port)
+    return ssl, host, port, path
+
+
+class Response:
+    """Buffered HTTP response; mirrors the parts of urequests.Response the pages use."""
+    def __init__(self, status_code, reason, headers, content):
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers  # Lower-case names
+        self.content = content
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8")
+
+    def json(self):
+        return json.loads(self.content)
+
+    def close(self):
+        # The body is already read and the connection pooled or closed
+        pass
+
+
+class _Connection:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.last_used = time.ticks_ms()
+        self.reused = False
+        self.body_started = False  # Body bytes were handed out: no retry
+
+    def close(self):
+        close_stream(self.writer)
+
+
+class HTTPClient:
+    """
+    HTTP/1.1 client on uasyncio streams.
+
+    Connections (TLS for https) are opened with asyncio.open_connection,
+    so waiting on the network never blocks the render loop. Host names
+    are resolved through the reactor's address cache; the lookup itself
+    blocks, see Reactor. Bodies may be
+    Content-Length, chunked, or read until the server closes. Idle
+    connections are kept per (host, port, ssl) and reused until they have
+    been idle for HTTPConfig.KEEPALIVE_IDLE_MS.
+    """
+    def __init__(self):
+        self._pool = {}  # (ssl, host, port) -> [_Connection]
+
+    async def get(self, url, headers=None, timeout_ms=None, on_body=None):
+        return await self.request("GET", url, headers=headers, timeout_ms=timeout_ms,
+                                  on_body=on_body)
+
+    async def request(self, method, url, headers=None, body=None, timeout_ms=None,
+                      on_body=None):
+        """
+        Send a request and read the whole response.
+
+        Args:
+            on_body: Optional callable given each piece of a 2xx body as it
+                arrives (at most HTTPConfig.READ_SIZE bytes), instead of
+                buffering it; the response content is then b"". Other
+                statuses are buffered as usual.
+
+        Raises:
+            asyncio.TimeoutError: No complete response within timeout_ms
+                (default HTTPConfig.TIMEOUT_MS).
+            OSError: Connection or protocol failure.
+        """
+        if timeout_ms is None:
+            timeout_ms = HTTPConfig.TIMEOUT_MS
+        return await asyncio.wait_for_ms(self._request(method, url, headers, body, on_body),
+                                         timeout_ms)
+
+    async def _request(self, method, url, headers, body, on_body):
+        ssl, host, port, path = parse_url(url)
+        key = (ssl, host, port)
+        request = self._build_request(method, host, port, ssl, path, headers, body)
+
+        conn = self._take(key)
+        if conn is None:
+            conn = await self._open(host, port, ssl)
+        try:
+            try:
+                response, keep = await self._exchange(conn, method, request, on_body)
+            except (OSError, EOFError):
+                if not conn.reused or conn.body_started:
+                    raise
+                # The server dropped the idle connection: retry on a new one
+                conn.close()
+                conn = await self._open(host, port, ssl)
+                response, keep = await self._exchange(conn, method, request, on_body)
+        except BaseException:
+            # Includes cancellation by the timeout: the stream state is unknown
+            conn.close()
+            raise
+
+        if keep:
+            self._give(key, conn)
+        else:
+            conn.close()
+        return response
+
+    def _build_request(self, method, host, port, ssl, path, headers, body):
+        default_port = 443 if ssl else 80
+        host_header = host if port == default_port else f"{host}:{port}"
+        lines = [
+            f"{method} {path} HTTP/1.1",
+            f"Host: {host_header}",
+            "Connection: keep-alive",
+        ]
+        names = set()
+        if headers:
+            for name, value in headers.items():
+                names.add(name.lower())
+                lines.append(f"{name}: {value}")
+        if "user-agent" not in names:
+            lines.append(f"User-Agent: {HTTPConfig.USER_AGENT}")
+        if body is not None:
+            if isinstance(body, str):
+                body = body.encode("utf-8")
+            lines.append(f"Content-Length: {len(body)}")
+        request = ("\r\n".join(lines) + "\r\n\r\n").encode("utf-8")
+        return request + body if body else request
+
+    async def _open(self, host, port, ssl):
+        reader, writer = await get_reactor().open_connection(host, port, ssl)
+        return _Connection(reader, writer)
+
+    async def _exchange(self, conn, method, request, on_body=None):
+        """Write one request and read its response. Returns (response, keep_alive)."""
+        conn.body_started = False
+        conn.writer.write(request)
+        await conn.writer.drain()
+
+        reader = conn.reader
+        line = await reader.readline()
+        if not line:
+            raise EOFError("Connection closed")
+        parts = line.decode("utf-8").strip().split(" ", 2)
+        if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+            raise OSError(f"Bad status line: {line}")
+        version = parts[0]
+        status = int(parts[1])
+        reason = parts[2] if len(parts) > 2 else ""
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if not line or line == b"\r\n":
+                break
+            name, _, value = line.decode("utf-8").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        connection = headers.get("connection", "").lower()
+        keep = connection != "close" and (version == "HTTP/1.1" or connection == "keep-alive")
+
+        if on_body is not None and 200 <= status < 300:
+            conn.body_started = True
+            sink = on_body
+        else:
+            chunks = []
+            sink = chunks.append
+
+        if method == "HEAD" or status in (204, 304) or 100 <= status < 200:
+            pass
+        elif "chunked" in headers.get("transfer-encoding", "").lower():
+            await self._read_chunked(reader, sink)
+        elif "content-length" in headers:
+            length = int(headers["content-length"])
+            if sink is on_body:
+                while length > 0:
+                    data = await reader.readexactly(min(length, HTTPConfig.READ_SIZE))
+                    length -= len(data)
+                    sink(data)
+            elif length:
+                sink(await reader.readexactly(length))
+        else:
+            # Delimited by the server closing the connection
+            while True:
+                data = await reader.read(HTTPConfig.READ_SIZE)
+                if not data:
+                    break
+                sink(data)
+            keep = False
+        content = b"" if sink is on_body else b"".join(chunks)
+
+        conn.last_used = time.ticks_ms()
+        return Response(status, reason, headers, content), keep
+
+    async def _read_chunked(self, reader, sink):
+        while True:
+            line = await reader.readline()
+            if not line:
+                raise EOFError("Connection closed in chunked body")
+            size = int(line.split(b";", 1)[0].strip(), 16)
+            if size == 0:
+                break
+            while size > 0:
+                data = await reader.readexactly(min(size, HTTPConfig.READ_SIZE))
+                size -= len(data)
+                sink(data)
+            await reader.readexactly(2)  # CRLF after the chunk
+        # Trailer headers, up to the blank line
+        while True:
+            line = await reader.readline()
+            if not line or line == b"\r\n":
+                break
+
+    def _take(self, key):
+        """Pop an idle pooled connection for key that is still fresh."""
+        conns = self._pool.get(key)
+        now = time.ticks_ms()
+        while conns:
+            conn = conns.pop()
+            if time.ticks_diff(now, conn.last_used) < HTTPConfig.KEEPALIVE_IDLE_MS:
+                conn.reused = True
+                return conn
+            conn.close()
+        return None
+
+    def _give(self, key, conn):
+        conns = self._pool.setdefault(key, [])
+        if len(conns) >= HTTPConfig.MAX_IDLE_PER_HOST:
+            conn.close()
+            return
+        conns.append(conn)
+
+    def close(self):
+        """Close all pooled connections."""
+        for conns in self._pool.values():
+            for conn in conns:
+                conn.close()
+        self._pool = {}
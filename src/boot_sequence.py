@@ -0,0 +1,163 @@
+import uasyncio as asyncio
+import time
+import json
+from config import UIConfig
+
+STEP_PENDING = "pending"
+STEP_RUNNING = "running"
+STEP_OK = "ok"
+STEP_ERROR = "error"
+STEP_TIMEOUT = "timeout"
+
+class BootStep:
+    """One boot step and its timing, in ms since the sequence started."""
+    def __init__(self, name, fn=None, weight=1, timeout_ms=None):
+        self.name = name
+        self.fn = fn
+        self.weight = weight
+        self.timeout_ms = timeout_ms
+        self.status = STEP_PENDING
+        self.start = None
+        self.end = None
+        self.detail = None
+
+    def finished(self):
+        return self.status in (STEP_OK, STEP_ERROR, STEP_TIMEOUT)
+
+class BootSequence:
+    """
+    Runs independent boot steps concurrently and records a timeline.
+
+    Steps are plain functions or coroutine functions. A sync step still
+    blocks while it runs, but it overlaps with steps that are waiting
+    (e.g. WiFi association). Work that must finish before the first
+    frame can be timed by the caller and added with record().
+
+    progress() is the weighted fraction of finished steps, which drives
+    the StartupPage loading bar.
+
+    The timeline is reported (printed and saved) once, when the steps are
+    done and, if final_mark is given, that mark has been recorded too.
+    """
+    def __init__(self, final_mark=None):
+        self.t0 = time.ticks_ms()  # ms since power-on at sequence start
+        self.steps = []
+        self.marks = []            # (name, ms)
+        self.done = False
+        self.final_mark = final_mark
+        self.reported = False
+
+    def now(self):
+        """ms since the sequence started."""
+        return time.ticks_diff(time.ticks_ms(), self.t0)
+
+    def add(self, name, fn, weight=1, timeout_ms=None):
+        """Add a step for run(). `fn` may return a coroutine."""
+        step = BootStep(name, fn, weight, timeout_ms)
+        self.steps.append(step)
+        return step
+
+    def record(self, name, start, status=STEP_OK, detail=None):
+        """Add a step the caller already ran, from `start` (see now()) to now."""
+        step = BootStep(name)
+        step.start = start
+        step.end = self.now()
+        step.status = status
+        step.detail = detail
+        self.steps.append(step)
+        return step
+
+    def mark(self, name):
+        """Record a point in time, e.g. the first frame or the first usable page."""
+        self.marks.append((name, self.now()))
+        if self.done and not self.reported:
+            if self.final_mark is None or self.has_mark(self.final_mark):
+                self.reported = True
+                self.report()
+
+    def has_mark(self, name):
+        for mark_name, _ in self.marks:
+            if mark_name == name:
+                return True
+        return False
+
+    def progress(self):
+        """Weighted fraction (0.0-1.0) of steps that have finished."""
+        total = 0
+        finished = 0
+        for step in self.steps:
+            total += step.weight
+            if step.finished():
+                finished += step.weight
+        return finished / total if total else 1.0
+
+    async def _run_step(self, step):
+        step.status = STEP_RUNNING
+        step.start = self.now()
+        try:
+            result = step.fn()
+            if result is not None and hasattr(result, "send"):
+                if step.timeout_ms:
+                    result = await asyncio.wait_for_ms(result, step.timeout_ms)
+                else:
+                    result = await result
+            step.status = STEP_OK
+            if result is not None:
+                step.detail = str(result)
+        except asyncio.TimeoutError:
+            step.status = STEP_TIMEOUT
+        except Exception as e:
+            print(f"Boot: Step '{step.name}' failed: {e}")
+            step.status = STEP_ERROR
+            step.detail = str(e)
+        step.end = self.now()
+
+    async def run(self):
+        """Run all pending steps concurrently; reports the timeline if complete."""
+        tasks = [asyncio.create_task(self._run_step(step))
+                 for step in self.steps if step.status == STEP_PENDING]
+        for task in tasks:
+            await task
+        self.done = True
+        self.mark("steps_done")
+
+    def timeline(self):
+        """The timeline as a JSON-friendly dict."""
+        steps = []
+        for step in self.steps:
+            steps.append({
+                "name": step.name,
+                "status": step.status,
+                "start_ms": step.start,
+                "end_ms": step.end,
+                "ms": time.ticks_diff(step.end, step.start) if step.end is not None else None,
+                "detail": step.detail,
+            })
+        return {
+            "t0_ms": self.t0,
+            "steps": steps,
+            "marks": [{"name": name, "ms": ms} for name, ms in self.marks],
+        }
+
+    def print_timeline(self):
+        print(f"Boot timeline (t0 = {self.t0}ms after power-on):")
+        for step in self.steps:
+            if step.end is None:
+                print(f"  {step.name:<12} {step.status}")
+                continue
+            print(f"  {step.name:<12} {step.start:>6} -> {step.end:>6} ms  {step.status}"
+                  + (f" ({step.detail})" if step.detail else ""))
+        for name, ms in self.marks:
+            print(f"  @{name:<11} {ms:>6} ms")
+
+    def save(self, path=UIConfig.BOOT_TIMELINE_FILE):
+        try:
+            with open(path, "w") as f:
+                json.dump(self.timeline(), f)
+        except OSError as e:
+            print(f"Boot: Timeline save failed ({e})")
+
+    def report(self):
+        """Print and save the timeline."""
+        self.print_timeline()
+        self.save()
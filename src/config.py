@@ -21,8 +21,61 @@ class WiFiConfig:
     AP_IP = "192.168.4.1"
 class UIConfig:
     """Configuration for UI appearance and behavior."""
-    STARTUP_DURATION = 3000
-    STARTUP_DURATION = 3000
+    STARTUP_DURATION = 3000     # Startup page time when no boot sequence drives it
+
+    # Boot sequence
+    BOOT_MIN_MS = 800           # Shortest time the startup page is shown
+    BOOT_TIMEOUT_MS = 10000     # Leave the startup page even if steps are still running
+    BOOT_WIFI_TIMEOUT_MS = 20000  # Give up waiting on WiFi/NTP in the boot timeline
+    BOOT_TIMELINE_FILE = "boot_timeline.json"
+
+    # Frame scheduling (milliseconds)
+    TOUCH_SAMPLE_MS = 8         # Touch sampler interval (125 Hz)
+    TOUCH_SAMPLES = 64          # Touch sample ring buffer size
+    TRANSITION_FRAME_MS = 10    # Frame interval while a slide is running
+    SECOND_ALIGN_POLL_MS = 10   # Re-check interval while waiting for a second boundary
+
+    # Render each page once into an offscreen layer when a slide starts
+    # and only compose the layers per frame (needs 2x framebuffer RAM)
+    SNAPSHOT_TRANSITIONS = True
+
+    # Gestures
+    DRAG_START_PX = 12          # Horizontal travel before a touch becomes a drag
+    FLING_VELOCITY = 600        # px/s on release that commits a page change
+    FLING_WINDOW_MS = 80        # Sample history used for release velocity
+    SWIPE_COMMIT_FRACTION = 0.35  # Drag distance (of width) that commits without a fling
+
+    # Neighbour page prefetch
+    PREFETCH_INTERVAL_MS = 1000 # How often adjacent pages are offered a prefetch
+    PREFETCH_IDLE_MS = 500      # Required time since the last touch
+
+    # Pages in swipe order as (module, class). Modules are imported on
+    # first visit or prefetch; far pages are released when memory is low.
+    PAGES = (
+        ("StartupPage", "StartupPage"),
+        ("StatusPage", "StatusPage"),
+        ("ClockPage", "ClockPage"),
+        ("CryptoPage", "CryptoPage"),
+        ("WeatherPage", "WeatherPage"),
+        ("SettingsPage", "SettingsPage"),
+    )
+    PAGE_KEEP_DISTANCE = 1      # Pages within this many swipes stay loaded
+    PAGE_UNLOAD_FREE_BYTES = 64 * 1024  # Release far pages below this free heap
+
+    # Text rendering
+    FONT_NAME = "Roboto-Medium.af"
+    TEXT_CACHE_SIZE = 64        # Max cached measure_text results (LRU)
+
+    # Frame timing instrumentation
+    FRAME_PROFILING = True
+    PROFILE_SAMPLES = 128       # Ring buffer size per loop phase
+    OVERLAY_LONG_PRESS_MS = 1500  # Long press toggles the timing overlay
+    OVERLAY_REFRESH_MS = 500
+
+    # Heap allocation profiling (gc.mem_alloc around page update/draw)
+    ALLOC_PROFILING = False
+    ALLOC_BUDGET_BYTES = 512    # Default per-frame budget; pages may set ALLOC_BUDGET
+    ALLOC_WARN_INTERVAL_MS = 5000
     CRYPTO_WS_URL = "wss://stream.binance.com:9443/stream?streams=btcusdt@trade/ethusdt@trade"
     # CRYPTO_API_URL = "https://api.coingecko.com/api/v3/simple/price?ids=bitcoin,ethereum&vs_currencies=usd"
     
@@ -36,9 +89,44 @@ class UIConfig:
         "ORANGE": (255, 165, 0),
         "BLUE": (50, 150, 255),
         "YELLOW": (255, 215, 0),
-        "CYAN": (0, 255, 255)
+        "CYAN": (0, 255, 255),
+        "DIM_WHITE": (170, 170, 170),
+        "DOT_INACTIVE": (100, 100, 100)
     }
 
+class HTTPConfig:
+    """Configuration for the async HTTP client (async_http.py)."""
+    TIMEOUT_MS = 10000          # Whole request, connect to last body byte
+    KEEPALIVE_IDLE_MS = 30000   # Pooled connections idle longer are closed
+    MAX_IDLE_PER_HOST = 1       # Idle connections kept per host
+    READ_SIZE = 512             # Read size for streamed and close-delimited bodies
+    USER_AGENT = "PicoreW/1.0"
+
+class WebSocketConfig:
+    """Configuration for the WebSocket client (simple_websocket.py)."""
+    CONNECT_TIMEOUT_MS = 15000  # TCP connect, TLS and upgrade handshake together
+    MAX_HEADER_LINES = 32       # Upgrade response headers accepted
+    RX_BUFFER_SIZE = 4096       # Receive buffer; also the largest frame accepted
+    STATS_WINDOW_MS = 1000      # Frame/byte rates are computed over this window
+    MAX_MESSAGE_SIZE = 8192     # Largest reassembled fragmented message
+    PING_INTERVAL_MS = 20000    # Keepalive ping period, 0 = no pings
+    MAX_MISSED_PONGS = 2        # Unanswered pings before the connection counts as dead
+
+class DataConfig:
+    """Configuration for background data sources (data_service.py)."""
+    JITTER_FRACTION = 0.1       # Intervals vary by +/- 10%
+    BACKOFF_BASE_MS = 5000      # First retry delay after a failure, doubled per failure
+    BACKOFF_MAX_MS = 300000
+    NETWORK_POLL_MS = 2000      # Recheck interval while WiFi is down
+    CRYPTO_RECONNECT_S = 2      # Delay before reopening a closed trade stream
+    TIME_SYNC_INTERVAL_S = 6 * 3600
+
+class CacheConfig:
+    """Configuration for the on-flash response cache (response_cache.py)."""
+    MAX_ENTRIES = 8
+    WRITE_INTERVAL_S = 300      # At most one flash write per 5 minutes
+    WEATHER_MAX_STALE_S = 6 * 3600  # Older cached weather is not shown
+
 class WeatherConfig:
     """Configuration for Weather updates (Open-Meteo)."""
     # Default: Taipei, Taiwan
@@ -48,3 +136,8 @@ class WeatherConfig:
     
     # API URL (Dynamically constructed in Page, but base config here if needed or just use params)
     API_URL = "https://api.open-meteo.com/v1/forecast"
+
+    # Forecast series (fixed array sizes, see forecast.py)
+    FORECAST_HOURS = 24
+    FORECAST_DAYS = 7
+    MAX_LOCATIONS = 4   # Entries of the weather_locations param fetched
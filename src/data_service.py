@@ -0,0 +1,193 @@
+import uasyncio as asyncio
+import time
+import random
+from config import DataConfig
+
+# Singleton instance
+_store_instance = None
+
+def get_store():
+    """Get the singleton DataStore instance."""
+    global _store_instance
+    if _store_instance is None:
+        _store_instance = DataStore()
+    return _store_instance
+
+
+class DataStore:
+    """
+    Latest published value per key, written by data sources, read by pages.
+
+    Every publish (or error change) bumps the key's version, so a page can
+    compare version(key) against the one it last drew instead of comparing
+    values. Reading never does I/O.
+    """
+    def __init__(self):
+        self._values = {}
+        self._versions = {}
+        self._errors = {}
+        self._times = {}
+        self._stale = set()     # Keys whose value is cached, pending a refresh
+        self.on_publish = None  # Called with the key after every change
+
+    def _changed(self, key):
+        self._versions[key] = self._versions.get(key, 0) + 1
+        if self.on_publish:
+            self.on_publish(key)
+
+    def publish(self, key, value, stale=False, fetched_at=None):
+        """
+        Store a new value for key and clear its error.
+
+        Args:
+            stale: The value is an old (e.g. cached) one and a refresh is due.
+            fetched_at: time.time() the value was fetched, default now.
+        """
+        self._values[key] = value
+        self._times[key] = time.time() if fetched_at is None else fetched_at
+        self._errors.pop(key, None)
+        if stale:
+            self._stale.add(key)
+        else:
+            self._stale.discard(key)
+        self._changed(key)
+
+    def set_error(self, key, error):
+        """Record the latest error text for key (None clears it)."""
+        if self._errors.get(key) != error:
+            if error is None:
+                del self._errors[key]
+            else:
+                self._errors[key] = error
+            self._changed(key)
+
+    def get(self, key, default=None):
+        return self._values.get(key, default)
+
+    def version(self, key):
+        """Change counter for key, 0 if nothing was published yet."""
+        return self._versions.get(key, 0)
+
+    def error(self, key):
+        return self._errors.get(key)
+
+    def is_stale(self, key):
+        return key in self._stale
+
+    def updated(self, key):
+        """time.time() of the last publish for key, 0 if never."""
+        return self._times.get(key, 0)
+
+
+class DataSource:
+    """
+    Base class for background data sources run by the DataService.
+
+    fetch() does one round of I/O and publishes into the store; raising
+    counts as a failure and backs off. A streaming source simply stays in
+    fetch() while connected; returning counts as success, and the next
+    round starts after interval_ms().
+    """
+    def __init__(self, name, interval_s, needs_network=True, start_delay_s=0):
+        self.name = name
+        self.interval_s = interval_s
+        self.needs_network = needs_network
+        self.start_delay_s = start_delay_s
+        self.failures = 0
+        self.fetching = False
+        self._refresh = asyncio.Event()
+
+    def interval_ms(self):
+        """Delay after a successful round."""
+        return self.interval_s * 1000
+
+    def restore(self, store):
+        """Publish previously saved data before the first round (optional)."""
+        pass
+
+    def refresh(self):
+        """Ask for a round now. Requests made before it starts collapse into one."""
+        self._refresh.set()
+
+    async def fetch(self, store):
+        """One round of I/O publishing into store. Subclasses override this."""
+        pass
+
+
+class DataService:
+    """
+    Runs each registered DataSource on its own uasyncio task.
+
+    Rounds are spaced by the source's interval with random jitter, so
+    sources started together drift apart. Failures back off exponentially
+    from DataConfig.BACKOFF_BASE_MS up to BACKOFF_MAX_MS. Sources that
+    need the network wait while WiFi is down instead of failing.
+    """
+    def __init__(self, wifi_manager, store=None):
+        self.wm = wifi_manager
+        self.store = store or get_store()
+        self.sources = {}
+        self._tasks = []
+
+    def register(self, source):
+        self.sources[source.name] = source
+        return source
+
+    def refresh(self, name):
+        """Request an immediate round from a source (coalesced)."""
+        self.sources[name].refresh()
+
+    def start(self):
+        for source in self.sources.values():
+            source.restore(self.store)
+            self._tasks.append(asyncio.create_task(self._run_source(source)))
+
+    def stop(self):
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+
+    def jittered(self, delay_ms):
+        """delay_ms spread by +/- DataConfig.JITTER_FRACTION."""
+        spread = int(delay_ms * DataConfig.JITTER_FRACTION)
+        if spread <= 0:
+            return delay_ms
+        return delay_ms - spread + (random.getrandbits(16) * 2 * spread) // 65536
+
+    def backoff_ms(self, failures):
+        delay = DataConfig.BACKOFF_BASE_MS << min(failures - 1, 16)
+        return min(delay, DataConfig.BACKOFF_MAX_MS)
+
+    async def _wait(self, source, delay_ms):
+        """Sleep delay_ms, or less if the source is asked to refresh."""
+        try:
+            await asyncio.wait_for_ms(source._refresh.wait(), delay_ms)
+        except asyncio.TimeoutError:
+            pass
+        source._refresh.clear()
+
+    async def _run_source(self, source):
+        if source.start_delay_s:
+            await self._wait(source, self.jittered(source.start_delay_s * 1000))
+        while True:
+            if source.needs_network and not self.wm.is_connected():
+                await self._wait(source, DataConfig.NETWORK_POLL_MS)
+                continue
+
+            source.fetching = True
+            try:
+                await source.fetch(self.store)
+                source.failures = 0
+                delay = source.interval_ms()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                source.failures += 1
+                delay = self.backoff_ms(source.failures)
+                message = "Timeout" if isinstance(e, asyncio.TimeoutError) else str(e)
+                self.store.set_error(source.name, message)
+                print(f"DataService: {source.name} failed ({message}), retry in {delay}ms")
+            finally:
+                source.fetching = False
+
+            await self._wait(source, self.jittered(delay))
@@ -0,0 +1,257 @@
+import uasyncio as asyncio
+import time
+import ntptime
+from async_http import get_http
+from json_stream import JSONExtractor, Scalar
+from forecast import Forecast
+from data_service import DataSource
+from response_cache import get_response_cache
+from param_store import get_params
+from simple_websocket import WebSocket
+from config import UIConfig, WeatherConfig, DataConfig, CacheConfig
+
+class _LocationSlot:
+    """Sinks for one location's record in a forecast response."""
+    def __init__(self):
+        self.temp = Scalar()
+        self.code = Scalar()
+        self.is_day = Scalar()
+        self.forecast = Forecast()
+        self.targets = self.forecast.targets()
+        self.targets[("current_weather", "temperature")] = self.temp
+        self.targets[("current_weather", "weathercode")] = self.code
+        self.targets[("current_weather", "is_day")] = self.is_day
+
+    def current(self):
+        return [
+            self.temp.value if self.temp.value is not None else 0.0,
+            self.code.value if self.code.value is not None else 0,
+            self.is_day.value if self.is_day.value is not None else 1,
+        ]
+
+
+class WeatherSource(DataSource):
+    """
+    Current weather and forecast from Open-Meteo for every configured
+    location, published as "weather": a list of
+    {"name", "lat", "lon", "temp", "code", "is_day"} and "forecast": a
+    list of Forecasts (next FORECAST_HOURS hours and FORECAST_DAYS days),
+    both in location order. Refetches at once when a location changes.
+
+    Locations come from the "weather_locations" param, a list of
+    [name, lat, lon] (at most WeatherConfig.MAX_LOCATIONS); when it is
+    empty the single weather_latitude/weather_longitude pair is used. All
+    of them go into one request with comma-separated coordinates, so a
+    refresh costs one round trip however many locations there are.
+
+    Responses are kept in the flash response cache by URL: after a reboot
+    the last observation is shown (marked stale) until a refresh lands,
+    and a request for the same URL within the interval is served from
+    the cache without touching the network.
+
+    The body is scanned as it arrives; only the wanted fields are kept,
+    the series going straight into the Forecast arrays, so the response
+    is never held in RAM whole. Two sets of Forecasts are alternated: a
+    fetch fills the set not published, so a failed or half-read response
+    never reaches the page.
+    """
+    def __init__(self):
+        self.params = get_params()
+        self.cache = get_response_cache()
+        super().__init__("weather", self.params.get("weather_interval", WeatherConfig.UPDATE_INTERVAL))
+        self.params.subscribe("weather_latitude", self._on_location_change)
+        self.params.subscribe("weather_longitude", self._on_location_change)
+        self.params.subscribe("weather_locations", self._on_location_change)
+
+        self._slots = [[], []]  # Two sets of _LocationSlot, grown on demand
+        self._back = 0          # Index of the set not published
+        self._record = 0        # Location of the record being scanned
+        self._extractor = None
+
+    def _on_location_change(self, new_val, old_val):
+        self.refresh()
+
+    def interval_ms(self):
+        return self.params.get("weather_interval", WeatherConfig.UPDATE_INTERVAL) * 1000
+
+    def locations(self):
+        """Configured locations as a list of [name, lat, lon]."""
+        locations = self.params.get("weather_locations") or [[
+            "",
+            self.params.get("weather_latitude", WeatherConfig.LATITUDE),
+            self.params.get("weather_longitude", WeatherConfig.LONGITUDE),
+        ]]
+        if len(locations) > WeatherConfig.MAX_LOCATIONS:
+            print(f"WeatherSource: Only the first {WeatherConfig.MAX_LOCATIONS} locations are used")
+            locations = locations[:WeatherConfig.MAX_LOCATIONS]
+        return locations
+
+    def url(self, locations=None):
+        locations = locations or self.locations()
+        lats = ",".join(str(loc[1]) for loc in locations)
+        lons = ",".join(str(loc[2]) for loc in locations)
+        return (f"{WeatherConfig.API_URL}?latitude={lats}&longitude={lons}&current_weather=true"
+                f"&hourly=temperature_2m,weathercode"
+                f"&daily=weathercode,temperature_2m_max,temperature_2m_min"
+                f"&forecast_hours={WeatherConfig.FORECAST_HOURS}"
+                f"&forecast_days={WeatherConfig.FORECAST_DAYS}"
+                f"&timezone=auto&timeformat=unixtime")
+
+    def _back_slots(self, count):
+        slots = self._slots[self._back]
+        while len(slots) < count:
+            slots.append(_LocationSlot())
+        return slots
+
+    def _publish(self, store, locations, records, forecasts, stale=False, fetched_at=None):
+        weather = []
+        for loc, record in zip(locations, records):
+            weather.append({"name": loc[0], "lat": loc[1], "lon": loc[2],
+                            "temp": record[0], "code": record[1], "is_day": record[2]})
+        self._back ^= 1
+        store.publish("forecast", forecasts, stale=stale, fetched_at=fetched_at)
+        store.publish("weather", weather, stale=stale, fetched_at=fetched_at)
+
+    def _publish_cached(self, store, locations, records, stale=False, fetched_at=None):
+        """Publish a cache entry: one [temp, code, is_day, forecast dump] per location."""
+        if len(records) != len(locations):
+            return False
+        slots = self._back_slots(len(records))
+        forecasts = []
+        for slot, record in zip(slots, records):
+            if not slot.forecast.load(record[3]):
+                slot.forecast.hours = slot.forecast.days = 0
+            forecasts.append(slot.forecast)
+        self._publish(store, locations, records, forecasts, stale=stale, fetched_at=fetched_at)
+        return True
+
+    def restore(self, store):
+        locations = self.locations()
+        url = self.url(locations)
+        cached = self.cache.get(url, CacheConfig.WEATHER_MAX_STALE_S)
+        if cached is not None:
+            age = self.cache.age(url)
+            if self._publish_cached(store, locations, cached[0], stale=True,
+                                    fetched_at=time.time() - age if age is not None else 0):
+                print(f"WeatherSource: Showing cached data (age {age}s)")
+
+    def _on_record(self):
+        # One location's object closed: route the next one to the next slot
+        self._record += 1
+        slots = self._slots[self._back]
+        self._extractor.set_targets(slots[self._record].targets if self._record < len(slots) else {})
+
+    async def fetch(self, store):
+        locations = self.locations()
+        url = self.url(locations)
+        # Below the shortest jittered interval, so scheduled rounds always fetch
+        ttl_s = int(self.interval_ms() * (1 - 1.5 * DataConfig.JITTER_FRACTION)) // 1000
+        if self.cache.is_fresh(url, ttl_s):
+            # Same request within its TTL: no network
+            if store.is_stale("weather") or store.get("weather") is None:
+                records = self.cache.get(url, ttl_s)[0]
+                self._publish_cached(store, locations, records,
+                                     fetched_at=time.time() - self.cache.age(url))
+            return
+
+        print(f"WeatherSource: Fetching {len(locations)} location(s)...")
+        count = len(locations)
+        slots = self._back_slots(count)
+        if self._extractor is None:
+            self._extractor = JSONExtractor(slots[0].targets, self._on_record)
+        extractor = self._extractor
+        extractor.reset()
+        extractor.set_targets(slots[0].targets)
+        self._record = 0
+        res = await get_http().get(url, on_body=extractor.feed)
+        if res.status_code != 200:
+            raise OSError(f"HTTP {res.status_code}")
+        extractor.close()
+        if self._record != count:
+            raise OSError(f"Got {self._record} of {count} locations")
+
+        records = []
+        forecasts = []
+        for slot in slots[:count]:
+            slot.forecast.commit()
+            record = slot.current()
+            records.append(record + [slot.forecast.dump()])
+            forecasts.append(slot.forecast)
+        self.cache.put(url, records)
+        self._publish(store, locations, records, forecasts)
+        print(f"WeatherSource: Updated {count} location(s)")
+
+
+class CryptoSource(DataSource):
+    """
+    Live BTC/ETH trade prices from the Binance WebSocket, published as
+    "crypto" ({"bitcoin": float, "ethereum": float}) on every trade, plus
+    "crypto_live" (bool) for the connection state.
+
+    Messages are scanned straight from the WebSocket receive buffer for
+    the symbol and price; nothing else of them is decoded.
+    """
+    def __init__(self):
+        super().__init__("crypto", DataConfig.CRYPTO_RECONNECT_S)
+        self.prices = {"bitcoin": 0.0, "ethereum": 0.0}
+        self.ws_client = None
+        self._symbol = Scalar()
+        self._price = Scalar()
+        self._extractor = JSONExtractor({
+            ("data", "s"): self._symbol,
+            ("data", "p"): self._price,
+        })
+
+    async def fetch(self, store):
+        print("CryptoSource: Connecting to Binance WS...")
+        self.ws_client = WebSocket(UIConfig.CRYPTO_WS_URL)
+        try:
+            await self.ws_client.connect()
+            store.set_error("crypto", None)  # Failures are recorded under the source name
+            store.publish("crypto_live", True)
+            print("CryptoSource: Connected!")
+            while True:
+                message = await self.ws_client.recv_view()
+                if message is None:
+                    print("CryptoSource: WS closed")
+                    break
+                if message[0] == 1:  # Text
+                    self.handle_message(store, message[1])
+        finally:
+            if store.get("crypto_live"):
+                store.publish("crypto_live", False)
+            self.ws_client.close()
+            self.ws_client = None
+
+    def handle_message(self, store, msg):
+        """Apply one trade stream message (bytes-like)."""
+        try:
+            extractor = self._extractor
+            extractor.reset()
+            extractor.feed(msg)
+            extractor.close()
+            symbol = self._symbol.value
+            price_str = self._price.value
+            if symbol and price_str:
+                key = "bitcoin" if "BTC" in symbol else "ethereum"
+                price = float(price_str)
+                if price != self.prices[key]:
+                    self.prices[key] = price
+                    store.publish("crypto", self.prices)
+        except Exception as e:
+            print(f"CryptoSource: Parse error: {e}")
+
+
+class TimeSource(DataSource):
+    """
+    Periodic NTP resync, published as "time_synced" (time.time() after
+    the sync). WiFiManager syncs on connect, so the first round waits one
+    interval. ntptime.settime() blocks for up to its socket timeout.
+    """
+    def __init__(self):
+        super().__init__("time", DataConfig.TIME_SYNC_INTERVAL_S,
+                         start_delay_s=DataConfig.TIME_SYNC_INTERVAL_S)
+
+    async def fetch(self, store):
+        ntptime.settime()
+        store.publish("time_synced", time.time())
@@ -1,19 +1,22 @@
 import uasyncio as asyncio
 import usocket as socket
+from reactor import get_reactor
 
 class DNSServer:
     """
     A minimal asynchronous DNS server for Captive Portal functionality.
     It intercepts all DNS queries and redirects them to a specific IP address (DNS Hijacking).
     """
-    def __init__(self, ip_address):
+    def __init__(self, ip_address, port=53):
         """
         Initialize the DNS server.
 
         Args:
             ip_address (str): The local IP address to redirect all queries to (e.g., '192.168.4.1').
+            port (int): UDP port to listen on.
         """
         self.ip_address = ip_address
+        self.port = port
         self._running = False
         self._task = None
 
@@ -32,41 +35,42 @@ class DNSServer:
         print("DNSServer: Stopped")
 
     async def _run(self):
-        """Main loop for the DNS server listening on UDP port 53."""
+        """Main loop for the DNS server; wakes only when a query arrives."""
         # Create a non-blocking UDP socket
         udps = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         udps.setblocking(False)
         
         try:
-            udps.bind(('0.0.0.0', 53))
+            udps.bind(('0.0.0.0', self.port))
         except Exception as e:
-            print(f"DNSServer: Failed to bind port 53: {e}")
+            print(f"DNSServer: Failed to bind port {self.port}: {e}")
             udps.close()
             return
 
-        while self._running:
-            try:
-                # Use polling to check for incoming data without blocking the asyncio loop
-                data, addr = None, None
+        reactor = get_reactor()
+        reactor.register(udps, "dns")
+        try:
+            while self._running:
                 try:
-                    data, addr = udps.recvfrom(1024)
-                except OSError:
-                    pass # No data available at this tick
+                    # Sleep until a query arrives
+                    await reactor.readable(udps)
+                    try:
+                        data, addr = udps.recvfrom(1024)
+                    except OSError:
+                        continue  # Woken without a datagram
 
-                if data and addr:
                     response = self._make_response(data)
                     if response:
                         udps.sendto(response, addr)
-                
-                await asyncio.sleep_ms(100) # Yield control to other coroutines
-                
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                print(f"DNSServer: Error handling request: {e}")
-                await asyncio.sleep(1)
 
-        udps.close()
+                except asyncio.CancelledError:
+                    break
+                except Exception as e:
+                    print(f"DNSServer: Error handling request: {e}")
+                    await asyncio.sleep(1)
+        finally:
+            reactor.unregister(udps)
+            udps.close()
 
     def _make_response(self, request):
         """
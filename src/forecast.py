@@ -0,0 +1,120 @@
+from array import array
+import binascii
+from json_stream import ArraySink, Scalar
+from config import WeatherConfig
+
+WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+
+# Typecodes of Forecast._arrays(), in order (MicroPython arrays have no .typecode)
+_TYPECODES = ("i", "f", "B", "i", "f", "f", "B")
+
+
+class Forecast:
+    """
+    Hourly and daily forecast series in fixed-size arrays.
+
+    Times are Unix seconds (UTC) with the location's utc_offset kept
+    separately; temperatures are float32, weather codes one byte. A
+    24 h / 7 day forecast takes about 330 bytes of array data and no
+    per-point objects.
+
+    targets() gives the JSONExtractor sinks that fill the arrays from an
+    Open-Meteo response; commit() then records how much arrived.
+    """
+    def __init__(self, hours=WeatherConfig.FORECAST_HOURS, days=WeatherConfig.FORECAST_DAYS):
+        tc = _TYPECODES
+        self.hour_time = array(tc[0], [0] * hours)
+        self.hour_temp = array(tc[1], [0.0] * hours)
+        self.hour_code = array(tc[2], [0] * hours)
+        self.day_time = array(tc[3], [0] * days)
+        self.day_max = array(tc[4], [0.0] * days)
+        self.day_min = array(tc[5], [0.0] * days)
+        self.day_code = array(tc[6], [0] * days)
+        self.hours = 0  # Valid entries
+        self.days = 0
+        self.utc_offset = 0
+        self._offset = Scalar()
+        self._sinks = None
+
+    def _arrays(self):
+        return (self.hour_time, self.hour_temp, self.hour_code,
+                self.day_time, self.day_max, self.day_min, self.day_code)
+
+    def targets(self):
+        """Extractor targets for the hourly/daily blocks of a forecast response."""
+        if self._sinks is None:
+            self._sinks = [ArraySink(buf, tc == "f")
+                           for buf, tc in zip(self._arrays(), _TYPECODES)]
+        s = self._sinks
+        return {
+            ("utc_offset_seconds",): self._offset,
+            ("hourly", "time"): s[0],
+            ("hourly", "temperature_2m"): s[1],
+            ("hourly", "weathercode"): s[2],
+            ("daily", "time"): s[3],
+            ("daily", "temperature_2m_max"): s[4],
+            ("daily", "temperature_2m_min"): s[5],
+            ("daily", "weathercode"): s[6],
+        }
+
+    def commit(self):
+        """Take the counts from the sinks after a successful extraction."""
+        s = self._sinks
+        self.hours = min(s[0].count, s[1].count, s[2].count)
+        self.days = min(s[3].count, s[4].count, s[5].count, s[6].count)
+        self.utc_offset = self._offset.value or 0
+
+    def hour_of(self, i):
+        """Local hour (0-23) of hourly entry i."""
+        return ((self.hour_time[i] + self.utc_offset) // 3600) % 24
+
+    def weekday(self, i):
+        """Local weekday name of daily entry i."""
+        # Open-Meteo daily times are local midnight; 1970-01-01 was a Thursday
+        return WEEKDAYS[((self.day_time[i] + self.utc_offset) // 86400 + 3) % 7]
+
+    def hour_range(self):
+        """(min, max) of the hourly temperatures, or None without data."""
+        return _range(self.hour_temp, self.hours)
+
+    def day_range(self):
+        """(lowest low, highest high) over the daily entries, or None."""
+        if not self.days:
+            return None
+        return _range(self.day_min, self.days)[0], _range(self.day_max, self.days)[1]
+
+    def dump(self):
+        """Compact JSON-able form for the response cache (one hex string)."""
+        blob = b"".join(bytes(buf) for buf in self._arrays())
+        return [self.hours, self.days, self.utc_offset, binascii.hexlify(blob).decode()]
+
+    def load(self, data):
+        """Fill from dump() output. Returns False if it does not fit these arrays."""
+        try:
+            hours, days, utc_offset, blob = data
+            blob = binascii.unhexlify(blob)
+        except (TypeError, ValueError):
+            return False
+        arrays = self._arrays()
+        sizes = [len(bytes(buf)) for buf in arrays]  # No array.itemsize on MicroPython
+        if len(blob) != sum(sizes):
+            return False
+        pos = 0
+        for buf, tc, n in zip(arrays, _TYPECODES, sizes):
+            buf[:] = array(tc, blob[pos:pos + n])
+            pos += n
+        self.hours, self.days, self.utc_offset = hours, days, utc_offset
+        return True
+
+
+def _range(buf, count):
+    if not count:
+        return None
+    lo = hi = buf[0]
+    for i in range(1, count):
+        v = buf[i]
+        if v < lo:
+            lo = v
+        elif v > hi:
+            hi = v
+    return lo, hi
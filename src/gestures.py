@@ -0,0 +1,106 @@
+import time
+import uasyncio as asyncio
+from array import array
+from config import UIConfig
+
+class TouchSampler:
+    """
+    Samples the touch controller at a fixed rate into a ring buffer.
+
+    Each sample is (ticks_ms, x, y, down), stored in preallocated arrays.
+    The AppManager consumes samples in order from its render loop, and
+    velocity() looks back over the most recent ones. Samples are only
+    recorded while touched and on press/release edges; the release
+    sample repeats the last pressed position, as the controller may
+    report 0 once the finger has lifted.
+    """
+    def __init__(self, touch, size=UIConfig.TOUCH_SAMPLES):
+        self.touch = touch
+        self.size = size
+        self.t = array('i', [0] * size)
+        self.x = array('h', [0] * size)
+        self.y = array('h', [0] * size)
+        self.down = bytearray(size)
+        self.count = 0  # Total samples recorded
+
+        self._was_down = False
+        self._last_x = 0
+        self._last_y = 0
+
+    def sample(self):
+        """
+        Poll the controller once and record the result.
+
+        Returns:
+            bool: True if the touch state or position changed.
+        """
+        touch = self.touch
+        touch.poll()
+        is_down = bool(touch.state)
+        if is_down:
+            x = touch.x
+            y = touch.y
+            changed = (not self._was_down) or x != self._last_x or y != self._last_y
+        else:
+            if not self._was_down:
+                return False
+            x = self._last_x
+            y = self._last_y
+            changed = True
+
+        slot = self.count % self.size
+        self.t[slot] = time.ticks_ms()
+        self.x[slot] = x
+        self.y[slot] = y
+        self.down[slot] = 1 if is_down else 0
+        self.count += 1
+
+        self._was_down = is_down
+        self._last_x = x
+        self._last_y = y
+        return changed
+
+    async def run(self, on_change, interval_ms=UIConfig.TOUCH_SAMPLE_MS):
+        """Sample forever, calling on_change() whenever the touch moved."""
+        while True:
+            if self.sample():
+                on_change()
+            await asyncio.sleep_ms(interval_ms)
+
+    def oldest(self):
+        """Sequence number of the oldest sample still in the buffer."""
+        return max(0, self.count - self.size)
+
+    def velocity(self, window_ms):
+        """
+        Horizontal velocity of the latest stroke.
+
+        Args:
+            window_ms: How far back from the last pressed sample to look.
+
+        Returns:
+            int: Pixels per second (negative = moving left), 0 if unknown.
+        """
+        size = self.size
+        i = self.count - 1
+        first = self.oldest()
+
+        # Skip a trailing release sample
+        while i >= first and not self.down[i % size]:
+            i -= 1
+        if i < first:
+            return 0
+
+        end = i % size
+        start = end
+        while i - 1 >= first:
+            prev = (i - 1) % size
+            if not self.down[prev] or time.ticks_diff(self.t[end], self.t[prev]) > window_ms:
+                break
+            start = prev
+            i -= 1
+
+        dt = time.ticks_diff(self.t[end], self.t[start])
+        if dt <= 0:
+            return 0
+        return ((self.x[end] - self.x[start]) * 1000) // dt
@@ -0,0 +1,293 @@
+"""
+Streaming JSON extraction.
+
+JSONExtractor is fed a document in chunks of any size and keeps only
+the values at the key paths it was given. Nothing else is built. Arrays
+of numbers go straight into preallocated array buffers.
+
+    temps = array('f', [0.0] * 24)
+    ex = JSONExtractor({
+        ("current_weather", "temperature"): Scalar(),
+        ("hourly", "temperature_2m"): ArraySink(temps, is_float=True),
+    })
+    ex.feed(chunk)  # repeatedly
+    ex.close()
+"""
+
+# Token modes
+_NONE = 0
+_STRING = 1
+_NUMBER = 2
+_LITERAL = 3
+
+_WS = b" \t\r\n"
+_NUM_CHARS = b"0123456789+-.eE"
+_ESCAPES = {ord("n"): "\n", ord("t"): "\t", ord("r"): "\r", ord("b"): "\b", ord("f"): "\f"}
+
+
+class Scalar:
+    """Sink keeping the last value seen at its path (number, str, bool or None)."""
+    def __init__(self):
+        self.value = None
+
+    def add(self, value):
+        self.value = value
+
+    def reset(self):
+        self.value = None
+
+
+class ArraySink:
+    """
+    Sink writing the elements of a JSON array of numbers into `buf`
+    (an array.array). Elements past len(buf) are counted but dropped;
+    null becomes NaN (is_float) or 0.
+
+    is_float must match the buffer's typecode: MicroPython arrays have
+    no .typecode to read it from.
+    """
+    def __init__(self, buf, is_float=False):
+        self.buf = buf
+        self.count = 0      # Elements written
+        self.dropped = 0    # Elements that did not fit
+        self._is_float = is_float
+
+    def add(self, value):
+        if self.count >= len(self.buf):
+            self.dropped += 1
+            return
+        if value is None or value is True or value is False or isinstance(value, str):
+            value = float("nan") if self._is_float else 0
+        elif not self._is_float:
+            value = int(value)
+        self.buf[self.count] = value
+        self.count += 1
+
+    def reset(self):
+        self.count = 0
+        self.dropped = 0
+
+
+class JSONExtractor:
+    """
+    Incremental JSON scanner that hands the values at selected key paths
+    to sinks.
+
+    A path is a tuple of object keys from the root; array levels do not
+    add to the path, so every element of an array at a path goes to that
+    path's sink. Strings are only decoded for keys on the way to a target
+    and for targeted values.
+
+    Documents that are an array of objects (one record each) use the same
+    paths as a single object. on_record, if given, is called after each
+    top-level record (or the root object) closes; it may set_targets() to
+    route the next record to other sinks with the same paths.
+    """
+    def __init__(self, targets, on_record=None):
+        self.targets = targets
+        self.on_record = on_record
+        self._prefixes = set()
+        for path in targets:
+            for i in range(len(path)):
+                self._prefixes.add(path[:i])
+        self.reset()
+
+    def set_targets(self, targets):
+        """Switch to other sinks for the same paths and reset them."""
+        self.targets = targets
+        for sink in targets.values():
+            sink.reset()
+
+    def reset(self):
+        # Frame per open container: [is_object, path, sink, tracked]
+        # tracked: keys inside may lead to a target
+        self._stack = []
+        self._expect_key = False
+        self._mode = _NONE
+        self._tok = bytearray()
+        self._escape = False
+        self._hex_left = 0      # Digits still to read in a \uXXXX escape
+        self._hex_value = 0
+        self._capture = False   # Current string/number is kept
+        self._is_key = False
+        self._pending_sink = None  # Sink for the value after the current key
+        self._pending_path = None
+        self.done = False
+        for sink in self.targets.values():
+            sink.reset()
+
+    def _value_target(self):
+        """(path, sink) for a value starting now."""
+        if not self._stack:
+            return (), self.targets.get(())
+        frame = self._stack[-1]
+        if frame[0]:
+            return self._pending_path, self._pending_sink
+        return frame[1], frame[2]
+
+    def _emit(self, value):
+        _, sink = self._value_target()
+        if sink is not None:
+            sink.add(value)
+
+    def _open(self, is_object):
+        path, sink = self._value_target()
+        tracked = path is not None and path in self._prefixes
+        self._stack.append([is_object, path, sink, tracked])
+        self._expect_key = is_object
+
+    def _finish_string(self):
+        if self._is_key:
+            frame = self._stack[-1]
+            if frame[3]:
+                key = self._tok.decode("utf-8")
+                path = frame[1] + (key,)
+                self._pending_path = path
+                self._pending_sink = self.targets.get(path)
+            else:
+                self._pending_path = None
+                self._pending_sink = None
+            self._expect_key = False
+        elif self._capture:
+            self._emit(self._tok.decode("utf-8"))
+        self._mode = _NONE
+
+    def _finish_number(self):
+        if self._capture:
+            tok = self._tok
+            if b"." in tok or b"e" in tok or b"E" in tok:
+                self._emit(float(tok.decode()))
+            else:
+                self._emit(int(tok.decode()))
+        self._mode = _NONE
+
+    def _finish_literal(self):
+        if self._capture:
+            tok = bytes(self._tok)
+            if tok == b"true":
+                self._emit(True)
+            elif tok == b"false":
+                self._emit(False)
+            elif tok == b"null":
+                self._emit(None)
+            else:
+                raise ValueError("Bad JSON literal")
+        self._mode = _NONE
+
+    def feed(self, data):
+        """Scan the next chunk (bytes-like) of the document."""
+        i = 0
+        n = len(data)
+        while i < n:
+            mode = self._mode
+            if mode == _STRING:
+                if not (self._capture or self._is_key and self._stack[-1][3]):
+                    # Skip to the closing quote without keeping anything
+                    while i < n:
+                        c = data[i]
+                        i += 1
+                        if self._escape:
+                            self._escape = False
+                        elif c == 92:  # Backslash
+                            self._escape = True
+                        elif c == 34:  # Quote
+                            self._finish_string()
+                            break
+                    continue
+                c = data[i]
+                i += 1
+                if self._hex_left:
+                    self._hex_value = (self._hex_value << 4) | int(chr(c), 16)
+                    self._hex_left -= 1
+                    if not self._hex_left:
+                        code = self._hex_value
+                        # Surrogate pairs are not joined: the fonts lack them anyway
+                        self._tok.extend(("?" if 0xD800 <= code < 0xE000 else chr(code)).encode())
+                elif self._escape:
+                    self._escape = False
+                    if c == 117:  # u
+                        self._hex_left = 4
+                        self._hex_value = 0
+                    else:
+                        esc = _ESCAPES.get(c)
+                        self._tok.extend(esc.encode() if esc else bytes((c,)))
+                elif c == 92:
+                    self._escape = True
+                elif c == 34:
+                    self._finish_string()
+                else:
+                    self._tok.append(c)
+                continue
+
+            c = data[i]
+            if mode == _NUMBER:
+                if c in _NUM_CHARS:
+                    if self._capture:
+                        self._tok.append(c)
+                    i += 1
+                    continue
+                self._finish_number()
+            elif mode == _LITERAL:
+                if 97 <= c <= 122:
+                    self._tok.append(c)
+                    i += 1
+                    continue
+                self._finish_literal()
+
+            i += 1
+            if c in _WS or c == 44 or c == 58:  # Whitespace , :
+                if c == 44 and self._stack and self._stack[-1][0]:
+                    self._expect_key = True
+                continue
+            if c == 34:
+                self._mode = _STRING
+                self._escape = False
+                self._is_key = self._expect_key
+                self._capture = not self._is_key and self._value_target()[1] is not None
+                self._tok = bytearray() if (self._capture or self._is_key) else self._tok
+            elif c == 123:  # {
+                self._open(True)
+            elif c == 91:  # [
+                self._open(False)
+            elif c == 125 or c == 93:  # } ]
+                self._stack.pop()
+                self._expect_key = False
+                stack = self._stack
+                if c == 125 and self.on_record is not None and (
+                        not stack or len(stack) == 1 and not stack[0][0]):
+                    self.on_record()
+                if not stack:
+                    self.done = True
+            elif c in _NUM_CHARS:
+                self._mode = _NUMBER
+                self._capture = self._value_target()[1] is not None
+                if self._capture:
+                    self._tok = bytearray((c,))
+            elif 97 <= c <= 122:
+                self._mode = _LITERAL
+                self._capture = self._value_target()[1] is not None
+                self._tok = bytearray((c,))
+            else:
+                raise ValueError(f"Unexpected byte {c} in JSON")
+
+    def close(self):
+        """End of input: flush a trailing top-level number or literal."""
+        if self._mode == _NUMBER:
+            self._finish_number()
+        elif self._mode == _LITERAL:
+            self._finish_literal()
+        elif self._mode == _STRING:
+            raise ValueError("Unterminated JSON string")
+        if self._stack:
+            raise ValueError("Truncated JSON document")
+
+
+async def extract_stream(reader, extractor, chunk_size=256):
+    """Feed an asyncio stream reader into extractor until EOF."""
+    while True:
+        data = await reader.read(chunk_size)
+        if not data:
+            break
+        extractor.feed(data)
+    extractor.close()
+    return extractor
@@ -3,13 +3,11 @@ from presto import Presto
 from picovector import ANTIALIAS_BEST, PicoVector
 from ui_framework import AppManager
 from wifi_manager import WiFiManager
-from StatusPage import StatusPage
-from CryptoPage import CryptoPage
-from WeatherPage import WeatherPage
-from ClockPage import ClockPage
-from StartupPage import StartupPage
-from SettingsPage import SettingsPage
 from param_store import get_params
+from boot_sequence import BootSequence
+from data_service import DataService, get_store
+from data_sources import WeatherSource, CryptoSource, TimeSource
+from config import UIConfig
 import gc
 
 async def main():
@@ -18,47 +16,73 @@ async def main():
     Initializes hardware, network, and UI.
     """
     print("--- Picore-W Initializing ---")
+    boot = BootSequence(final_mark="dashboard")
     
-    # 1. Initialize Hardware (Presto)
+    # 1. Initialize Hardware (Presto). The first frame needs the display
+    # and font, so these run before anything else.
     try:
+        start = boot.now()
         presto = Presto(ambient_light=True)
         display = presto.display
+        boot.record("hardware", start)
         
         # Setup Vector Graphics
+        start = boot.now()
         vector = PicoVector(display)
         vector.set_antialiasing(ANTIALIAS_BEST)
-        vector.set_font("Roboto-Medium.af", 20)
+        vector.set_font(UIConfig.FONT_NAME, 20)
+        boot.record("font", start)
         
     except Exception as e:
         print(f"Error initializing hardware: {e}")
         return
 
-    # 2. Initialize Parameter Store
-    params = get_params()
-    print(f"ParamStore initialized with timezone={params.get('timezone_offset')}")
-
-    # 3. Initialize WiFi Manager (starts its own state machine task)
+    # 2. Initialize WiFi Manager (starts its own state machine task)
+    start = boot.now()
     wm = WiFiManager()
+    boot.record("wifi_init", start)
     
-    # 4. Initialize UI Framework
+    # 3. Initialize UI Framework
     app_manager = AppManager(presto, wm)
+    app_manager.boot = boot
     
-    # 5. Add Pages
-    # Page 0: Startup (3s delay)
-    app_manager.add_page(StartupPage(app_manager))
-    # Page 1: Status
-    app_manager.add_page(StatusPage(app_manager))
-    # Page 2: Clock
-    app_manager.add_page(ClockPage(app_manager))
-    # Page 3: Crypto Ticker
-    app_manager.add_page(CryptoPage(app_manager))
-    # Page 4: Weather
-    app_manager.add_page(WeatherPage(app_manager))
-    # Page 5: Settings
-    app_manager.add_page(SettingsPage(app_manager))
-   
+    # 4. Register Pages (see UIConfig.PAGES): each module is imported on
+    # first visit or prefetch, so only the startup page loads at boot
+    for module, class_name in UIConfig.PAGES:
+        app_manager.register_page(module, class_name)
+    gc.collect()
+    print(f"Free memory before first frame: {gc.mem_free()}")
+
+    # 5. Concurrent boot steps; StartupPage shows their progress
+    def load_params():
+        params = get_params()
+        return f"timezone={params.get('timezone_offset')}"
+
+    async def wait_wifi():
+        state = await wm.wait_settled()
+        return "connected" if wm.is_connected() else f"state {state}"
+
+    async def wait_ntp():
+        # WiFiManager makes its one NTP attempt before it reports connected
+        await wm.wait_settled()
+        if wm.time_synced:
+            return "synced"
+        return "failed" if wm.is_connected() else "skipped"
+
+    boot.add("params", load_params)
+    boot.add("wifi", wait_wifi, weight=3, timeout_ms=UIConfig.BOOT_WIFI_TIMEOUT_MS)
+    boot.add("ntp", wait_ntp, timeout_ms=UIConfig.BOOT_WIFI_TIMEOUT_MS)
+    asyncio.create_task(boot.run())
+
+    # 6. Background data: sources publish into the store pages draw from
+    get_store().on_publish = app_manager.on_store_publish
+    data_service = DataService(wm)
+    data_service.register(WeatherSource())
+    data_service.register(CryptoSource())
+    data_service.register(TimeSource())
+    data_service.start()
     
-    # 6. Run App
+    # 7. Run App
     await app_manager.run(vector)
 
 if __name__ == "__main__":
@@ -1,24 +1,10 @@
 import time
 import uasyncio as asyncio
-import urequests
+from async_http import get_http
 from picovector import HALIGN_CENTER, HALIGN_LEFT, VALIGN_MIDDLE
-from ui_framework import Page
+from ui_framework import Page, get_colors
 from wifi_manager import STATE_IDLE, STATE_CONNECTING, STATE_CONNECTED, STATE_FAIL, STATE_AP_MODE
 
-# Colors
-def get_colors(display):
-    return {
-        "BLACK": display.create_pen(0, 0, 0),
-        "WHITE": display.create_pen(255, 255, 255),
-        "GRAY": display.create_pen(50, 50, 50),
-        "GREEN": display.create_pen(0, 255, 0),
-        "RED": display.create_pen(255, 50, 50),
-        "ORANGE": display.create_pen(255, 165, 0),
-        "BLUE": display.create_pen(50, 150, 255),
-        "YELLOW": display.create_pen(255, 215, 0),
-        "CYAN": display.create_pen(0, 255, 255)
-    }
-
 class StatusPage(Page):
     def __init__(self, app_manager):
         super().__init__("Status", app_manager)
@@ -83,7 +69,7 @@ class StatusPage(Page):
         vector.set_font_size(16)
         vector.set_font_align(HALIGN_CENTER | VALIGN_MIDDLE)
         display.set_pen(self.colors["GRAY"])
-        vector.text(f"Uptime: {time.ticks_ms() // 1000}s", (width // 2) + offset_x, footer_y)
+        vector.text(self.strings.format("uptime", "Uptime: {}s", time.ticks_ms() // 1000), (width // 2) + offset_x, footer_y)
 
 
 class CryptoPage(Page):
@@ -94,6 +80,7 @@ class CryptoPage(Page):
         self.last_fetch_time = 0
         self.fetch_interval = 60
         self.last_error = None
+        self._fetching = False
 
     async def enter(self):
         super().enter()
@@ -106,14 +93,26 @@ class CryptoPage(Page):
         if time.time() - self.last_fetch_time > self.fetch_interval:
             await self.fetch_prices()
 
+    async def prefetch(self):
+        if time.time() - self.last_fetch_time > self.fetch_interval:
+            await self.fetch_prices()
+
     async def fetch_prices(self):
+        # Coalesce concurrent requests from enter(), update() and prefetch()
+        if self._fetching:
+            return
+        self._fetching = True
+        try:
+            await self._fetch_prices()
+        finally:
+            self._fetching = False
+
+    async def _fetch_prices(self):
         print("CryptoPage: Fetching prices...")
         self.last_error = None
         try:
             url = "https://api.coingecko.com/api/v3/simple/price?ids=bitcoin,ethereum&vs_currencies=usd"
-            headers = {'User-Agent': 'PicoreW/1.0'}
-            
-            res = urequests.get(url, headers=headers)
+            res = await get_http().get(url)
             if res.status_code != 200:
                 self.last_error = f"HTTP {res.status_code}"
                 res.close()
@@ -126,6 +125,9 @@ class CryptoPage(Page):
             self.prices["ethereum"] = data.get("ethereum", {}).get("usd", 0)
             self.last_fetch_time = time.time()
             print(f"CryptoPage: Prices updated: {self.prices}")
+        except asyncio.TimeoutError:
+            self.last_error = "Timeout"
+            print("CryptoPage: Fetch timed out")
         except Exception as e:
             self.last_error = str(e)
             print(f"CryptoPage: Fetch failed: {e}")
@@ -170,14 +172,14 @@ class CryptoPage(Page):
         eth_price = self.prices.get("ethereum", 0)
 
         if self.last_error:
-            self.draw_error(display, vector, f"Error: {self.last_error}", width, height, offset_x)
+            self.draw_error(display, vector, self.strings.format("error", "Error: {}", self.last_error), width, height, offset_x)
         elif btc_price == 0:
             self.draw_error(display, vector, "Loading Data...", width, height, offset_x)
         else:
             row1_y = int(height * 0.35)
             row2_y = int(height * 0.50)
-            self.draw_label_value(display, vector, "BTC:", f"${btc_price:,}", row1_y, self.colors["YELLOW"], width, height, offset_x)
-            self.draw_label_value(display, vector, "ETH:", f"${eth_price:,}", row2_y, self.colors["CYAN"], width, height, offset_x)
+            self.draw_label_value(display, vector, "BTC:", self.strings.format("bitcoin", "${:,}", btc_price), row1_y, self.colors["YELLOW"], width, height, offset_x)
+            self.draw_label_value(display, vector, "ETH:", self.strings.format("ethereum", "${:,}", eth_price), row2_y, self.colors["CYAN"], width, height, offset_x)
 
         # Footer
         footer_y = int(height * 0.85)
@@ -25,6 +25,7 @@ class ParamStore:
         "weather_latitude": 25.0330,
         "weather_longitude": 121.5654,
         "weather_interval": 900,    # 15 minutes in seconds
+        "weather_locations": [],    # [[name, lat, lon], ...]; empty = the lat/lon above
         "clock_mode": 0,            # 0=Digital, 1=Analog
     }
 
@@ -0,0 +1,210 @@
+import time
+import gc
+from array import array
+from config import UIConfig
+
+# Render loop phases, in loop order
+PHASES = ("sleep", "input", "update", "draw", "indicators", "flush")
+
+class RingStats:
+    """
+    Fixed-size ring buffer of integer samples.
+    Percentiles are computed on demand, recording never allocates.
+    """
+    def __init__(self, size):
+        self.size = size
+        self.samples = array('i', [0] * size)
+        self.count = 0   # Total samples recorded
+        self.index = 0   # Next slot to write
+
+    def add(self, value):
+        self.samples[self.index] = value
+        self.index = (self.index + 1) % self.size
+        self.count += 1
+
+    def reset(self):
+        self.count = 0
+        self.index = 0
+
+    def percentiles(self):
+        """Return (p50, p95, max) over the samples held, or None if empty."""
+        n = min(self.count, self.size)
+        if n == 0:
+            return None
+        ordered = sorted(self.samples[:n])
+        return (ordered[n // 2], ordered[min(n - 1, (n * 95) // 100)], ordered[-1])
+
+class FrameProfiler:
+    """
+    Times each phase of the AppManager render loop with time.ticks_us().
+
+    Call begin() at the start of a frame and lap(phase) at the end of each
+    phase; the elapsed time since the previous mark goes to that phase.
+    """
+    def __init__(self, size=UIConfig.PROFILE_SAMPLES):
+        self.enabled = UIConfig.FRAME_PROFILING
+        self.stats = {}
+        for phase in PHASES:
+            self.stats[phase] = RingStats(size)
+        self._mark = time.ticks_us()
+
+    def begin(self):
+        """Start timing from now."""
+        self._mark = time.ticks_us()
+
+    def lap(self, phase):
+        """Record the time since the last mark under phase."""
+        if not self.enabled:
+            return
+        now = time.ticks_us()
+        self.stats[phase].add(time.ticks_diff(now, self._mark))
+        self._mark = now
+
+    def reset(self):
+        for phase in PHASES:
+            self.stats[phase].reset()
+
+    def report(self):
+        """
+        Get the timing summary.
+
+        Returns:
+            dict: phase -> (p50_us, p95_us, max_us), None for phases without samples.
+        """
+        result = {}
+        for phase in PHASES:
+            result[phase] = self.stats[phase].percentiles()
+        return result
+
+    def summary_lines(self):
+        """Report as short text lines (used by the on-screen overlay)."""
+        lines = []
+        for phase in PHASES:
+            p = self.stats[phase].percentiles()
+            if p is None:
+                lines.append(f"{phase:<10} -")
+            else:
+                lines.append(f"{phase:<10} {p[0]:>6} {p[1]:>6} {p[2]:>6}")
+        return lines
+
+    def print_report(self):
+        print("Phase      p50us  p95us  maxus")
+        for line in self.summary_lines():
+            print(line)
+
+
+class PageAllocStats:
+    """Bytes allocated per frame by one page: update, draw and the frame total."""
+    def __init__(self, size):
+        self.update = RingStats(size)
+        self.draw = RingStats(size)
+        self.frame = RingStats(size)
+        self.over_budget = 0
+
+class AllocProfiler:
+    """
+    Attributes heap allocations in the render loop to pages.
+
+    gc.mem_alloc() is sampled around each page's update() and draw();
+    the difference is the bytes that phase allocated. A garbage
+    collection inside the phase makes the difference meaningless (often
+    negative), so such samples are dropped and counted in `collections`.
+    Anything other tasks allocate while update() awaits is counted too.
+
+    end_frame() checks the page's total against its budget: the page's
+    ALLOC_BUDGET, else UIConfig.ALLOC_BUDGET_BYTES.
+    """
+    def __init__(self, size=UIConfig.PROFILE_SAMPLES):
+        self.enabled = UIConfig.ALLOC_PROFILING
+        self.size = size
+        self.pages = {}         # page name -> PageAllocStats
+        self.collections = 0    # Samples dropped because the GC ran
+        self._mark = 0
+        self._frame_bytes = 0
+        self._frame_valid = True
+        self._last_warning = 0
+
+    def _stats(self, page):
+        stats = self.pages.get(page.name)
+        if stats is None:
+            stats = PageAllocStats(self.size)
+            self.pages[page.name] = stats
+        return stats
+
+    def begin(self):
+        """Start counting from now."""
+        if self.enabled:
+            self._mark = gc.mem_alloc()
+
+    def lap(self, page, phase):
+        """Record bytes allocated since begin() under page and phase ("update" or "draw")."""
+        if not self.enabled:
+            return
+        allocated = gc.mem_alloc() - self._mark
+        if allocated < 0:
+            # Collected mid-phase
+            self.collections += 1
+            self._frame_valid = False
+            return
+        getattr(self._stats(page), phase).add(allocated)
+        self._frame_bytes += allocated
+
+    def end_frame(self, page):
+        """Close the frame for page and warn if it went over budget."""
+        if not self.enabled:
+            return
+        allocated = self._frame_bytes
+        valid = self._frame_valid
+        self._frame_bytes = 0
+        self._frame_valid = True
+        if not valid:
+            return
+        stats = self._stats(page)
+        stats.frame.add(allocated)
+        budget = page.ALLOC_BUDGET
+        if budget is None:
+            budget = UIConfig.ALLOC_BUDGET_BYTES
+        if allocated > budget:
+            stats.over_budget += 1
+            now = time.ticks_ms()
+            if time.ticks_diff(now, self._last_warning) >= UIConfig.ALLOC_WARN_INTERVAL_MS:
+                self._last_warning = now
+                print(f"AllocProfiler: {page.name} allocated {allocated}B in a frame (budget {budget}B, free {gc.mem_free()}B)")
+
+    def reset(self):
+        self.pages = {}
+        self.collections = 0
+
+    def report(self):
+        """
+        Get the allocation summary.
+
+        Returns:
+            dict: page name -> {"update", "draw", "frame": (p50, p95, max) bytes
+            or None, "over_budget": count}
+        """
+        result = {}
+        for name, stats in self.pages.items():
+            result[name] = {
+                "update": stats.update.percentiles(),
+                "draw": stats.draw.percentiles(),
+                "frame": stats.frame.percentiles(),
+                "over_budget": stats.over_budget,
+            }
+        return result
+
+    def summary_lines(self):
+        lines = []
+        for name, stats in self.pages.items():
+            p = stats.frame.percentiles()
+            if p is None:
+                lines.append(f"{name:<10} -")
+            else:
+                lines.append(f"{name:<10} {p[0]:>6} {p[1]:>6} {p[2]:>6} {stats.over_budget:>5}")
+        return lines
+
+    def print_report(self):
+        print("Page        p50B   p95B   maxB  over")
+        for line in self.summary_lines():
+            print(line)
+        print(f"({self.collections} samples dropped for GC)")
@@ -0,0 +1,138 @@
+import uasyncio as asyncio
+import usocket as socket
+from uasyncio import core
+
+# Singleton instance
+_reactor_instance = None
+
+def get_reactor():
+    """Get the shared Reactor."""
+    global _reactor_instance
+    if _reactor_instance is None:
+        _reactor_instance = Reactor()
+    return _reactor_instance
+
+
+def close_stream(stream):
+    """
+    Close a uasyncio stream's socket now, from sync code too.
+
+    On MicroPython Stream.close() does nothing and wait_closed() only
+    closes stream.s, so that is closed here directly. A task waiting to
+    read from the stream then wakes and gets an error or EOF.
+    """
+    try:
+        stream.close()
+        stream.s.close()
+    except OSError:
+        pass
+
+
+class _Ready:
+    """Awaitable that parks the task on uasyncio's I/O queue until sock is ready."""
+    def __init__(self, sock, write):
+        self.sock = sock
+        self.write = write
+
+    def __iter__(self):
+        if self.write:
+            yield core._io_queue.queue_write(self.sock)
+        else:
+            yield core._io_queue.queue_read(self.sock)
+
+    __await__ = __iter__
+
+
+class Reactor:
+    """
+    Readiness-based socket waits, shared by all network code.
+
+    uasyncio's scheduler already keeps a uselect.poll of the sockets
+    tasks wait on and sleeps in it when no task is runnable; readable()
+    and writable() park the calling task there, so it wakes only when its
+    socket is ready instead of polling with sleeps. Streams
+    (open_connection) wait on the same poll; their users report reads
+    and writes through stream_read()/stream_drain().
+
+    Every wake-up is counted per registered name, see stats().
+
+    open_connection() keeps the resolved address of each host. There is
+    no asynchronous resolver: socket.getaddrinfo() blocks the whole event
+    loop for the DNS round trip, so it only runs on the first connect to
+    a host and again after a connect to it failed.
+    """
+    def __init__(self):
+        self._names = {}   # sock -> name
+        self._counts = {}  # name -> [read wake-ups, write wake-ups]
+        self._addresses = {}  # host -> resolved IP address string
+
+    def register(self, sock, name):
+        """Attribute wake-ups on sock to name. Counts add up across sockets."""
+        self._names[sock] = name
+        self._counts.setdefault(name, [0, 0])
+
+    def unregister(self, sock):
+        self._names.pop(sock, None)
+
+    def _count(self, name, index):
+        counts = self._counts.get(name)
+        if counts is None:
+            counts = self._counts[name] = [0, 0]
+        counts[index] += 1
+
+    async def readable(self, sock):
+        """Wait until sock has data (or an error/EOF) to read."""
+        await _Ready(sock, False)
+        self._count(self._names.get(sock, "?"), 0)
+
+    async def writable(self, sock):
+        """Wait until sock accepts more data."""
+        await _Ready(sock, True)
+        self._count(self._names.get(sock, "?"), 1)
+
+    async def stream_read(self, name, stream, buf):
+        """stream.readinto(buf), counted as a read wake-up of name."""
+        n = await stream.readinto(buf)
+        self._count(name, 0)
+        return n
+
+    async def stream_drain(self, name, stream):
+        """stream.drain(), counted as a write wake-up of name."""
+        await stream.drain()
+        self._count(name, 1)
+
+    def resolve(self, host, port):
+        """IP address of host; blocks the event loop unless already cached."""
+        addr = self._addresses.get(host)
+        if addr is None:
+            addr = socket.getaddrinfo(host, port)[0][-1][0]
+            self._addresses[host] = addr
+        return addr
+
+    def forget(self, host):
+        """Drop the cached address of host, so the next connect resolves it again."""
+        self._addresses.pop(host, None)
+
+    async def open_connection(self, host, port, ssl=False):
+        """
+        asyncio.open_connection() to the cached address of host.
+
+        TLS still names host for SNI and certificate checks. Any failure,
+        including a timeout cancelling the connect, forgets the address.
+        """
+        addr = self.resolve(host, port)
+        try:
+            if ssl:
+                return await asyncio.open_connection(addr, port, ssl=True, server_hostname=host)
+            return await asyncio.open_connection(addr, port)
+        except BaseException:
+            self.forget(host)
+            raise
+
+    def stats(self):
+        """{name: (read wake-ups, write wake-ups)}."""
+        return {name: tuple(counts) for name, counts in self._counts.items()}
+
+    def print_stats(self):
+        for name, (reads, writes) in self.stats().items():
+            print(f"Reactor: {name:<10} {reads:>6} read, {writes:>6} write wake-ups")
@@ -0,0 +1,110 @@
+import uasyncio as asyncio
+import time
+import json
+from config import CacheConfig
+
+# Singleton instance
+_cache_instance = None
+
+def get_response_cache():
+    """Get the singleton ResponseCache instance."""
+    global _cache_instance
+    if _cache_instance is None:
+        _cache_instance = ResponseCache()
+    return _cache_instance
+
+
+class ResponseCache:
+    """
+    Small persistent cache of fetched payloads, for stale-while-revalidate.
+
+    Entries are {key: [fetched_at, value]} kept in RAM and saved as one
+    JSON file. Saves are rate-limited to one per WRITE_INTERVAL_S to
+    spare the flash; a put() inside that window schedules a deferred save.
+
+    Ages come from time.time(). Before NTP has set the clock, an entry can
+    look like it comes from the future. Its age is then unknown, so it
+    counts as stale but usable.
+    """
+    STORAGE_FILE = "response_cache.json"
+
+    def __init__(self):
+        self._entries = {}
+        self._dirty = False
+        self._last_write = None
+        self._flush_pending = False
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.STORAGE_FILE, "r") as f:
+                self._entries = json.load(f)
+            print(f"ResponseCache: Loaded {len(self._entries)} entries")
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def age(self, key):
+        """Seconds since key was stored, None if unknown (clock not set) or missing."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        age = time.time() - entry[0]
+        return age if age >= 0 else None
+
+    def get(self, key, max_stale_s):
+        """
+        Look up key.
+
+        Returns:
+            (value, age_s) with age_s None if unknown, or None if the
+            entry is missing or older than max_stale_s.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        age = self.age(key)
+        if age is not None and age > max_stale_s:
+            return None
+        return entry[1], age
+
+    def is_fresh(self, key, ttl_s):
+        """True if key was stored less than ttl_s ago (by a set clock)."""
+        age = self.age(key)
+        return age is not None and age < ttl_s
+
+    def put(self, key, value):
+        self._entries[key] = [time.time(), value]
+        # Bound the file: drop the oldest entries
+        while len(self._entries) > CacheConfig.MAX_ENTRIES:
+            oldest = None
+            for k, entry in self._entries.items():
+                if oldest is None or entry[0] < self._entries[oldest][0]:
+                    oldest = k
+            del self._entries[oldest]
+        self._dirty = True
+        self.flush()
+
+    def flush(self, force=False):
+        """Save if dirty and the write interval has passed (or force)."""
+        if not self._dirty:
+            return
+        now = time.ticks_ms()
+        if not force and self._last_write is not None:
+            wait = CacheConfig.WRITE_INTERVAL_S * 1000 - time.ticks_diff(now, self._last_write)
+            if wait > 0:
+                if not self._flush_pending:
+                    self._flush_pending = True
+                    asyncio.create_task(self._flush_later(wait))
+                return
+        try:
+            with open(self.STORAGE_FILE, "w") as f:
+                json.dump(self._entries, f)
+            self._dirty = False
+            self._last_write = now
+        except OSError as e:
+            print(f"ResponseCache: Save failed ({e})")
+
+    async def _flush_later(self, delay_ms):
+        await asyncio.sleep_ms(delay_ms)
+        self._flush_pending = False
+        self.flush()
@@ -1,14 +1,173 @@
-import usocket as socket
 import uasyncio as asyncio
+import time
 import ubinascii
+import uhashlib
 import urandom
-import uselect
+from reactor import get_reactor, close_stream
+from config import WebSocketConfig
+
+# RFC 6455 key suffix for Sec-WebSocket-Accept
+_WS_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+# Opcodes
+OP_CONTINUATION = 0x0
+OP_TEXT = 0x1
+OP_BINARY = 0x2
+OP_CLOSE = 0x8
+OP_PING = 0x9
+OP_PONG = 0xA
+
+def accept_key(key):
+    """Sec-WebSocket-Accept value expected for a Sec-WebSocket-Key (bytes)."""
+    return ubinascii.b2a_base64(uhashlib.sha1(key + _WS_GUID).digest())[:-1]
+
+
+class FrameDecoder:
+    """
+    Parses WebSocket frames in place from one preallocated receive buffer.
+
+    The socket reads straight into free() and reports the count with
+    filled(); next_frame() then walks the buffered bytes without copying
+    and returns the payload as a memoryview into the buffer. A payload is
+    only valid until the next free() call, which may move unparsed bytes
+    to the front of the buffer to make room.
+
+    frames_per_s and bytes_per_s are updated every STATS_WINDOW_MS.
+    """
+    def __init__(self, size=WebSocketConfig.RX_BUFFER_SIZE):
+        self.buf = bytearray(size)
+        self.mv = memoryview(self.buf)
+        self.start = 0  # First unparsed byte
+        self.end = 0    # End of received data
+        self.frames = 0
+        self.bytes = 0
+        self.frames_per_s = 0
+        self.bytes_per_s = 0
+        self._window_start = time.ticks_ms()
+        self._window_frames = 0
+        self._window_bytes = 0
+
+    def free(self):
+        """Writable view of the free space after the buffered bytes."""
+        start = self.start
+        if start == self.end:
+            self.start = self.end = 0
+        elif start:
+            # Move the partial frame to the front
+            n = self.end - start
+            self.mv[:n] = self.mv[start:self.end]
+            self.start = 0
+            self.end = n
+        return self.mv[self.end:]
+
+    def filled(self, n):
+        """n bytes were read into the view free() returned."""
+        self.end += n
+
+    def next_frame(self):
+        """
+        Parse the next complete frame.
+
+        Returns:
+            (fin, opcode, payload memoryview), or None until more bytes arrive.
+
+        Raises:
+            OSError: The frame can never fit in the buffer.
+        """
+        buf = self.buf
+        pos = self.start
+        avail = self.end - pos
+        if avail < 2:
+            return None
+        b0 = buf[pos]
+        b1 = buf[pos + 1]
+        length = b1 & 0x7F
+        head = 2
+        if length == 126:
+            head = 4
+            if avail < head:
+                return None
+            length = (buf[pos + 2] << 8) | buf[pos + 3]
+        elif length == 127:
+            head = 10
+            if avail < head:
+                return None
+            length = 0
+            for i in range(pos + 2, pos + 10):
+                length = (length << 8) | buf[i]
+        masked = b1 & 0x80
+        if masked:
+            head += 4
+        if head + length > len(buf):
+            raise OSError("WebSocket frame too large ({} bytes)".format(length))
+        if avail < head + length:
+            return None
+
+        start = pos + head
+        end = start + length
+        if masked:
+            # Servers must not mask, but undo it in place if one does
+            m = pos + head - 4
+            for i in range(length):
+                buf[start + i] ^= buf[m + (i & 3)]
+        self.start = end
+        self._count(head + length)
+        return b0 & 0x80, b0 & 0x0F, self.mv[start:end]
+
+    def _count(self, n):
+        self.frames += 1
+        self.bytes += n
+        self._window_frames += 1
+        self._window_bytes += n
+        now = time.ticks_ms()
+        elapsed = time.ticks_diff(now, self._window_start)
+        if elapsed >= WebSocketConfig.STATS_WINDOW_MS:
+            self.frames_per_s = self._window_frames * 1000 // elapsed
+            self.bytes_per_s = self._window_bytes * 1000 // elapsed
+            self._window_start = now
+            self._window_frames = 0
+            self._window_bytes = 0
+
 
 class WebSocket:
+    """
+    WebSocket client on uasyncio streams.
+
+    connect() resolves, connects, negotiates TLS (wss) and upgrades
+    without blocking the event loop, and fails with asyncio.TimeoutError
+    if all of that takes longer than WebSocketConfig.CONNECT_TIMEOUT_MS.
+
+    Incoming frames are read into a FrameDecoder; recv_view() hands out
+    payloads without copying them, recv() as a new str. Reads and writes
+    wait for readiness and are counted by the shared Reactor under
+    "websocket".
+
+    Control frames never reach the caller: pings are answered, a close is
+    echoed, and fragmented messages are reassembled (up to
+    MAX_MESSAGE_SIZE). While connected, a keepalive task pings every
+    PING_INTERVAL_MS and measures the round trip (rtt_ms); after
+    MAX_MISSED_PONGS pings go unanswered the connection counts as dead and
+    is closed, and the pending receive raises OSError.
+    """
     def __init__(self, uri):
         self.uri = uri
-        self.sock = None
+        self.reader = None
+        self.writer = None
         self.ssl = False
+        self.decoder = FrameDecoder()
+        self.reactor = get_reactor()
+        self.error = None           # Why the connection was dropped, if it was
+        self.rtt_ms = None          # Last ping round trip
+        self.pings_sent = 0
+        self.pongs_received = 0
+        self.missed_pongs = 0
+        self._ping_token = None     # Payload of the unanswered ping
+        self._ping_sent_at = 0
+        self._keepalive_task = None
+        self._close_sent = False
+        self._message = None        # Reassembly buffer, allocated on first use
+        self._message_len = 0
+        self._message_opcode = None # Opcode of the message being reassembled
         
         proto, dummy, host, path = uri.split("/", 3)
         self.host = host
@@ -23,131 +182,229 @@ class WebSocket:
             self.host, port = self.host.split(":")
             self.port = int(port)
 
-    async def connect(self):
-        # Blocking connect for reliability during handshake
-        ai = socket.getaddrinfo(self.host, self.port, 0, socket.SOCK_STREAM)
-        ai = ai[0]
-        
-        self.sock = socket.socket(ai[0], ai[1], ai[2])
-        # self.sock.setblocking(False) # Keep blocking for setup
-        
+    async def connect(self, timeout_ms=None):
+        """
+        Open the connection and perform the upgrade handshake.
+
+        Raises:
+            asyncio.TimeoutError: Not connected within timeout_ms
+                (default WebSocketConfig.CONNECT_TIMEOUT_MS).
+            OSError: Connection failure or a handshake the server got wrong.
+        """
+        if timeout_ms is None:
+            timeout_ms = WebSocketConfig.CONNECT_TIMEOUT_MS
+        self.error = None
+        self._close_sent = False
+        self._message_opcode = None
+        self._ping_token = None
+        self.missed_pongs = 0
         try:
-            self.sock.connect(ai[-1])
-        except OSError as e:
+            await asyncio.wait_for_ms(self._connect(), timeout_ms)
+        except BaseException:
             self.close()
-            raise e
+            raise
+        if WebSocketConfig.PING_INTERVAL_MS:
+            self._keepalive_task = asyncio.create_task(self._keepalive())
 
-        if self.ssl:
-            import ssl
-            # Wrap socket (blocking)
-            self.sock = ssl.wrap_socket(self.sock, server_hostname=self.host)
+    async def _connect(self):
+        # Only resolves the host on the first connect or after a failed one
+        self.reader, self.writer = await self.reactor.open_connection(self.host, self.port, self.ssl)
+        self.decoder.start = self.decoder.end = 0
 
         key = ubinascii.b2a_base64(bytes(urandom.getrandbits(8) for _ in range(16)))[:-1]
-
+        default_port = 443 if self.ssl else 80
+        host = self.host if self.port == default_port else "{}:{}".format(self.host, self.port)
         header = (
             "GET {} HTTP/1.1\r\n"
-            "Host: {}:{}\r\n"
+            "Host: {}\r\n"
             "Connection: Upgrade\r\n"
             "Upgrade: websocket\r\n"
             "Sec-WebSocket-Key: {}\r\n"
             "Sec-WebSocket-Version: 13\r\n"
             "\r\n"
-        ).format(self.path, self.host, self.port, key)
+        ).format(self.path, host, key.decode())
+        self.writer.write(header.encode())
+        await self.writer.drain()
 
-        # Send header (blocking)
-        self.sock.write(header.encode())
+        # Buffered header read, one line at a time
+        status = await self.reader.readline()
+        if not status:
+            raise OSError("Connection closed during handshake")
+        parts = status.split(None, 2)
+        if len(parts) < 2 or parts[1] != b"101":
+            raise OSError("WebSocket handshake failed: {}".format(status.strip().decode()))
 
-        # Read handshake (blocking)
-        header_data = b""
-        while b"\r\n\r\n" not in header_data:
-            chunk = self.sock.read(1)
-            if not chunk:
+        headers = {}
+        for _ in range(WebSocketConfig.MAX_HEADER_LINES):
+            line = await self.reader.readline()
+            if not line:
                 raise OSError("Connection closed during handshake")
-            header_data += chunk
+            if line == b"\r\n":
+                break
+            name, _, value = line.partition(b":")
+            headers[name.strip().lower()] = value.strip()
+        else:
+            raise OSError("WebSocket handshake: too many headers")
 
-        if not header_data.startswith(b"HTTP/1.1 101"):
-             raise OSError("WebSocket handshake failed")
-             
-        # Switch to non-blocking for asyncio usage
-        self.sock.setblocking(False)
+        if headers.get(b"upgrade", b"").lower() != b"websocket":
+            raise OSError("WebSocket handshake: missing Upgrade: websocket")
+        if b"upgrade" not in headers.get(b"connection", b"").lower():
+            raise OSError("WebSocket handshake: missing Connection: Upgrade")
+        if headers.get(b"sec-websocket-accept") != accept_key(key):
+            raise OSError("WebSocket handshake: bad Sec-WebSocket-Accept")
 
     async def _send(self, data):
-        # Non-blocking send loop
-        total_sent = 0
-        while total_sent < len(data):
-            try:
-                sent = self.sock.write(data[total_sent:])
-                if sent is None: 
-                    await asyncio.sleep(0.01)
-                    continue
-                total_sent += sent # MicroPython write returns bytes written or None
-            except OSError as e:
-                if e.args[0] == 11: # EAGAIN
-                    await asyncio.sleep(0.01)
-                else:
-                    raise e
-
-    async def recv_bytes(self, n):
-        # Non-blocking read loop
-        data = b""
-        while len(data) < n:
+        self.writer.write(data)
+        await self.reactor.stream_drain("websocket", self.writer)
+
+    async def recv_frame(self):
+        """
+        Read until a whole frame is buffered.
+
+        Returns:
+            (fin, opcode, payload memoryview), or None if the connection closed.
+
+        Raises:
+            OSError: The keepalive found the connection dead.
+        """
+        decoder = self.decoder
+        while True:
+            frame = decoder.next_frame()
+            if frame is not None:
+                return frame
             try:
-                chunk = self.sock.read(n - len(data))
-                if chunk is None or chunk == b"":
-                    if chunk == b"":
-                         return b"" # Closed
-                    await asyncio.sleep(0.01)
-                    continue
-                data += chunk
-            except OSError as e:
-                if e.args[0] == 11:
-                    await asyncio.sleep(0.01)
-                else:
-                    raise e
-        return data
+                n = await self.reactor.stream_read("websocket", self.reader, decoder.free())
+            except (OSError, AttributeError):
+                # Closed under us (reader gone or socket closed)
+                n = 0
+            if not n:
+                if self.error:
+                    raise OSError(self.error)
+                return None
+            decoder.filled(n)
 
-    async def send(self, data):
-        payload = data.encode('utf-8')
+    def _frame(self, opcode, payload):
+        """Encode one masked client frame."""
         length = len(payload)
-        header = b'\x81' 
-        
         if length < 126:
-            header += bytes([0x80 | length])
+            header = bytes((0x80 | opcode, 0x80 | length))
         elif length < 65536:
-            header += bytes([0x80 | 126]) + length.to_bytes(2, 'big')
+            header = bytes((0x80 | opcode, 0x80 | 126)) + length.to_bytes(2, 'big')
         else:
-            header += bytes([0x80 | 127]) + length.to_bytes(8, 'big')
+            header = bytes((0x80 | opcode, 0x80 | 127)) + length.to_bytes(8, 'big')
+        mask = urandom.getrandbits(32).to_bytes(4, 'big')
+        masked = bytearray(payload)
+        for i in range(length):
+            masked[i] ^= mask[i & 3]
+        return header + mask + masked
 
-        mask = bytes(urandom.getrandbits(8) for _ in range(4))
-        masked_payload = bytes(b ^ mask[i % 4] for i, b in enumerate(payload))
-        
-        await self._send(header + mask + masked_payload)
+    async def send(self, data):
+        await self._send(self._frame(OP_TEXT, data.encode('utf-8')))
+
+    async def ping(self):
+        """Send a ping; the matching pong sets rtt_ms."""
+        self._ping_sent_at = time.ticks_ms()
+        self._ping_token = (self._ping_sent_at & 0xFFFFFFFF).to_bytes(4, 'big')
+        self.pings_sent += 1
+        await self._send(self._frame(OP_PING, self._ping_token))
+
+    async def _keepalive(self):
+        try:
+            while self.writer is not None:
+                await asyncio.sleep_ms(WebSocketConfig.PING_INTERVAL_MS)
+                if self.writer is None:
+                    break
+                if self._ping_token is not None:
+                    self.missed_pongs += 1
+                    if self.missed_pongs >= WebSocketConfig.MAX_MISSED_PONGS:
+                        self.error = "No pong for {} pings".format(self.missed_pongs)
+                        print("WebSocket: {}, dropping connection".format(self.error))
+                        # Closes the socket, so a recv() waiting on it wakes and raises
+                        self.close()
+                        break
+                await self.ping()
+        except OSError:
+            pass  # The receive side reports it
+
+    def _on_pong(self, payload):
+        if self._ping_token is not None and bytes(payload) == self._ping_token:
+            self.rtt_ms = time.ticks_diff(time.ticks_ms(), self._ping_sent_at)
+            self._ping_token = None
+            self.missed_pongs = 0
+        self.pongs_received += 1
+
+    async def _on_close(self, payload):
+        """Echo the server's close (status code only) and shut down."""
+        if not self._close_sent and self.writer is not None:
+            self._close_sent = True
+            try:
+                await self._send(self._frame(OP_CLOSE, bytes(payload[:2])))
+            except OSError:
+                pass
+        self.close()
+
+    def _append_fragment(self, payload):
+        n = len(payload)
+        if self._message_len + n > WebSocketConfig.MAX_MESSAGE_SIZE:
+            self._message_opcode = None
+            raise OSError("WebSocket message over {} bytes".format(WebSocketConfig.MAX_MESSAGE_SIZE))
+        if self._message is None:
+            self._message = bytearray(WebSocketConfig.MAX_MESSAGE_SIZE)
+        self._message[self._message_len:self._message_len + n] = payload
+        self._message_len += n
+
+    async def recv_view(self):
+        """
+        Next data message as (opcode, payload memoryview), None once closed.
+        The view is only valid until the next receive call.
+
+        Raises:
+            OSError: Protocol error, oversized message, or a dead connection.
+        """
+        while True:
+            frame = await self.recv_frame()
+            if frame is None:
+                return None
+            fin, opcode, payload = frame
+
+            if opcode == OP_PING:
+                await self._send(self._frame(OP_PONG, payload))
+            elif opcode == OP_PONG:
+                self._on_pong(payload)
+            elif opcode == OP_CLOSE:
+                await self._on_close(payload)
+                return None
+            elif opcode == OP_CONTINUATION:
+                if self._message_opcode is None:
+                    raise OSError("WebSocket continuation without a message")
+                self._append_fragment(payload)
+                if fin:
+                    opcode = self._message_opcode
+                    self._message_opcode = None
+                    return opcode, memoryview(self._message)[:self._message_len]
+            elif self._message_opcode is not None:
+                raise OSError("WebSocket message interrupted by a new one")
+            elif fin:
+                return opcode, payload
+            else:
+                # First fragment
+                self._message_opcode = opcode
+                self._message_len = 0
+                self._append_fragment(payload)
 
     async def recv(self):
-        first_byte = await self.recv_bytes(1)
-        if not first_byte: return None
-        
-        opcode = first_byte[0] & 0x0F
-        if opcode == 8: # Close
-            self.close()
+        message = await self.recv_view()
+        if message is None:
             return None
-            
-        second_byte = await self.recv_bytes(1)
-        if not second_byte: return None
-        
-        length = second_byte[0] & 0x7F
-        
-        if length == 126:
-            lb = await self.recv_bytes(2)
-            length = int.from_bytes(lb, 'big')
-        elif length == 127:
-            lb = await self.recv_bytes(8)
-            length = int.from_bytes(lb, 'big')
-            
-        payload = await self.recv_bytes(length)
-        return payload.decode('utf-8')
+        return str(message[1], "utf-8")
 
     def close(self):
-        if self.sock:
-            self.sock.close()
-            self.sock = None
+        task = self._keepalive_task
+        if task is not None:
+            self._keepalive_task = None
+            if task is not asyncio.current_task():
+                task.cancel()
+        if self.writer:
+            close_stream(self.writer)
+            self.writer = None
+            self.reader = None
@@ -1,14 +1,134 @@
 import uasyncio as asyncio
+import gc
+import sys
 import time
+from array import array
+from collections import OrderedDict
 from presto import Presto
 from config import UIConfig
+from profiler import FrameProfiler, AllocProfiler
+from gestures import TouchSampler
+from reactor import get_reactor
+
+class PenRegistry:
+    """
+    Process-wide pen cache shared by the AppManager and all pages.
+    Pens are created once from UIConfig.COLOR_PALETTE, so drawing
+    never calls create_pen() again.
+    """
+    def __init__(self, display):
+        self.display = display
+        self._pens = {}
+        for name, rgb in UIConfig.COLOR_PALETTE.items():
+            self._pens[name] = display.create_pen(*rgb)
+
+    def __getitem__(self, name):
+        return self._pens[name]
+
+    def __contains__(self, name):
+        return name in self._pens
+
+    def get(self, name, default=None):
+        """Get a pen by name."""
+        return self._pens.get(name, default)
+
+    def register(self, name, rgb):
+        """
+        Add a named pen at runtime. An existing pen with the same name is
+        returned unchanged, so pages can call this from __init__ freely.
+
+        Args:
+            name: Pen name, e.g. "DIM_WHITE".
+            rgb: (r, g, b) tuple.
+
+        Returns:
+            The pen.
+        """
+        pen = self._pens.get(name)
+        if pen is None:
+            pen = self.display.create_pen(*rgb)
+            self._pens[name] = pen
+        return pen
+
+# Singleton instance
+_pens_instance = None
+
+def get_pens(display):
+    """Get the shared PenRegistry, creating it on first use."""
+    global _pens_instance
+    if _pens_instance is None:
+        _pens_instance = PenRegistry(display)
+    return _pens_instance
 
 def get_colors(display):
-    """Helper to create pens from config palette."""
-    pens = {}
-    for name, rgb in UIConfig.COLOR_PALETTE.items():
-        pens[name] = display.create_pen(*rgb)
-    return pens
+    """Helper returning the shared pen registry (name -> pen)."""
+    return get_pens(display)
+
+class TextMetrics:
+    """
+    Bounded LRU cache for PicoVector.measure_text() results.
+
+    Entries are keyed by (text, font, size), so laying out a string that
+    was already measured costs a dict lookup instead of a glyph walk.
+    """
+    def __init__(self, max_entries=UIConfig.TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def measure(self, vector, text, size, font=UIConfig.FONT_NAME):
+        """
+        Measure text at the given font size.
+
+        Args:
+            vector: PicoVector instance (only used on a cache miss)
+            text: Text string to measure
+            size: Font size
+            font: Font name the vector is currently using
+
+        Returns:
+            (x, y, w, h) as returned by measure_text()
+        """
+        key = (text, font, size)
+        cache = self._cache
+        result = cache.get(key)
+        if result is not None:
+            self.hits += 1
+            # Move to the most recently used end
+            del cache[key]
+            cache[key] = result
+            return result
+
+        self.misses += 1
+        vector.set_font_size(size)
+        result = vector.measure_text(text)
+        if len(cache) >= self.max_entries:
+            del cache[next(iter(cache))]
+        cache[key] = result
+        return result
+
+    def width(self, vector, text, size, font=UIConfig.FONT_NAME):
+        """Width of text in pixels, e.g. for right-aligned numbers."""
+        return self.measure(vector, text, size, font)[2]
+
+    def clear(self):
+        """Drop all entries (e.g. after changing fonts)."""
+        self._cache = OrderedDict()
+
+    def stats(self):
+        """Return (hits, misses, entries)."""
+        return (self.hits, self.misses, len(self._cache))
+
+# Singleton instance
+_text_metrics_instance = None
+
+def get_text_metrics():
+    """Get the shared TextMetrics cache."""
+    global _text_metrics_instance
+    if _text_metrics_instance is None:
+        _text_metrics_instance = TextMetrics()
+    return _text_metrics_instance
 
 def calc_centered_pos(vector, text, font_size, center_x, center_y):
     """
@@ -24,27 +144,277 @@ def calc_centered_pos(vector, text, font_size, center_x, center_y):
     Returns:
         (x, y): Top-left position for centered text
     """
+    _, _, w, h = get_text_metrics().measure(vector, text, font_size)
+    # Callers draw right after, so leave the requested size selected
     vector.set_font_size(font_size)
-    _, _, w, h = vector.measure_text(text)
     x = int(center_x - w // 2)
     y = int(center_y - h // 2)
     return (x, y)
 
+_UNSET = object()
+
+class FormatCache:
+    """
+    Formatted strings that are rebuilt only when their inputs change.
+
+    Each slot remembers the format and up to three values it was last
+    built from; while they compare equal, format() returns the very same
+    string object, so steady-state frames allocate no strings (and the
+    TextMetrics lookup for it stays a hit).
+
+        text = self.strings.format("temp", "{:.1f}c", self.temp)
+    """
+    def __init__(self):
+        self._slots = {}  # slot -> [fmt, a, b, c, text]
+
+    def format(self, slot, fmt, a, b=_UNSET, c=_UNSET):
+        entry = self._slots.get(slot)
+        if entry is not None and entry[0] is fmt and entry[1] == a and entry[2] == b and entry[3] == c:
+            return entry[4]
+        if b is _UNSET:
+            text = fmt.format(a)
+        elif c is _UNSET:
+            text = fmt.format(a, b)
+        else:
+            text = fmt.format(a, b, c)
+        if entry is None:
+            self._slots[slot] = [fmt, a, b, c, text]
+        else:
+            entry[0] = fmt
+            entry[1] = a
+            entry[2] = b
+            entry[3] = c
+            entry[4] = text
+        return text
+
+    def clear(self):
+        self._slots = {}
+
+def union_rect(a, b):
+    """
+    Return the smallest rectangle covering both a and b.
+
+    Rectangles are (x, y, w, h) tuples; None stands for "no area".
+    """
+    if a is None:
+        return b
+    if b is None:
+        return a
+    x = min(a[0], b[0])
+    y = min(a[1], b[1])
+    x2 = max(a[0] + a[2], b[0] + b[2])
+    y2 = max(a[1] + a[3], b[1] + b[3])
+    return (x, y, x2 - x, y2 - y)
+
+def clip_rect(rect, width, height):
+    """Clip rect to the screen bounds. Returns None if nothing is left."""
+    x = max(0, rect[0])
+    y = max(0, rect[1])
+    x2 = min(width, rect[0] + rect[2])
+    y2 = min(height, rect[1] + rect[3])
+    if x2 <= x or y2 <= y:
+        return None
+    return (x, y, x2 - x, y2 - y)
+
+try:
+    import micropython
+except ImportError:
+    micropython = None  # CPython host backend (tools/host)
+
+if micropython:
+    @micropython.viper
+    def _copy_rows(dst, src, geom):
+        """
+        Copy rows of bytes from src to dst without allocating.
+        geom is an array('i'): dst offset, dst stride, src offset,
+        src stride, bytes per row, rows.
+        """
+        g = ptr32(geom)
+        dp = g[0]
+        ds = g[1]
+        sp = g[2]
+        ss = g[3]
+        n = g[4]
+        rows = g[5]
+        align = dp | ds | sp | ss | n
+        if (align & 3) == 0:
+            d32 = ptr32(dst)
+            s32 = ptr32(src)
+            dp >>= 2
+            ds >>= 2
+            sp >>= 2
+            ss >>= 2
+            n >>= 2
+            while rows > 0:
+                i = 0
+                while i < n:
+                    d32[dp + i] = s32[sp + i]
+                    i += 1
+                dp += ds
+                sp += ss
+                rows -= 1
+        elif (align & 1) == 0:
+            d16 = ptr16(dst)
+            s16 = ptr16(src)
+            dp >>= 1
+            ds >>= 1
+            sp >>= 1
+            ss >>= 1
+            n >>= 1
+            while rows > 0:
+                i = 0
+                while i < n:
+                    d16[dp + i] = s16[sp + i]
+                    i += 1
+                dp += ds
+                sp += ss
+                rows -= 1
+        else:
+            d8 = ptr8(dst)
+            s8 = ptr8(src)
+            while rows > 0:
+                i = 0
+                while i < n:
+                    d8[dp + i] = s8[sp + i]
+                    i += 1
+                dp += ds
+                sp += ss
+                rows -= 1
+else:
+    def _copy_rows(dst, src, geom):
+        """Copy rows of bytes from src to dst (memoryviews), see above."""
+        dp, ds, sp, ss, n, rows = geom
+        for _ in range(rows):
+            dst[dp:dp + n] = src[sp:sp + n]
+            dp += ds
+            sp += ss
+
+class Layer:
+    """
+    Offscreen copy of a rectangular screen region.
+
+    The region is captured from the display framebuffer (exposed by
+    PicoGraphics through the buffer protocol) and can be blitted back at
+    any position, clipped to the screen, without redrawing its content.
+    Rows are copied by a viper loop, so capture() and blit() allocate
+    nothing. Raises ValueError if the pixel format is not byte aligned.
+    """
+    def __init__(self, display, width, height):
+        self.fb = memoryview(display)
+        self.screen_w, self.screen_h = display.get_bounds()
+        self.bpp = len(self.fb) // (self.screen_w * self.screen_h)
+        if self.bpp < 1 or len(self.fb) != self.screen_w * self.screen_h * self.bpp:
+            raise ValueError("Unsupported framebuffer format")
+
+        self.width = width
+        self.height = height
+        self.stride = self.screen_w * self.bpp
+        self.row_bytes = width * self.bpp
+        self.buf = bytearray(self.row_bytes * height)
+        self._mv = memoryview(self.buf)
+        self._geom = array("i", [0] * 6)  # Arguments of _copy_rows()
+
+    def _copy(self, dst, dst_pos, dst_stride, src, src_pos, src_stride, n, rows):
+        g = self._geom
+        g[0] = dst_pos
+        g[1] = dst_stride
+        g[2] = src_pos
+        g[3] = src_stride
+        g[4] = n
+        g[5] = rows
+        _copy_rows(dst, src, g)
+
+    def capture(self, x=0, y=0):
+        """Copy the screen region at (x, y) into the layer."""
+        self._copy(self._mv, 0, self.row_bytes,
+                   self.fb, y * self.stride + x * self.bpp, self.stride,
+                   self.row_bytes, self.height)
+
+    def blit(self, x, y=0):
+        """Copy the layer onto the screen with its top-left at (x, y)."""
+        src_x = max(0, -x)
+        dst_x = max(0, x)
+        cols = min(self.width - src_x, self.screen_w - dst_x)
+        if cols <= 0:
+            return
+        n = cols * self.bpp
+        first = max(0, -y)
+        last = min(self.height, self.screen_h - y)
+        if last <= first:
+            return
+        self._copy(self.fb, (y + first) * self.stride + dst_x * self.bpp, self.stride,
+                   self._mv, first * self.row_bytes + src_x * self.bpp, self.row_bytes,
+                   n, last - first)
+
 class Page:
     """
     Abstract base class for all pages.
+
+    Pages that set TRACKS_DAMAGE = True must call invalidate() whenever
+    something they draw changes; the AppManager then only redraws and
+    flushes the invalidated area. Other pages are redrawn every frame.
+
+    Frame cadence is declared with:
+        REFRESH_MS: Periodic wake-up interval, None = only on demand
+                    (touch, invalidate()). The default keeps the old 10 ms loop.
+        ALIGN_TO_SECOND: Wake right after each wall-clock second boundary.
+        MAX_FPS: Upper bound on frames per second, 0 = no cap.
+        ALLOC_BUDGET: Bytes one frame (update + draw) may allocate before
+                      the allocation profiler warns, None = UIConfig.ALLOC_BUDGET_BYTES.
+        STORE_KEYS: Data store keys the page shows; publishing one wakes
+                    the render loop while the page is on screen.
+
+    Pages that animate while sliding set SNAPSHOT = False to be redrawn
+    live on every transition frame instead of being composed from a
+    snapshot taken when the slide starts.
     """
+    SNAPSHOT = True
+    TRACKS_DAMAGE = False
+    REFRESH_MS = 10
+    ALIGN_TO_SECOND = False
+    MAX_FPS = 0
+    ALLOC_BUDGET = None
+    STORE_KEYS = ()
+
     def __init__(self, name, app_manager):
         self.name = name
         self.app = app_manager
+        self._damage = None  # Pending (x, y, w, h) to redraw, or None
+        self.strings = FormatCache()  # Formatted text for draw()
+
+    def invalidate(self, rect=None):
+        """
+        Mark part of the page as needing a redraw.
+
+        Args:
+            rect: (x, y, w, h) in page coordinates, or None for the whole page.
+        """
+        if rect is None:
+            width, height = self.app.display.get_bounds()
+            rect = (0, 0, width, height)
+        self._damage = union_rect(self._damage, rect)
+        self.app.request_frame()
+
+    def take_damage(self):
+        """Return the pending damage rectangle (or None) and reset it."""
+        damage = self._damage
+        self._damage = None
+        return damage
 
     def enter(self):
-        """Called when the page becomes active."""
+        """
+        Called when the page becomes active.
+        May be a coroutine; the AppManager then runs it as a task.
+        """
         print(f"Entering page: {self.name}")
 
     def on_tap(self):
         """Called when the screen is tapped."""
         pass
+
+    def on_swipe_vertical(self, step):
+        """Called on a vertical swipe: step is 1 for up, -1 for down."""
+        pass
         
     def exit(self):
         """Called when the page is left."""
@@ -54,6 +424,25 @@ class Page:
         """Called periodically to update page logic."""
         pass
 
+    def release(self):
+        """
+        Called before the AppManager drops a far away page to free memory.
+        Undo anything that would keep the page alive (subscriptions, tasks).
+        """
+        pass
+
+    async def prefetch(self):
+        """
+        Called in the background while the page is adjacent to the current
+        one, so its data is fresh when a swipe lands on it. Should return
+        quickly when nothing is stale.
+        """
+        pass
+
+    def frame_interval(self):
+        """Return ms until this page wants its next frame (None = on demand)."""
+        return self.REFRESH_MS
+
     def draw(self, display, vector, offset_x=0):
         """Called to render the page."""
         pass
@@ -64,6 +453,88 @@ UI_STATE_SLIDE_LEFT = 1  # Next page comes from Right
 UI_STATE_SLIDE_RIGHT = 2 # Next page comes from Left
 UI_STATE_FADE_OUT = 3 # Kept if needed, but unused now
 UI_STATE_FADE_IN = 4
+UI_STATE_DRAG = 5   # Pages follow the finger
+UI_STATE_SETTLE = 6 # Sliding back to the current page after a cancelled drag
+
+# Gesture states
+GESTURE_NONE = 0
+GESTURE_PENDING = 1  # Pressed, not yet a drag (may become a tap)
+GESTURE_DRAG = 2
+GESTURE_VERTICAL = 3
+
+class FrameScheduler:
+    """
+    Wakes the render loop only when a frame is needed.
+
+    A frame is due when request() is called (touch, data, invalidation)
+    or when the timeout chosen by the AppManager for the current page
+    expires. Counts loop wake-ups so the savings can be verified.
+    """
+    def __init__(self):
+        self._event = asyncio.Event()
+        self.last_frame = time.ticks_ms()
+
+        # Wake-up statistics
+        self.wakeups = 0
+        self.wakeups_per_second = 0
+        self._window_start = self.last_frame
+        self._window_count = 0
+
+        # Wall-clock second tracking for aligned pages
+        self._last_second = time.time()
+        self._second_edge = self.last_frame
+
+    def request(self):
+        """Ask for a frame as soon as possible."""
+        self._event.set()
+
+    def ms_to_next_second(self):
+        """Estimate ms until time.time() ticks over to the next second."""
+        now = time.ticks_ms()
+        now_s = time.time()
+        if now_s != self._last_second:
+            self._last_second = now_s
+            self._second_edge = now
+        delay = 1000 - time.ticks_diff(now, self._second_edge)
+        if delay <= 0:
+            # Boundary is late (clock drift, first second) - check again soon
+            delay = UIConfig.SECOND_ALIGN_POLL_MS
+        return delay
+
+    async def wait(self, timeout_ms, min_interval_ms=0):
+        """
+        Sleep until a frame is requested or timeout_ms passes.
+
+        Args:
+            timeout_ms: Max time to sleep, None to sleep until request().
+            min_interval_ms: Minimum time between two frames (fps cap).
+        """
+        if not self._event.is_set():
+            if timeout_ms is None:
+                await self._event.wait()
+            else:
+                try:
+                    await asyncio.wait_for_ms(self._event.wait(), timeout_ms)
+                except asyncio.TimeoutError:
+                    pass
+
+        if min_interval_ms:
+            early = min_interval_ms - time.ticks_diff(time.ticks_ms(), self.last_frame)
+            if early > 0:
+                await asyncio.sleep_ms(early)
+
+        self._event.clear()
+        self.last_frame = time.ticks_ms()
+        self._count_wakeup(self.last_frame)
+
+    def _count_wakeup(self, now):
+        self.wakeups += 1
+        self._window_count += 1
+        elapsed = time.ticks_diff(now, self._window_start)
+        if elapsed >= 1000:
+            self.wakeups_per_second = (self._window_count * 1000) // elapsed
+            self._window_count = 0
+            self._window_start = now
 
 class AppManager:
     """
@@ -74,26 +545,191 @@ class AppManager:
         self.display = presto.display
         self.touch = presto.touch
         self.wm = wifi_manager
+        self.pens = get_pens(self.display)
+        self.width, self.height = self.display.get_bounds()
         
+        # Page slots: an instance, or None until a registered page is loaded
         self.pages = []
+        self._page_specs = []  # (module, class name), None for add_page()
         self.current_page_index = 0
         self.running = True
         
-        # Touch handling
+        # Touch handling: sampled by a separate task, consumed per frame
+        self.sampler = TouchSampler(self.touch)
+        self._input_read = 0
+        self.gesture = GESTURE_NONE
         self.touch_start_x = 0
-        self.last_touch_x = 0
+        self.touch_start_y = 0
         self.touch_start_time = 0
-        self.min_swipe_dist = 40
-        self.max_swipe_time = 500
+        self.last_touch_x = 0
+        self.last_touch_y = 0
+        self.tap_x = 0
+        self.tap_y = 0
+        self.min_swipe_dist = 40 # Max movement of a tap
+        self.max_swipe_time = 500 # Max duration of a tap
+        self._drag_origin = 0
         
-        # Transitions
+        # Transitions: slide_x is the current page's x position, the
+        # revealed neighbour sits one screen width to its right (side -1)
+        # or left (side 1). Animations move slide_x towards slide_target.
         self.ui_state = UI_STATE_NORMAL
         self.next_page_index = -1
-        self.slide_pixel_offset = 0
+        self.slide_x = 0
+        self.slide_target = 0
+        self._reveal_side = -1
         self.slide_speed = 40 # Pixels per frame
 
+        # Damage tracking: only redraw/flush what pages invalidate
+        self.damage_tracking = True
+
+        # Frame scheduling
+        self.scheduler = FrameScheduler()
+
+        # Snapshot transitions: layers are allocated on first use and reused
+        self.snapshot_transitions = UIConfig.SNAPSHOT_TRANSITIONS
+        self._layer_pool = []
+        self._slide_layers = None  # [current, next] layer or None per page
+
+        # Boot sequence (boot_sequence.BootSequence) driving the startup page, if any
+        self.boot = None
+
+        # Neighbour prefetch: page index -> running prefetch task
+        self._prefetch_tasks = {}
+        self._last_input_time = 0
+
+        # Per-phase frame timing and its on-screen overlay
+        self.profiler = FrameProfiler()
+        self.alloc_profiler = AllocProfiler()
+        self.show_overlay = False
+        self._overlay_time = 0
+
+    def request_frame(self):
+        """Wake the render loop for a new frame (e.g. new data arrived)."""
+        self.scheduler.request()
+
+    def on_store_publish(self, key):
+        """Wake the render loop if a page on screen shows store key `key`."""
+        for index in (self.current_page_index, self.next_page_index):
+            if index < 0:
+                continue
+            page = self.pages[index]
+            if page is not None and key in page.STORE_KEYS:
+                self.request_frame()
+                return
+
+    def next_frame_delay(self, page):
+        """Return ms until the next frame is due, or None to wait for a request."""
+        if self.ui_state == UI_STATE_DRAG:
+            # Frames follow touch samples
+            return None
+        if self.ui_state != UI_STATE_NORMAL:
+            return UIConfig.TRANSITION_FRAME_MS
+
+        delay = page.frame_interval()
+        if page.ALIGN_TO_SECOND:
+            to_second = self.scheduler.ms_to_next_second()
+            if delay is None or to_second < delay:
+                delay = to_second
+        return delay
+
     def add_page(self, page):
+        """Add an already constructed page. It is never released."""
         self.pages.append(page)
+        self._page_specs.append(None)
+
+    def register_page(self, module, class_name):
+        """Add a page that is imported and constructed on first use."""
+        self.pages.append(None)
+        self._page_specs.append((module, class_name))
+
+    def get_page(self, index):
+        """Return page `index`, loading it if needed."""
+        page = self.pages[index]
+        if page is None:
+            module, class_name = self._page_specs[index]
+            start = time.ticks_ms()
+            cls = getattr(__import__(module), class_name)
+            page = cls(self)
+            self.pages[index] = page
+            print(f"Loaded page {class_name} in {time.ticks_diff(time.ticks_ms(), start)}ms")
+        return page
+
+    def page_distance(self, a, b):
+        """Swipes needed to get from page a to page b."""
+        if a == 0 or b == 0:
+            # The startup page sits outside the content page ring
+            return abs(a - b)
+        d = abs(a - b)
+        return min(d, len(self.pages) - 1 - d)
+
+    def release_far_pages(self, force=False):
+        """
+        Release loaded pages more than PAGE_KEEP_DISTANCE swipes from the
+        current one when free heap is low (or force is set).
+        Returns the number of pages released.
+        """
+        if not force and gc.mem_free() >= UIConfig.PAGE_UNLOAD_FREE_BYTES:
+            return 0
+        released = 0
+        for index, page in enumerate(self.pages):
+            spec = self._page_specs[index]
+            if page is None or spec is None:
+                continue
+            if index == self.current_page_index or index == self.next_page_index:
+                continue
+            if self.page_distance(index, self.current_page_index) <= UIConfig.PAGE_KEEP_DISTANCE:
+                continue
+            task = self._prefetch_tasks.pop(index, None)
+            if task is not None and not task.done():
+                task.cancel()
+            page.release()
+            self.pages[index] = None
+            # Drop the module too, so its code can be collected
+            sys.modules.pop(spec[0], None)
+            released += 1
+        if released:
+            gc.collect()
+            print(f"Released {released} page(s), free {gc.mem_free()}")
+        return released
+
+    def _run_hook(self, result):
+        """Run the result of a lifecycle hook as a task if it is a coroutine."""
+        if result is not None and hasattr(result, "send"):
+            return asyncio.create_task(result)
+        return None
+
+    def enter_page(self, page):
+        """Call page.enter(), sync or async."""
+        self._run_hook(page.enter())
+
+    def exit_page(self, page):
+        """Call page.exit(), sync or async."""
+        self._run_hook(page.exit())
+
+    def prefetch_page(self, index):
+        """
+        Start page.prefetch() for page `index` in the background.
+        Requests for a page whose prefetch is still running are coalesced.
+        """
+        task = self._prefetch_tasks.get(index)
+        if task is not None and not task.done():
+            return False
+        self._prefetch_tasks[index] = asyncio.create_task(self.get_page(index).prefetch())
+        return True
+
+    async def prefetch_loop(self):
+        """Prefetch the pages adjacent to the current one while the UI is idle."""
+        while self.running:
+            await asyncio.sleep_ms(UIConfig.PREFETCH_INTERVAL_MS)
+            if self.ui_state != UI_STATE_NORMAL or self.gesture != GESTURE_NONE:
+                continue
+            if time.ticks_diff(time.ticks_ms(), self._last_input_time) < UIConfig.PREFETCH_IDLE_MS:
+                continue
+            # Startup page (index 0) has no swipes and only ever leads to page 1
+            for step in ((1,) if self.current_page_index == 0 else (1, -1)):
+                index = self.neighbour_index(step)
+                if index != self.current_page_index:
+                    self.prefetch_page(index)
 
     def switch_page(self, index):
         if 0 <= index < len(self.pages):
@@ -105,79 +741,158 @@ class AppManager:
             if self.ui_state != UI_STATE_NORMAL and index == self.next_page_index:
                 return
                 
-            # Determine Direction
+            # Determine Direction: higher indices come in from the right
+            side = -1 if index > self.current_page_index else 1
+            self.reveal_page(index, side)
+            self.slide_to(side * self.width)
+
+    def reveal_page(self, index, side):
+        """
+        Make page `index` the neighbour shown next to the current page.
+
+        Args:
+            index: Page index to reveal.
+            side: -1 if it sits right of the current page, 1 if left.
+        """
+        if index != self.next_page_index:
+            if self.next_page_index >= 0 and self.next_page_index != self.current_page_index:
+                self.exit_page(self.get_page(self.next_page_index))
             self.next_page_index = index
-            if index > self.current_page_index:
-                self.ui_state = UI_STATE_SLIDE_LEFT
-            else:
-                self.ui_state = UI_STATE_SLIDE_RIGHT
-                
-            self.slide_pixel_offset = 0
-            
-            # Reset touch state to prevent ghost swipes
-            self.touch_start_time = 0
-            
-            # Pre-enter the next page so it can fetch data if needed
-            self.pages[self.next_page_index].enter()
+            # Enter now so the page can fetch data while sliding in
+            self.enter_page(self.get_page(index))
+        self._reveal_side = side
+        self._slide_layers = None
+
+    def slide_to(self, target):
+        """Animate the current page to x = target (0, -width or +width)."""
+        self.slide_target = target
+        if target < 0:
+            self.ui_state = UI_STATE_SLIDE_LEFT
+        elif target > 0:
+            self.ui_state = UI_STATE_SLIDE_RIGHT
+        else:
+            self.ui_state = UI_STATE_SETTLE
+
+    def set_slide_x(self, x):
+        """Move the current page, revealing the neighbour on the uncovered side."""
+        width = self.width
+        x = max(-width, min(width, x))
+        if x != 0:
+            side = -1 if x < 0 else 1
+            if side != self._reveal_side or self.next_page_index < 0:
+                index = self.neighbour_index(-side)
+                if index == self.current_page_index:
+                    # No other page to reveal
+                    x = 0
+                else:
+                    self.reveal_page(index, side)
+        self.slide_x = x
 
     def handle_input(self):
-        # Ignore input during transitions
-        if self.ui_state != UI_STATE_NORMAL:
+        """Run the gesture recognizer over touch samples recorded since the last frame."""
+        sampler = self.sampler
+        size = sampler.size
+        i = max(self._input_read, sampler.oldest())
+        while i < sampler.count:
+            slot = i % size
+            self.on_touch_sample(sampler.t[slot], sampler.x[slot], sampler.y[slot], sampler.down[slot])
+            i += 1
+        self._input_read = i
+
+    def on_touch_sample(self, t, x, y, down):
+        """Advance the gesture recognizer by one touch sample."""
+        self._last_input_time = t
+        if down and self.gesture == GESTURE_NONE:
+            # Touch start
+            self.touch_start_time = t
+            self.touch_start_x = x
+            self.touch_start_y = y
+            self.last_touch_x = x
+            self.last_touch_y = y
+            if self.ui_state != UI_STATE_NORMAL and self.next_page_index >= 0:
+                # Catch the running slide; the finger now drives it
+                self.gesture = GESTURE_DRAG
+                self._drag_origin = self.slide_x - x
+                self.ui_state = UI_STATE_DRAG
+            else:
+                self.gesture = GESTURE_PENDING
             return
 
-        self.touch.poll()
-        
-        # Disable swiping on Startup Page (index 0)
-        if self.current_page_index == 0:
+        if down:
+            self.last_touch_x = x
+            self.last_touch_y = y
+            if self.gesture == GESTURE_PENDING:
+                dx = x - self.touch_start_x
+                dy = y - self.touch_start_y
+                if abs(dx) > UIConfig.DRAG_START_PX and abs(dx) >= abs(dy):
+                    # Disable swiping on Startup Page (index 0)
+                    if self.current_page_index != 0 and self.ui_state == UI_STATE_NORMAL:
+                        self.gesture = GESTURE_DRAG
+                        self._drag_origin = -self.touch_start_x
+                        self.ui_state = UI_STATE_DRAG
+                elif abs(dy) > UIConfig.DRAG_START_PX:
+                    self.gesture = GESTURE_VERTICAL
+            if self.gesture == GESTURE_DRAG:
+                self.set_slide_x(x + self._drag_origin)
             return
 
-        if self.touch.state:
-            # Touch start
-            if self.touch_start_time == 0:
-                self.touch_start_time = time.ticks_ms()
-                self.touch_start_x = self.touch.x
-            
-            # Continuously update last known X to avoid 0-read issues on release
-            self.last_touch_x = self.touch.x
+        if self.gesture == GESTURE_NONE:
+            return
+
+        # Touch end
+        touch_duration = time.ticks_diff(t, self.touch_start_time)
+        touch_dist = self.last_touch_x - self.touch_start_x
+        gesture = self.gesture
+        self.gesture = GESTURE_NONE
+
+        if gesture == GESTURE_DRAG:
+            self.release_drag()
+        elif gesture == GESTURE_PENDING and self.ui_state == UI_STATE_NORMAL:
+            # Long press without movement toggles the timing overlay
+            if touch_duration >= UIConfig.OVERLAY_LONG_PRESS_MS and abs(touch_dist) <= self.min_swipe_dist:
+                self.toggle_overlay()
+            elif touch_duration < self.max_swipe_time and self.current_page_index != 0:
+                # Tap detected (short duration, small movement)
+                print("AppManager: Tap Detected!")
+                self.tap_x = x
+                self.tap_y = y
+                self.get_page(self.current_page_index).on_tap()
+        elif gesture == GESTURE_VERTICAL and self.ui_state == UI_STATE_NORMAL and self.current_page_index != 0:
+            # Swipe up goes to the next sub-view
+            step = 1 if self.last_touch_y < self.touch_start_y else -1
+            self.get_page(self.current_page_index).on_swipe_vertical(step)
+
+    def release_drag(self):
+        """Finger lifted while dragging: commit, fling or settle back."""
+        width = self.width
+        velocity = self.sampler.velocity(UIConfig.FLING_WINDOW_MS)
+        if abs(velocity) >= UIConfig.FLING_VELOCITY:
+            direction = -1 if velocity < 0 else 1
+            if self.slide_x * direction >= 0:
+                target = direction * width
+            else:
+                # Flung back towards the current page: reverse the slide
+                target = 0
+        elif abs(self.slide_x) >= width * UIConfig.SWIPE_COMMIT_FRACTION:
+            target = -width if self.slide_x < 0 else width
         else:
-            # Touch end
-            if self.touch_start_time != 0:
-                touch_duration = time.ticks_diff(time.ticks_ms(), self.touch_start_time)
-                
-                # Use last_touch_x for distance calculation
-                touch_dist = self.last_touch_x - self.touch_start_x
-                
-                print(f"Touch Input: Duration={touch_duration}ms, Dist={touch_dist}, StartX={self.touch_start_x}, EndX={self.last_touch_x}")
-                
-                # Check for swipe
-                if touch_duration < self.max_swipe_time:
-                    if abs(touch_dist) > self.min_swipe_dist:
-                        if touch_dist < 0:
-                            # Swipe Left -> Next Page
-                            self.next_page()
-                        else:
-                            # Swipe Right -> Previous Page
-                            self.prev_page()
-                    else:
-                        # Tap detected (short duration, small movement)
-                         print("AppManager: Tap Detected!")
-                         current_page = self.pages[self.current_page_index]
-                         current_page.on_tap()
-                
-                self.touch_start_time = 0
+            target = 0
+        print(f"Touch Input: Release at x={self.slide_x}, Velocity={velocity}px/s, Target={target}")
+        self.slide_to(target)
+
+    def neighbour_index(self, step):
+        """Index of the page `step` positions away, skipping the Setup page (index 0)."""
+        content_pages = len(self.pages) - 1
+        if content_pages < 1:
+            return self.current_page_index
+        return ((self.current_page_index - 1 + step) % content_pages) + 1
 
     def next_page(self):
         # Don't loop back to Setup page (index 0)
-        new_index = (self.current_page_index + 1)
-        if new_index >= len(self.pages):
-             new_index = 1
-        self.switch_page(new_index)
+        self.switch_page(self.neighbour_index(1))
 
     def prev_page(self):
-        new_index = (self.current_page_index - 1)
-        if new_index < 1:
-             new_index = len(self.pages) - 1
-        self.switch_page(new_index)
+        self.switch_page(self.neighbour_index(-1))
         
     def draw_indicators(self, width, height, offset_x=0):
         # Determine which page index to highlight based on transitions using some logic?
@@ -212,80 +927,246 @@ class AppManager:
         for i in range(total_content_pages):
             cx = start_x + (i * spacing)
             if i == current_content_index:
-                self.display.set_pen(self.display.create_pen(255, 255, 255))
+                self.display.set_pen(self.pens["WHITE"])
                 self.display.circle(cx, y, dot_radius)
             else:
-                self.display.set_pen(self.display.create_pen(100, 100, 100))
+                self.display.set_pen(self.pens["DOT_INACTIVE"])
                 self.display.circle(cx, y, dot_radius)
 
+    def toggle_overlay(self):
+        """Show or hide the frame timing overlay."""
+        self.show_overlay = not self.show_overlay
+        print(f"AppManager: Timing overlay {'on' if self.show_overlay else 'off'}")
+        if not self.show_overlay:
+            self.profiler.print_report()
+            if self.alloc_profiler.enabled:
+                self.alloc_profiler.print_report()
+            get_reactor().print_stats()
+        self.get_page(self.current_page_index).invalidate()
+
+    def overlay_rect(self):
+        """Screen area used by the timing overlay."""
+        return (0, 0, self.width, 10 * len(self.profiler.stats) + 14)
+
+    def draw_overlay(self):
+        """Draw per-phase p50/p95/max frame timings (microseconds)."""
+        x, y, w, h = self.overlay_rect()
+        self.display.set_pen(self.pens["BLACK"])
+        self.display.rectangle(x, y, w, h)
+        self.display.set_pen(self.pens["GREEN"])
+        self.display.text("phase        p50    p95    max", 2, 2, w, 1)
+        line_y = 12
+        for line in self.profiler.summary_lines():
+            self.display.text(line, 2, line_y, w, 1)
+            line_y += 10
+
+    def finish_transition(self, vector, width, height):
+        """Complete a slide: make the next page current and draw it in place."""
+        self.exit_page(self.get_page(self.current_page_index))
+        self.current_page_index = self.next_page_index
+        self.end_slide(vector, width, height)
+        self.release_far_pages()
+
+    def cancel_transition(self, vector, width, height):
+        """The slide returned to the current page: leave the revealed one."""
+        if self.next_page_index >= 0 and self.next_page_index != self.current_page_index:
+            self.exit_page(self.get_page(self.next_page_index))
+        self.end_slide(vector, width, height)
+
+    def end_slide(self, vector, width, height):
+        self.ui_state = UI_STATE_NORMAL
+        self.next_page_index = -1
+        self.slide_x = 0
+        self.slide_target = 0
+        self._slide_layers = None
+
+        # Draw final state; the whole screen was cleared this frame
+        page = self.get_page(self.current_page_index)
+        page.take_damage()
+        page.draw(self.display, vector, 0)
+        self.draw_indicators(width, height)
+
+    def draw_normal(self, page, vector, width, height):
+        """
+        Draw a page at rest.
+
+        With damage tracking, only the union of the rectangles the page
+        invalidated is cleared, redrawn (clipped) and flushed. Nothing is
+        drawn or flushed while the page reports no damage.
+        """
+        if self.damage_tracking and page.TRACKS_DAMAGE:
+            damage = page.take_damage()
+            if self.show_overlay and time.ticks_diff(time.ticks_ms(), self._overlay_time) >= UIConfig.OVERLAY_REFRESH_MS:
+                damage = union_rect(damage, self.overlay_rect())
+            if damage is None:
+                return
+            damage = clip_rect(damage, width, height)
+            if damage is None:
+                return
+        else:
+            damage = (0, 0, width, height)
+
+        x, y, w, h = damage
+        full = (w == width and h == height)
+
+        if not full:
+            self.display.set_clip(x, y, w, h)
+        self.display.set_pen(self.pens["BLACK"])
+        self.display.clear()
+        self.alloc_profiler.begin()
+        page.draw(self.display, vector, 0)
+        self.alloc_profiler.lap(page, "draw")
+        self.profiler.lap("draw")
+        self.draw_indicators(width, height)
+        if self.show_overlay:
+            self.draw_overlay()
+            self._overlay_time = time.ticks_ms()
+        self.profiler.lap("indicators")
+
+        if full:
+            self.presto.update()
+        else:
+            self.display.remove_clip()
+            self.presto.partial_update(x, y, w, h)
+        self.profiler.lap("flush")
+
+    def prepare_snapshots(self, pages, vector):
+        """
+        Render each page that allows it once and capture it into a layer.
+
+        Returns a list with a Layer, or None for pages drawn live.
+        """
+        layers = []
+        for page in pages:
+            if not (self.snapshot_transitions and page.SNAPSHOT):
+                layers.append(None)
+                continue
+            try:
+                if len(self._layer_pool) <= len(layers):
+                    width, height = self.display.get_bounds()
+                    self._layer_pool.append(Layer(self.display, width, height))
+                layer = self._layer_pool[len(layers)]
+            except (TypeError, ValueError, MemoryError) as e:
+                print(f"AppManager: Snapshot transitions disabled ({e})")
+                self.snapshot_transitions = False
+                self._layer_pool = []
+                return [None] * len(pages)
+
+            self.display.set_pen(self.pens["BLACK"])
+            self.display.clear()
+            page.draw(self.display, vector, 0)
+            layer.capture()
+            layers.append(layer)
+        return layers
+
+    def draw_transition(self, current_page, vector, width, height):
+        """Advance the running slide (or follow the drag) and compose both pages."""
+        if self.ui_state != UI_STATE_DRAG:
+            target = self.slide_target
+            if self.slide_x < target:
+                self.set_slide_x(min(target, self.slide_x + self.slide_speed))
+            else:
+                self.set_slide_x(max(target, self.slide_x - self.slide_speed))
+
+            if self.slide_x == target:
+                self.display.set_pen(self.pens["BLACK"])
+                self.display.clear()
+                if target == 0:
+                    self.cancel_transition(vector, width, height)
+                else:
+                    self.finish_transition(vector, width, height)
+                self.presto.update()
+                return
+
+        self.display.set_pen(self.pens["BLACK"])
+        self.display.clear()
+        if self.next_page_index < 0:
+            # Dragged, but nothing revealed yet
+            current_page.draw(self.display, vector, self.slide_x)
+            self.draw_indicators(width, height)
+            self.presto.update()
+            return
+
+        next_page = self.get_page(self.next_page_index)
+        if self._slide_layers is None:
+            self._slide_layers = self.prepare_snapshots((current_page, next_page), vector)
+            self.display.set_pen(self.pens["BLACK"])
+            self.display.clear()
+
+        # Current at slide_x, the neighbour one screen width beside it
+        current_x = self.slide_x
+        next_x = self.slide_x - self._reveal_side * width
+
+        # Live pages first: snapshots cover anything they draw past their edge
+        current_layer, next_layer = self._slide_layers
+        if current_layer is None:
+            current_page.draw(self.display, vector, current_x)
+        if next_layer is None:
+            next_page.draw(self.display, vector, next_x)
+        if current_layer is not None:
+            current_layer.blit(current_x)
+        if next_layer is not None:
+            next_layer.blit(next_x)
+        self.profiler.lap("draw")
+
+        # Indicators (Static)
+        self.draw_indicators(width, height)
+        if self.show_overlay:
+            self.draw_overlay()
+        self.profiler.lap("indicators")
+        self.presto.update()
+        self.profiler.lap("flush")
+
+    def start(self):
+        """Enter the first page. Called by run() before the render loop."""
+        self.enter_page(self.get_page(0))
+        self.get_page(0).invalidate()
+
+    async def step(self, vector):
+        """Render one frame: input, page update, then drawing."""
+        width, height = self.width, self.height
+
+        # 1. Update Logic
+        current_page = self.get_page(self.current_page_index)
+
+        # Input is handled in every state, so a drag can catch a running slide
+        self.handle_input()
+        self.profiler.lap("input")
+
+        # Only update pages if not in a slide transition
+        at_rest = self.ui_state == UI_STATE_NORMAL
+        if at_rest:
+            self.alloc_profiler.begin()
+            await current_page.update()
+            self.alloc_profiler.lap(current_page, "update")
+            self.profiler.lap("update")
+
+        # 2. Transition Logic & Drawing
+        if self.ui_state == UI_STATE_NORMAL:
+            self.draw_normal(current_page, vector, width, height)
+        else:
+            self.draw_transition(current_page, vector, width, height)
+        if at_rest:
+            self.alloc_profiler.end_frame(current_page)
+
     async def run(self, vector):
         if not self.pages:
             print("No pages added!")
             return
 
         print("AppManager Started")
-        self.pages[0].enter()
-        
-        width, height = self.display.get_bounds()
+        self.start()
+        asyncio.create_task(self.sampler.run(self.scheduler.request))
+        asyncio.create_task(self.prefetch_loop())
 
         while self.running:
-            # 1. Update Logic
-            current_page = self.pages[self.current_page_index]
-            
-            # Only process input and page updates if not in a slide transition
-            if self.ui_state == UI_STATE_NORMAL: 
-                 self.handle_input()
-                 await current_page.update()
-
-            # 2. Transition Logic & Drawing
-            self.display.set_pen(self.display.create_pen(0, 0, 0))
-            self.display.clear()
+            # Sleep until something needs rendering
+            current_page = self.get_page(self.current_page_index)
+            min_interval = 0
+            if current_page.MAX_FPS and self.ui_state == UI_STATE_NORMAL:
+                min_interval = 1000 // current_page.MAX_FPS
+            self.profiler.begin()
+            await self.scheduler.wait(self.next_frame_delay(current_page), min_interval)
+            self.profiler.lap("sleep")
 
-            if self.ui_state == UI_STATE_NORMAL:
-                current_page.draw(self.display, vector, 0)
-                self.draw_indicators(width, height)
-                
-            elif self.ui_state == UI_STATE_SLIDE_LEFT:
-                # Current moving LEFT (-offset), Next moving in from RIGHT (width - offset)
-                self.slide_pixel_offset += self.slide_speed
-                if self.slide_pixel_offset >= width:
-                    self.slide_pixel_offset = width
-                    # Finish Transition
-                    self.pages[self.current_page_index].exit()
-                    self.current_page_index = self.next_page_index
-                    self.ui_state = UI_STATE_NORMAL
-                    self.slide_pixel_offset = 0
-                    
-                    # Draw final state
-                    self.pages[self.current_page_index].draw(self.display, vector, 0)
-                    self.draw_indicators(width, height)
-                else:
-                    # Draw Current
-                    current_page.draw(self.display, vector, -self.slide_pixel_offset)
-                    # Draw Next
-                    self.pages[self.next_page_index].draw(self.display, vector, width - self.slide_pixel_offset)
-                    # Indicators (Static)
-                    self.draw_indicators(width, height)
-                    
-            elif self.ui_state == UI_STATE_SLIDE_RIGHT:
-                # Current moving RIGHT (+offset), Next moving in from LEFT (-width + offset)
-                self.slide_pixel_offset += self.slide_speed
-                if self.slide_pixel_offset >= width:
-                    self.slide_pixel_offset = width
-                    # Finish Transition
-                    self.pages[self.current_page_index].exit()
-                    self.current_page_index = self.next_page_index
-                    self.ui_state = UI_STATE_NORMAL
-                    self.slide_pixel_offset = 0
-                    
-                    self.pages[self.current_page_index].draw(self.display, vector, 0)
-                    self.draw_indicators(width, height)
-                else:
-                    # Draw Current
-                    current_page.draw(self.display, vector, self.slide_pixel_offset)
-                    # Draw Next
-                    self.pages[self.next_page_index].draw(self.display, vector, -width + self.slide_pixel_offset)
-                    self.draw_indicators(width, height)
-
-            self.presto.update()
-            await asyncio.sleep(0.01)
+            await self.step(vector)
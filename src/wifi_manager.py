@@ -33,6 +33,7 @@ class WiFiManager:
         self._target_ssid = None
         self._target_password = None
         self._retry_count = 0
+        self.time_synced = False
         
         # Start the background state machine task
         asyncio.create_task(self._run_state_machine())
@@ -132,6 +133,7 @@ class WiFiManager:
                 try:
                     print("WiFiManager: Syncing with NTP...")
                     ntptime.settime()
+                    self.time_synced = True
                     print(f"WiFiManager: Time Synced: {time.localtime()}")
                 except Exception as e:
                     print(f"WiFiManager: NTP Sync failed: {e}")
@@ -220,6 +222,12 @@ class WiFiManager:
     def get_status(self):
         """Get the current state machine state."""
         return self._state
+
+    async def wait_settled(self):
+        """Wait until a connection attempt has connected or given up. Returns the state."""
+        while self._state in (STATE_IDLE, STATE_CONNECTING):
+            await asyncio.sleep_ms(100)
+        return self._state
         
     def get_config(self):
         """Get current IP configuration."""
@@ -0,0 +1,294 @@
+"""
+Rendering benchmark: replays page cycles and swipe transitions on the
+host backend and writes per-page / per-transition numbers as JSON.
+
+    python tools/bench/render_bench.py [--frames N] [--out FILE] [--live-transitions]
+
+For every page from main.py (Clock in both modes, Crypto fed synthetic
+trades, Weather with canned data in all three views, Settings in edit
+mode) it reports:
+    fps              frames per second on this host
+    calls_per_frame  display + vector draw calls per frame
+    alloc_per_frame  peak bytes allocated while rendering a frame
+                     (tracemalloc peak above the pre-frame level, measured
+                     in a second pass with rasterization off so only the
+                     UI's own allocations count)
+"full" forces a whole-page redraw every frame (raw draw() cost);
+"steady" lets damage tracking decide what to redraw.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "host"))
+import host_env
+
+
+class Bench:
+    def __init__(self, frames, full_res, measure_alloc):
+        self.frames = frames
+        self.measure_alloc = measure_alloc
+        self.presto, self.vector, self.app = host_env.make_app(full_res=full_res)
+        self.display = self.presto.display
+        self.display.raster = not measure_alloc
+        self.pages = {}
+        self._trade = 0
+
+    def build(self):
+        """Register the main.py pages, load them all and give them canned data."""
+        from config import UIConfig
+        from data_service import get_store
+        from data_sources import CryptoSource
+
+        app = self.app
+        for module, class_name in UIConfig.PAGES:
+            app.register_page(module, class_name)
+        for index in range(len(app.pages)):
+            page = app.get_page(index)
+            self.pages[page.name] = page
+
+        # No DataService runs: the store gets canned data instead.
+        # Crypto prices come from feed_trade(), never the Binance socket.
+        self.store = get_store()
+        self.crypto_source = CryptoSource()
+        self.store.publish("crypto_live", True)
+        self.feed_trade()
+
+        # Weather: one canned location with observation and forecast
+        self.store.publish("weather", [{"name": "Taipei", "lat": 25.033, "lon": 121.5654,
+                                        "temp": 23.4, "code": 2, "is_day": 1}])
+        self.store.publish("forecast", [canned_forecast()])
+
+        # Settings: an item selected and in edit mode
+        settings = self.pages["Settings"]
+        settings.selected_index = 1
+        settings.edit_mode = True
+
+    def feed_trade(self):
+        """Push one synthetic Binance trade message through CryptoSource."""
+        self._trade += 1
+        symbol = "BTCUSDT" if self._trade % 2 else "ETHUSDT"
+        base = 67000.0 if symbol == "BTCUSDT" else 3500.0
+        price = base + (self._trade % 7) * 0.25
+        msg = json.dumps({"stream": "trade", "data": {"s": symbol, "p": f"{price:.2f}"}}).encode()
+        self.crypto_source.handle_message(self.store, msg)
+
+    def draw_calls(self):
+        return self.display.total()
+
+    async def frame(self, force_full=False):
+        """Run one AppManager frame, returning (seconds, calls, peak_bytes)."""
+        page = self.app.get_page(self.app.current_page_index)
+        if page.name == "Crypto":
+            self.feed_trade()
+        if force_full:
+            page.invalidate()
+        self.display.reset_counts()
+        if self.measure_alloc:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        self.app.sampler.sample()
+        self.app.profiler.begin()
+        await self.app.step(self.vector)
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] - base if self.measure_alloc else 0
+        return elapsed, self.draw_calls(), peak
+
+    async def run_frames(self, count, force_full):
+        total_time = 0.0
+        total_calls = 0
+        total_alloc = 0
+        for _ in range(count):
+            elapsed, calls, alloc = await self.frame(force_full)
+            total_time += elapsed
+            total_calls += calls
+            total_alloc += alloc
+        return summarize(count, total_time, total_calls, total_alloc)
+
+    def show(self, name):
+        """Make page `name` current without a transition."""
+        for index in range(len(self.app.pages)):
+            page = self.app.get_page(index)
+            if page.name == name:
+                self.app.current_page_index = index
+                self.app.enter_page(page)
+                page.invalidate()
+                return page
+        raise KeyError(name)
+
+    async def bench_page(self, name, label=None):
+        self.show(name)
+        await self.frame()  # Settle first-frame work
+        return label or name, {
+            "full": await self.run_frames(self.frames, True),
+            "steady": await self.run_frames(self.frames, False),
+        }
+
+    async def swipe(self, direction):
+        """Script a quick horizontal swipe (-1 = left/next, 1 = right/prev)."""
+        touch = self.presto.touch
+        width, height = self.display.get_bounds()
+        y = height // 2
+        start_x = width * 3 // 4 if direction < 0 else width // 4
+        touch.press(start_x, y)
+        await self.frame()
+        touch.move(start_x + direction * width // 2, y)
+        await self.frame()
+        touch.release()
+
+    async def bench_transition(self, direction):
+        app = self.app
+        from_name = app.get_page(app.current_page_index).name
+        await self.swipe(direction)
+        frames = 0
+        total_time = 0.0
+        total_calls = 0
+        total_alloc = 0
+        # The release frame starts the slide, the rest animate it
+        while True:
+            elapsed, calls, alloc = await self.frame()
+            frames += 1
+            total_time += elapsed
+            total_calls += calls
+            total_alloc += alloc
+            if app.ui_state == 0 and frames > 1:
+                break
+            if frames > 1000:
+                raise RuntimeError("Transition did not finish")
+        result = summarize(frames, total_time, total_calls, total_alloc)
+        result["from"] = from_name
+        result["to"] = app.get_page(app.current_page_index).name
+        result["direction"] = "left" if direction < 0 else "right"
+        return result
+
+
+def canned_forecast():
+    """A Forecast filled the way WeatherSource would, without the network."""
+    import math
+    from forecast import Forecast
+
+    forecast = Forecast()
+    start = 1760572800  # 2025-10-16 00:00 UTC
+    for i in range(len(forecast.hour_temp)):
+        forecast.hour_time[i] = start + i * 3600
+        forecast.hour_temp[i] = 22 + 5 * math.sin(i / 24 * 2 * math.pi)
+        forecast.hour_code[i] = 2
+    for i in range(len(forecast.day_time)):
+        forecast.day_time[i] = start + i * 86400
+        forecast.day_min[i] = 18 + i % 3
+        forecast.day_max[i] = 26 + i % 4
+        forecast.day_code[i] = 3
+    forecast.hours = len(forecast.hour_temp)
+    forecast.days = len(forecast.day_time)
+    forecast.utc_offset = 8 * 3600
+    return forecast
+
+
+def summarize(frames, total_time, total_calls, total_alloc):
+    return {
+        "frames": frames,
+        "fps": round(frames / total_time, 1) if total_time else None,
+        "ms_per_frame": round(total_time * 1000 / frames, 3),
+        "calls_per_frame": round(total_calls / frames, 2),
+        "alloc_per_frame": round(total_alloc / frames),
+    }
+
+
+async def run(args, measure_alloc):
+    bench = Bench(args.frames, args.full_res, measure_alloc)
+    bench.app.snapshot_transitions = not args.live_transitions
+    # Per-page update/draw attribution from the firmware's own profiler.
+    # CPython frees temporaries immediately, so on the host it only sees
+    # what a phase retains; on the device it sees every allocation.
+    bench.app.alloc_profiler.enabled = measure_alloc
+    bench.build()
+    bench.app.start()
+
+    from param_store import get_params
+    params = get_params()
+
+    results = {"pages": {}, "transitions": []}
+    for name in ("Status", "Crypto", "Weather", "Settings"):
+        label, data = await bench.bench_page(name)
+        results["pages"][label] = data
+    weather = bench.pages["Weather"]
+    for view, label in ((1, "Weather (hourly)"), (2, "Weather (daily)")):
+        weather.view = view
+        label, data = await bench.bench_page("Weather", label)
+        results["pages"][label] = data
+    weather.view = 0
+    params.set("clock_mode", 0)
+    label, data = await bench.bench_page("Clock", "Clock (digital)")
+    results["pages"][label] = data
+    params.set("clock_mode", 1)
+    label, data = await bench.bench_page("Clock", "Clock (analog)")
+    results["pages"][label] = data
+    params.set("clock_mode", 0)
+
+    # Swipe through every content page in both directions
+    bench.show("Status")
+    content_pages = len(bench.app.pages) - 1
+    for direction in (-1, 1):
+        for _ in range(content_pages):
+            results["transitions"].append(await bench.bench_transition(direction))
+
+    if measure_alloc:
+        results["page_alloc"] = bench.app.alloc_profiler.report()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=60, help="Frames per page scenario")
+    parser.add_argument("--out", default="bench_results.json", help="JSON output file")
+    parser.add_argument("--full-res", action="store_true", help="Render at 480x480")
+    parser.add_argument("--live-transitions", action="store_true", help="Disable snapshot transitions")
+    args = parser.parse_args()
+    out_path = os.path.abspath(args.out)
+
+    host_env.install()
+    # Timing pass with the rasterizer, then an allocation pass without it
+    results = asyncio.run(run(args, False))
+    tracemalloc.start()
+    alloc = asyncio.run(run(args, True))
+    tracemalloc.stop()
+    for name, modes in results["pages"].items():
+        for mode, r in modes.items():
+            r["alloc_per_frame"] = alloc["pages"][name][mode]["alloc_per_frame"]
+    for r, a in zip(results["transitions"], alloc["transitions"]):
+        r["alloc_per_frame"] = a["alloc_per_frame"]
+    results["page_alloc"] = alloc["page_alloc"]
+    results["meta"] = {
+        "frames": args.frames,
+        "full_res": args.full_res,
+        "snapshot_transitions": not args.live_transitions,
+        "python": platform.python_version(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+    with open(out_path, "w") as f:
+        json.dump(results, f, indent=2)
+
+    print(f"{'page':<18} {'mode':<7} {'fps':>8} {'calls/f':>8} {'alloc/f':>8}")
+    for name, modes in results["pages"].items():
+        for mode, r in modes.items():
+            print(f"{name:<18} {mode:<7} {r['fps']:>8} {r['calls_per_frame']:>8} {r['alloc_per_frame']:>8}")
+    print(f"{'transition':<26} {'frames':>6} {'fps':>8} {'calls/f':>8} {'alloc/f':>8}")
+    for r in results["transitions"]:
+        name = f"{r['from']}->{r['to']} ({r['direction']})"
+        print(f"{name:<26} {r['frames']:>6} {r['fps']:>8} {r['calls_per_frame']:>8} {r['alloc_per_frame']:>8}")
+    print(f"{'page':<10} {'update p95':>10} {'draw p95':>10} {'frame p95':>10} {'over':>5}")
+    for name, r in results["page_alloc"].items():
+        p95 = [r[k][1] if r[k] else "-" for k in ("update", "draw", "frame")]
+        print(f"{name:<10} {p95[0]:>10} {p95[1]:>10} {p95[2]:>10} {r['over_budget']:>5}")
+    print(f"Results written to {out_path}")
+
+
+if __name__ == "__main__":
+    main()
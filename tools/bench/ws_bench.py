@@ -0,0 +1,191 @@
+"""
+WebSocket receive benchmark: feeds a recorded stream of server frames
+through simple_websocket.FrameDecoder on the host and writes the numbers
+as JSON.
+
+    python tools/bench/ws_bench.py [--frames N] [--capture FILE] [--out FILE]
+
+The capture is the raw bytes a server sent after the upgrade (what the
+socket would return); without --capture a Binance-like trade stream is
+synthesized (--save-capture writes it out). Reads are split at random
+sizes, like a socket returning whatever has arrived.
+
+Scenarios:
+    legacy        header bytes read one by one, payload grown with
+                  data += chunk and decoded to str (the old recv())
+    decode        FrameDecoder only: payloads as memoryviews
+    decode+parse  FrameDecoder plus CryptoSource.handle_message()
+For each: frames/s, MB/s and peak bytes allocated per frame.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "host"))
+import host_env
+
+
+def synth_capture(count):
+    """Trade text frames, every tenth one padded past the 7-bit length."""
+    from ws_standin import frame, trade_message
+
+    parts = []
+    for i in range(count):
+        msg = trade_message(i)
+        if i % 10 == 9:
+            msg = msg[:-1] + ', "pad": "' + "x" * 200 + '"}'
+        parts.append(frame(0x1, msg))
+    return b"".join(parts)
+
+
+class CaptureReader:
+    """Stream stand-in serving the capture in random-sized reads."""
+    def __init__(self, data, seed=1, max_read=1460):
+        self.data = memoryview(data)
+        self.pos = 0
+        self.rand = random.Random(seed)
+        self.max_read = max_read
+
+    def _take(self, n):
+        n = min(n, self.rand.randint(1, self.max_read), len(self.data) - self.pos)
+        chunk = self.data[self.pos:self.pos + n]
+        self.pos += n
+        return chunk
+
+    async def readinto(self, buf):
+        chunk = self._take(len(buf))
+        buf[:len(chunk)] = chunk
+        return len(chunk)
+
+    async def read(self, n):
+        return bytes(self._take(n))
+
+
+async def legacy_recv(reader):
+    """The previous WebSocket.recv(): one read per header field, data += chunk."""
+    async def recv_bytes(n):
+        data = b""
+        while len(data) < n:
+            chunk = await reader.read(n - len(data))
+            if not chunk:
+                return b""
+            data += chunk
+        return data
+
+    first = await recv_bytes(1)
+    if not first:
+        return None
+    second = await recv_bytes(1)
+    length = second[0] & 0x7F
+    if length == 126:
+        length = int.from_bytes(await recv_bytes(2), "big")
+    elif length == 127:
+        length = int.from_bytes(await recv_bytes(8), "big")
+    payload = await recv_bytes(length)
+    return payload.decode("utf-8")
+
+
+async def run_scenario(name, capture, frames, measure_alloc):
+    from simple_websocket import FrameDecoder
+    from data_service import DataStore
+    from data_sources import CryptoSource
+
+    reader = CaptureReader(capture)
+    decoder = FrameDecoder()
+    source = CryptoSource()
+    store = DataStore()
+    count = 0
+    total_alloc = 0
+    start = time.perf_counter()
+    while count < frames:
+        if measure_alloc:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        if name == "legacy":
+            msg = await legacy_recv(reader)
+            if msg is None:
+                break
+            source.handle_message(store, msg.encode())
+        else:
+            frame = decoder.next_frame()
+            while frame is None:
+                n = await reader.readinto(decoder.free())
+                if not n:
+                    break
+                decoder.filled(n)
+                frame = decoder.next_frame()
+            if frame is None:
+                break
+            if name == "decode+parse":
+                source.handle_message(store, frame[2])
+        if measure_alloc:
+            total_alloc += tracemalloc.get_traced_memory()[1] - base
+        count += 1
+    elapsed = time.perf_counter() - start
+    return {
+        "frames": count,
+        "fps": round(count / elapsed) if elapsed else None,
+        "mb_per_s": round(reader.pos / elapsed / 1e6, 2) if elapsed else None,
+        "alloc_per_frame": round(total_alloc / count) if measure_alloc and count else None,
+        "prices": dict(source.prices) if name != "decode" else None,
+    }
+
+
+async def run(capture, frames):
+    results = {}
+    for name in ("legacy", "decode", "decode+parse"):
+        timing = await run_scenario(name, capture, frames, False)
+        tracemalloc.start()
+        alloc = await run_scenario(name, capture, frames, True)
+        tracemalloc.stop()
+        timing["alloc_per_frame"] = alloc["alloc_per_frame"]
+        results[name] = timing
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=5000, help="Frames to decode per scenario")
+    parser.add_argument("--capture", help="Raw server byte stream to replay")
+    parser.add_argument("--save-capture", help="Write the synthesized capture here")
+    parser.add_argument("--out", default="ws_bench_results.json", help="JSON output file")
+    args = parser.parse_args()
+    out_path = os.path.abspath(args.out)
+    capture_path = os.path.abspath(args.capture) if args.capture else None
+    save_path = os.path.abspath(args.save_capture) if args.save_capture else None
+
+    host_env.install()
+    if capture_path:
+        with open(capture_path, "rb") as f:
+            capture = f.read()
+    else:
+        capture = synth_capture(args.frames)
+        if save_path:
+            with open(save_path, "wb") as f:
+                f.write(capture)
+
+    results = {"scenarios": asyncio.run(run(capture, args.frames))}
+    results["meta"] = {
+        "frames": args.frames,
+        "capture_bytes": len(capture),
+        "capture": capture_path or "synthetic",
+        "python": platform.python_version(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    with open(out_path, "w") as f:
+        json.dump(results, f, indent=2)
+
+    print(f"{'scenario':<14} {'frames':>7} {'frames/s':>9} {'MB/s':>6} {'alloc/f':>8}")
+    for name, r in results["scenarios"].items():
+        print(f"{name:<14} {r['frames']:>7} {r['fps']:>9} {r['mb_per_s']:>6} {r['alloc_per_frame']:>8}")
+    print(f"Results written to {out_path}")
+
+
+if __name__ == "__main__":
+    main()
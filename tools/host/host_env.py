@@ -0,0 +1,283 @@
+"""
+Run the Picore-W UI on CPython.
+
+install() puts src/ and this directory on sys.path and provides host
+versions of the MicroPython-only modules the UI imports (uasyncio,
+time.ticks_*, gc.mem_alloc, machine, network, ntptime, u* aliases).
+Network access is not emulated: sockets (and so async_http) are the
+host's own, and ntptime calls fail the way they would without WiFi.
+Files the app writes (app_params.json, ...) go to a scratch directory
+standing in for the device's flash root.
+"""
+import asyncio
+import binascii
+import gc
+import hashlib
+import json
+import os
+import random
+import select
+import socket
+import sys
+import tempfile
+import time
+import tracemalloc
+import types
+
+HOST_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(HOST_DIR)), "src")
+
+_installed = False
+
+
+def _module(name, **attrs):
+    mod = types.ModuleType(name)
+    mod.__dict__.update(attrs)
+    sys.modules[name] = mod
+    return mod
+
+
+def _ticks_ms():
+    return int(time.perf_counter() * 1000)
+
+
+def _ticks_us():
+    return int(time.perf_counter() * 1000000)
+
+
+_host_time = time.time
+
+
+def _time():
+    """Integer seconds, like time.time() on MicroPython ports without float RTC."""
+    return int(_host_time())
+
+
+def _ticks_diff(a, b):
+    return a - b
+
+
+def _ticks_add(a, b):
+    return a + b
+
+
+def _mem_alloc():
+    """Bytes currently allocated (tracked only while tracemalloc runs)."""
+    if tracemalloc.is_tracing():
+        return tracemalloc.get_traced_memory()[0]
+    return 0
+
+
+def _mem_free():
+    return 8 * 1024 * 1024 - _mem_alloc()
+
+
+def _install_uasyncio():
+    mod = _module("uasyncio")
+    for name in dir(asyncio):
+        if not name.startswith("__"):
+            setattr(mod, name, getattr(asyncio, name))
+
+    async def sleep_ms(ms):
+        await asyncio.sleep(ms / 1000)
+
+    async def wait_for_ms(aw, timeout):
+        return await asyncio.wait_for(aw, timeout / 1000)
+
+    async def open_connection(host, port, ssl=None, server_hostname=None):
+        # MicroPython streams also have readinto()
+        if ssl:
+            reader, writer = await asyncio.open_connection(host, port, ssl=ssl,
+                                                           server_hostname=server_hostname)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+
+        async def readinto(buf):
+            data = await reader.read(len(buf))
+            buf[:len(data)] = data
+            return len(data)
+
+        reader.readinto = readinto
+        return reader, _HostStreamWriter(writer)
+
+    mod.sleep_ms = sleep_ms
+    mod.wait_for_ms = wait_for_ms
+    mod.open_connection = open_connection
+    mod.core = _module("uasyncio.core", _io_queue=_HostIOQueue())
+
+
+_open_sockets = set()  # Client connections not closed yet, kept alive as on the device
+
+
+class _HostSocket:
+    """Stands in for Stream.s: close() ends the transport."""
+    def __init__(self, writer):
+        self._writer = writer
+        _open_sockets.add(self)
+
+    def close(self):
+        _open_sockets.discard(self)
+        self._writer.close()
+
+
+class _HostStreamWriter:
+    """
+    Writer with MicroPython's close semantics: close() does nothing and
+    only wait_closed() or s.close() closes the connection, so code that
+    forgets to really close leaks here as it does on the device (the
+    socket is not even closed when the stream is garbage collected).
+    """
+    def __init__(self, writer):
+        self._writer = writer
+        self.s = _HostSocket(writer)
+
+    def write(self, data):
+        self._writer.write(data)
+
+    async def drain(self):
+        await self._writer.drain()
+
+    def close(self):
+        pass
+
+    async def wait_closed(self):
+        self.s.close()
+
+
+class _HostIOQueue:
+    """
+    uasyncio.core._io_queue on the event loop's reader/writer callbacks.
+    queue_read()/queue_write() return a future the awaiting task yields.
+    """
+    def _wait(self, sock, write):
+        loop = asyncio.get_running_loop()
+        add, remove = (loop.add_writer, loop.remove_writer) if write else (loop.add_reader, loop.remove_reader)
+        fut = loop.create_future()
+
+        def ready():
+            if not fut.done():
+                fut.set_result(None)
+
+        add(sock, ready)
+        fut.add_done_callback(lambda f: remove(sock))
+        fut._asyncio_future_blocking = True  # Yielded bare, as uasyncio does
+        return fut
+
+    def queue_read(self, sock):
+        return self._wait(sock, False)
+
+    def queue_write(self, sock):
+        return self._wait(sock, True)
+
+
+class _WLAN:
+    """Disconnected network interface."""
+    def __init__(self, interface=0):
+        self._active = False
+
+    def active(self, value=None):
+        if value is None:
+            return self._active
+        self._active = bool(value)
+
+    def isconnected(self):
+        return False
+
+    def connect(self, ssid=None, password=None):
+        pass
+
+    def disconnect(self):
+        pass
+
+    def status(self):
+        return 0
+
+    def config(self, *args, **kwargs):
+        pass
+
+    def ifconfig(self):
+        return ("0.0.0.0", "0.0.0.0", "0.0.0.0", "0.0.0.0")
+
+
+def _no_network(*args, **kwargs):
+    raise OSError("No network on host")
+
+
+def _reset():
+    raise SystemExit("machine.reset()")
+
+
+def install(fs_root=None):
+    """
+    Install the host environment. Safe to call more than once.
+
+    Args:
+        fs_root: Directory used as the device filesystem root (becomes the
+                 working directory). Defaults to a fresh temp directory.
+    """
+    global _installed
+    if _installed:
+        return
+    _installed = True
+
+    os.chdir(fs_root or tempfile.mkdtemp(prefix="picore_fs_"))
+
+    for path in (SRC_DIR, HOST_DIR):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+    time.time = _time
+    time.ticks_ms = _ticks_ms
+    time.ticks_us = _ticks_us
+    time.ticks_diff = _ticks_diff
+    time.ticks_add = _ticks_add
+    time.sleep_ms = lambda ms: time.sleep(ms / 1000)
+    gc.mem_alloc = _mem_alloc
+    gc.mem_free = _mem_free
+
+    _install_uasyncio()
+    _module("machine", reset=_reset, freq=lambda *a: 150000000)
+    _module("network", WLAN=_WLAN, STA_IF=0, AP_IF=1,
+            STAT_IDLE=0, STAT_CONNECTING=1, STAT_WRONG_PASSWORD=-3,
+            STAT_NO_AP_FOUND=-2, STAT_CONNECT_FAIL=-1, STAT_GOT_IP=3)
+    _module("ntptime", settime=_no_network)
+    sys.modules["usocket"] = socket
+    sys.modules["uselect"] = select
+    sys.modules["ubinascii"] = binascii
+    sys.modules["ujson"] = json
+    sys.modules["uhashlib"] = hashlib
+    sys.modules["urandom"] = random
+
+
+class HostWiFiManager:
+    """Minimal WiFiManager replacement reporting a fixed state."""
+    def __init__(self, state=2, ip="192.168.1.50"):
+        self.state = state
+        self.ip = ip
+
+    def get_status(self):
+        return self.state
+
+    def is_connected(self):
+        return self.state == 2
+
+    def get_config(self):
+        return (self.ip, "255.255.255.0", "192.168.1.1", "192.168.1.1")
+
+
+def make_app(full_res=False, wifi_manager=None):
+    """
+    Create (presto, vector, app_manager) wired to the host backend.
+    Call install() first.
+    """
+    from presto import Presto
+    from picovector import PicoVector, ANTIALIAS_BEST
+    from ui_framework import AppManager
+    from config import UIConfig
+
+    presto = Presto(full_res=full_res)
+    vector = PicoVector(presto.display)
+    vector.set_antialiasing(ANTIALIAS_BEST)
+    vector.set_font(UIConfig.FONT_NAME, 20)
+    app = AppManager(presto, wifi_manager or HostWiFiManager())
+    return presto, vector, app
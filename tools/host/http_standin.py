@@ -0,0 +1,280 @@
+"""
+Plain-HTTP stand-in server for exercising src/async_http.py on the host.
+
+    python tools/host/http_standin.py            # run the client checks
+    python tools/host/http_standin.py --serve 8080
+
+Routes:
+    /length      JSON body with Content-Length
+    /chunked     JSON body in several chunks
+    /close       body delimited by closing the connection
+    /slow?ms=N   Content-Length body after N ms
+    /v1/forecast canned Open-Meteo current weather and forecast response;
+                 comma-separated latitudes give a list, one per location
+    /series      chunked JSON with numeric arrays, for streamed extraction
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import host_env
+
+WEATHER = {
+    "utc_offset_seconds": 28800,
+    "current_weather": {"temperature": 23.4, "weathercode": 2, "is_day": 1},
+    "hourly": {
+        "time": [1760572800 + h * 3600 for h in range(24)],
+        "temperature_2m": [round(20 + (h % 12) * 0.5, 1) for h in range(24)],
+        "weathercode": [2] * 24,
+    },
+    "daily": {
+        "time": [1760544000 + d * 86400 for d in range(7)],
+        "weathercode": [3] * 7,
+        "temperature_2m_max": [26.0 + d for d in range(7)],
+        "temperature_2m_min": [18.0 + d for d in range(7)],
+    },
+}
+SERIES = {
+    "note": "escaped \"quotes\", \\ and \u00e9 {not: [structure]}",
+    "meta": {"values": [9, 9, 9], "nested": [{"values": [8]}, [], {}]},
+    "series": {
+        "label": "t\u00e9mp",
+        "values": [round(i * 0.25 - 3, 2) for i in range(40)] + [None, 1e3, -2.5E-1],
+        "flags": [True, False, None],
+    },
+    "count": 43,
+}
+
+
+def forecast_response(query):
+    """WEATHER, or a list of copies (temperature +1 each) for several latitudes."""
+    params = dict(p.partition("=")[::2] for p in query.split("&"))
+    count = params.get("latitude", "").count(",") + 1
+    if count == 1:
+        return WEATHER
+    records = []
+    for i in range(count):
+        record = json.loads(json.dumps(WEATHER))
+        record["current_weather"]["temperature"] += i
+        records.append(record)
+    return records
+
+
+class StandinServer:
+    """Minimal HTTP/1.1 server with keep-alive; counts accepted connections."""
+    def __init__(self):
+        self.connections = 0
+        self.requests = 0
+        self.port = None
+        self._server = None
+        self._handlers = set()
+
+    async def start(self, host="127.0.0.1", port=0):
+        self._server = await asyncio.start_server(self._handle, host, port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    def url(self, path):
+        return f"http://127.0.0.1:{self.port}{path}"
+
+    async def stop(self):
+        self._server.close()
+        for task in self._handlers:
+            task.cancel()
+        await asyncio.gather(*self._handlers)
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        task = asyncio.current_task()
+        self._handlers.add(task)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                method, target, _ = line.decode().split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b""):
+                        break
+                    name, _, value = line.decode().partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                if "content-length" in headers:
+                    await reader.readexactly(int(headers["content-length"]))
+                self.requests += 1
+                if not await self._respond(writer, method, target):
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass
+        finally:
+            self._handlers.discard(task)
+            writer.close()
+
+    async def _respond(self, writer, method, target):
+        """Write the response for target. Returns False if the connection must close."""
+        path, _, query = target.partition("?")
+        if path in ("/chunked", "/series"):
+            if path == "/series":
+                body = json.dumps(SERIES, indent=1).encode()
+            else:
+                body = json.dumps({"route": "chunked", "items": list(range(50))}).encode()
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                         b"Transfer-Encoding: chunked\r\n\r\n")
+            for i in range(0, len(body), 37):
+                part = body[i:i + 37]
+                writer.write(b"%x;ext=1\r\n%s\r\n" % (len(part), part))
+                await writer.drain()
+            writer.write(b"0\r\nX-Trailer: yes\r\n\r\n")
+            await writer.drain()
+            return True
+        if path == "/close":
+            writer.write(b"HTTP/1.1 200 OK\r\nConnection: close\r\n\r\n" + b"x" * 2000)
+            await writer.drain()
+            return False
+
+        if path == "/slow":
+            ms = int(query.partition("=")[2] or 1000)
+            await asyncio.sleep(ms / 1000)
+            body = json.dumps({"route": "slow"}).encode()
+        elif path == "/length":
+            body = json.dumps({"route": "length"}).encode()
+        elif path == "/v1/forecast":
+            body = json.dumps(forecast_response(query)).encode()
+        else:
+            writer.write(b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\n\r\n")
+            await writer.drain()
+            return True
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                     b"Content-Length: %d\r\n\r\n" % len(body))
+        if method != "HEAD":
+            writer.write(body)
+        await writer.drain()
+        return True
+
+
+async def run_checks():
+    """Exercise HTTPClient against the stand-in; returns the number of failures."""
+    from async_http import HTTPClient
+    from json_stream import JSONExtractor, Scalar, ArraySink
+    from array import array
+    import uasyncio
+
+    server = await StandinServer().start()
+    client = HTTPClient()
+    failures = 0
+
+    def check(name, ok):
+        nonlocal failures
+        print(f"{'ok  ' if ok else 'FAIL'} {name}")
+        if not ok:
+            failures += 1
+
+    res = await client.get(server.url("/length"))
+    check("content-length body", res.status_code == 200 and res.json()["route"] == "length")
+    res = await client.get(server.url("/chunked"))
+    check("chunked body", res.json()["items"] == list(range(50)))
+    check("keep-alive reuse", server.connections == 1)
+
+    res = await client.get(server.url("/missing"))
+    check("404 status", res.status_code == 404 and res.content == b"")
+    res = await client.request("HEAD", server.url("/length"))
+    check("HEAD has no body", res.content == b"" and server.connections == 1)
+
+    res = await client.get(server.url("/close"))
+    check("close-delimited body", len(res.content) == 2000)
+    await client.get(server.url("/length"))
+    check("new connection after close", server.connections == 2)
+
+    try:
+        await client.get(server.url("/slow?ms=500"), timeout_ms=100)
+        check("timeout", False)
+    except uasyncio.TimeoutError:
+        check("timeout", True)
+    res = await client.get(server.url("/length"))
+    check("recovers after timeout", res.status_code == 200 and server.connections == 3)
+
+    # Streamed extraction: nothing buffered, values land in the arrays
+    values = array("f", [0.0] * 40)
+    label, count = Scalar(), Scalar()
+    extractor = JSONExtractor({
+        ("series", "values"): ArraySink(values, is_float=True),
+        ("series", "label"): label,
+        ("count",): count,
+    })
+    res = await client.get(server.url("/series"), on_body=extractor.feed)
+    extractor.close()
+    sink = extractor.targets[("series", "values")]
+    expected = SERIES["series"]["values"]
+    check("streamed body not buffered", res.content == b"")
+    check("streamed array extraction",
+          sink.count == 40 and sink.dropped == 3
+          and all(abs(a - b) < 1e-6 for a, b in zip(values, expected)))
+    check("streamed scalars", label.value == "t\u00e9mp" and count.value == 43)
+
+    # Any chunking of the document gives the same result
+    body = json.dumps(SERIES).encode()
+    ok = True
+    for size in (1, 2, 3, 7, 64):
+        extractor.reset()
+        for i in range(0, len(body), size):
+            extractor.feed(body[i:i + size])
+        extractor.close()
+        ok = ok and sink.count == 40 and count.value == 43
+    check("chunk boundaries", ok)
+
+    current = Scalar()
+    extractor = JSONExtractor({("current_weather", "temperature"): current})
+    await client.get(server.url("/v1/forecast"), on_body=extractor.feed)
+    extractor.close()
+    res = await client.get(server.url("/missing"), on_body=extractor.feed)
+    check("streamed Content-Length body", current.value == 23.4 and res.status_code == 404)
+
+    # Ticker keeps running while a slow response is outstanding
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    await client.get(server.url("/slow?ms=300"))
+    task.cancel()
+    check("event loop not blocked", ticks >= 10)
+
+    # Timed-out, server-closed and pooled connections are all really closed
+    client.close()
+    await asyncio.sleep(0.2)
+    check("no connections left open", not server._handlers)
+
+    await server.stop()
+    return failures
+
+
+async def serve(port):
+    server = await StandinServer().start(port=port)
+    print(f"Serving on {server.url('/')}")
+    await asyncio.Event().wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--serve", type=int, metavar="PORT", help="Only run the server")
+    args = parser.parse_args()
+
+    host_env.install()
+    if args.serve:
+        asyncio.run(serve(args.serve))
+        return
+    failures = asyncio.run(run_checks())
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+Host (CPython) stand-in for the Pimoroni `picovector` module.
+
+Text is approximated with one block per glyph using a fixed advance,
+which keeps layout, clipping and pixel cost realistic enough for
+profiling. Polygons are filled with an even-odd test.
+"""
+import math
+import numpy as np
+
+ANTIALIAS_NONE = 0
+ANTIALIAS_FAST = 1
+ANTIALIAS_BEST = 2
+ANTIALIAS_X4 = 1
+ANTIALIAS_X16 = 2
+
+HALIGN_LEFT = 0
+HALIGN_CENTER = 1
+HALIGN_RIGHT = 2
+VALIGN_TOP = 0
+VALIGN_MIDDLE = 4
+VALIGN_BOTTOM = 8
+
+# Average glyph advance as a fraction of the font size
+GLYPH_ADVANCE = 0.55
+
+
+class Transform:
+    """
+    2D affine transform (translate / rotate / scale).
+
+    Kept as six floats and updated in place, so building a transform
+    allocates about as little as the firmware's does; the matrix is only
+    made for rasterizing.
+    """
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self._v = [1.0, 0.0, 0.0, 0.0, 1.0, 0.0]  # a b c / d e f of [[a b c] [d e f] [0 0 1]]
+        return self
+
+    def _apply(self, a2, b2, c2, d2, e2, f2):
+        v = self._v
+        a, b, c, d, e, f = v
+        v[0] = a * a2 + b * d2
+        v[1] = a * b2 + b * e2
+        v[2] = a * c2 + b * f2 + c
+        v[3] = d * a2 + e * d2
+        v[4] = d * b2 + e * e2
+        v[5] = d * c2 + e * f2 + f
+        return self
+
+    @property
+    def m(self):
+        a, b, c, d, e, f = self._v
+        return np.array([[a, b, c], [d, e, f], [0.0, 0.0, 1.0]])
+
+    def translate(self, x, y):
+        return self._apply(1.0, 0.0, x, 0.0, 1.0, y)
+
+    def rotate(self, angle, origin=(0, 0)):
+        a = math.radians(angle)
+        c, s = math.cos(a), math.sin(a)
+        ox, oy = origin
+        self.translate(ox, oy)
+        self._apply(c, -s, 0.0, s, c, 0.0)
+        return self.translate(-ox, -oy)
+
+    def scale(self, x, y=None):
+        y = x if y is None else y
+        return self._apply(x, 0.0, 0.0, 0.0, y, 0.0)
+
+
+class Polygon:
+    """Set of closed paths."""
+    def __init__(self):
+        self.paths = []
+
+    def path(self, *points):
+        self.paths.append([(float(x), float(y)) for x, y in points])
+        return self
+
+    def rectangle(self, x, y, w, h, corners=None, stroke=0):
+        return self.path((x, y), (x + w, y), (x + w, y + h), (x, y + h))
+
+    def circle(self, x, y, r, stroke=0):
+        return self.regular(x, y, r, 24)
+
+    def regular(self, x, y, r, sides, stroke=0):
+        return self.path(*[(x + r * math.sin(2 * math.pi * i / sides), y - r * math.cos(2 * math.pi * i / sides))
+                           for i in range(sides)])
+
+
+class PicoVector:
+    """PicoVector stand-in drawing onto a presto.HostDisplay."""
+    def __init__(self, display):
+        self.display = display
+        self.font_size = 20
+        self.font_align = HALIGN_LEFT | VALIGN_TOP
+        self.transform = None
+
+    def set_antialiasing(self, aa):
+        self.display.count("vector.set_antialiasing")
+
+    def set_font(self, font, size):
+        self.display.count("vector.set_font")
+        self.font_size = size
+
+    def set_font_size(self, size):
+        self.display.count("vector.set_font_size")
+        self.font_size = size
+
+    def set_font_align(self, align):
+        self.display.count("vector.set_font_align")
+        self.font_align = align
+
+    def set_transform(self, transform):
+        self.display.count("vector.set_transform")
+        self.transform = transform
+
+    def _text_size(self, text):
+        size = self.font_size
+        return int(len(text) * size * GLYPH_ADVANCE), int(size)
+
+    def measure_text(self, text, x=0, y=0, angle=None):
+        self.display.count("vector.measure_text")
+        w, h = self._text_size(str(text))
+        return (x, y, w, h)
+
+    def text(self, text, x, y, angle=None, max_width=0, max_height=0):
+        self.display.count("vector.text")
+        if not self.display.raster:
+            return
+        text = str(text)
+        w, h = self._text_size(text)
+        halign = self.font_align & 3
+        valign = self.font_align & 12
+        if halign == HALIGN_CENTER:
+            x -= w // 2
+        elif halign == HALIGN_RIGHT:
+            x -= w
+        if valign == VALIGN_MIDDLE:
+            y -= h // 2
+        elif valign == VALIGN_BOTTOM:
+            y -= h
+        advance = self.font_size * GLYPH_ADVANCE
+        glyph_w = max(1, int(advance * 0.8))
+        glyph_h = max(1, int(h * 0.7))
+        top = int(y + (h - glyph_h) // 2)
+        for i, ch in enumerate(text):
+            if ch != " ":
+                gx = int(x + i * advance)
+                self.display._fill(gx, top, gx + glyph_w, top + glyph_h)
+
+    def draw(self, polygon):
+        self.display.count("vector.draw")
+        if not self.display.raster:
+            return
+        m = self.transform.m if self.transform is not None else np.identity(3)
+        paths = []
+        for path in polygon.paths:
+            pts = np.array([[px, py, 1.0] for px, py in path]) @ m.T
+            paths.append(pts[:, :2])
+        if not paths:
+            return
+        allpts = np.vstack(paths)
+        x0, y0 = np.floor(allpts.min(axis=0)).astype(int)
+        x1, y1 = np.ceil(allpts.max(axis=0)).astype(int) + 1
+        yy, xx = np.mgrid[y0:y1, x0:x1]
+        px = xx + 0.5
+        py = yy + 0.5
+        inside = np.zeros(xx.shape, dtype=bool)
+        for pts in paths:
+            n = len(pts)
+            for i in range(n):
+                ax, ay = pts[i]
+                bx, by = pts[(i + 1) % n]
+                if ay == by:
+                    continue
+                crosses = ((ay > py) != (by > py)) & (px < (bx - ax) * (py - ay) / (by - ay) + ax)
+                inside ^= crosses
+        self.display._fill(x0, y0, x1, y1, inside)
@@ -0,0 +1,208 @@
+"""
+Host (CPython) stand-in for the Pimoroni `presto` module.
+
+HostDisplay rasterizes into a NumPy RGB framebuffer and counts every
+draw call, so the UI can be rendered and measured without hardware.
+Only the calls the pages actually use are implemented.
+"""
+import numpy as np
+
+
+class DrawCounter:
+    """Counts calls per method name."""
+    def __init__(self):
+        self.calls = {}
+
+    def count(self, name):
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def total(self):
+        """Total number of counted calls."""
+        return sum(self.calls.values())
+
+    def reset_counts(self):
+        self.calls = {}
+
+
+class HostDisplay(DrawCounter, bytearray):
+    """
+    PicoGraphics stand-in backed by an RGB888 framebuffer.
+
+    The object itself is the framebuffer (like memoryview(display) on the
+    device); `pixels` is a (height, width, 3) NumPy view of it.
+    Set `raster = False` to only count calls, e.g. while measuring the
+    UI's own allocations without the rasterizer's.
+    """
+    def __init__(self, width, height):
+        bytearray.__init__(self, width * height * 3)
+        DrawCounter.__init__(self)
+        self.width = width
+        self.height = height
+        self.pixels = np.frombuffer(self, dtype=np.uint8).reshape(height, width, 3)
+        self._pen = (0, 0, 0)
+        self._clip = (0, 0, width, height)
+        self.raster = True
+
+    def get_bounds(self):
+        return (self.width, self.height)
+
+    def create_pen(self, r, g, b):
+        self.count("create_pen")
+        return (int(r) << 16) | (int(g) << 8) | int(b)
+
+    def set_pen(self, pen):
+        self.count("set_pen")
+        self._pen = ((pen >> 16) & 0xFF, (pen >> 8) & 0xFF, pen & 0xFF)
+
+    def set_clip(self, x, y, w, h):
+        self.count("set_clip")
+        x0 = max(0, int(x))
+        y0 = max(0, int(y))
+        x1 = min(self.width, int(x + w))
+        y1 = min(self.height, int(y + h))
+        self._clip = (x0, y0, max(0, x1 - x0), max(0, y1 - y0))
+
+    def remove_clip(self):
+        self.count("remove_clip")
+        self._clip = (0, 0, self.width, self.height)
+
+    def _fill(self, x0, y0, x1, y1, mask=None):
+        """Fill [x0, x1) x [y0, y1) with the pen, clipped; mask limits pixels."""
+        if not self.raster:
+            return
+        cx, cy, cw, ch = self._clip
+        fx0 = max(int(x0), cx)
+        fy0 = max(int(y0), cy)
+        fx1 = min(int(x1), cx + cw)
+        fy1 = min(int(y1), cy + ch)
+        if fx1 <= fx0 or fy1 <= fy0:
+            return
+        region = self.pixels[fy0:fy1, fx0:fx1]
+        if mask is None:
+            region[:] = self._pen
+        else:
+            mask = mask[fy0 - int(y0):fy1 - int(y0), fx0 - int(x0):fx1 - int(x0)]
+            region[mask] = self._pen
+
+    def clear(self):
+        self.count("clear")
+        cx, cy, cw, ch = self._clip
+        self._fill(cx, cy, cx + cw, cy + ch)
+
+    def rectangle(self, x, y, w, h):
+        self.count("rectangle")
+        self._fill(x, y, x + w, y + h)
+
+    def pixel(self, x, y):
+        self.count("pixel")
+        self._fill(x, y, x + 1, y + 1)
+
+    def circle(self, x, y, r):
+        self.count("circle")
+        if not self.raster:
+            return
+        r = int(r)
+        yy, xx = np.ogrid[-r:r + 1, -r:r + 1]
+        mask = (xx * xx + yy * yy) <= r * r
+        self._fill(x - r, y - r, x + r + 1, y + r + 1, mask)
+
+    def line(self, x1, y1, x2, y2, thickness=1):
+        self.count("line")
+        if not self.raster:
+            return
+        steps = int(max(abs(x2 - x1), abs(y2 - y1))) + 1
+        xs = np.rint(np.linspace(x1, x2, steps)).astype(int)
+        ys = np.rint(np.linspace(y1, y2, steps)).astype(int)
+        cx, cy, cw, ch = self._clip
+        keep = (xs >= cx) & (xs < cx + cw) & (ys >= cy) & (ys < cy + ch)
+        self.pixels[ys[keep], xs[keep]] = self._pen
+
+    def text(self, text, x, y, wordwrap=-1, scale=2, angle=0, spacing=1):
+        """Bitmap font text: drawn as one block per character."""
+        self.count("text")
+        cell = 6 * scale
+        for i, ch in enumerate(str(text)):
+            if ch != " ":
+                self._fill(x + i * cell, y, x + i * cell + cell - scale, y + 7 * scale)
+
+    def measure_text(self, text, scale=2, spacing=1):
+        self.count("measure_text")
+        return len(str(text)) * 6 * scale
+
+    def set_font(self, font):
+        self.count("set_font")
+
+    def set_backlight(self, brightness):
+        pass
+
+    def snapshot(self):
+        """Copy of the current framebuffer as a (height, width, 3) array."""
+        return self.pixels.copy()
+
+    def save_ppm(self, path):
+        """Write the framebuffer as a binary PPM image."""
+        with open(path, "wb") as f:
+            f.write(b"P6 %d %d 255\n" % (self.width, self.height))
+            f.write(bytes(self))
+
+
+class HostTouch(DrawCounter):
+    """
+    Touch controller stand-in. Scripts drive it with press/move/release;
+    poll() only counts, like an I2C read that found nothing new.
+    """
+    def __init__(self):
+        DrawCounter.__init__(self)
+        self.state = False
+        self.x = 0
+        self.y = 0
+
+    def poll(self):
+        self.count("poll")
+
+    def press(self, x, y):
+        self.state = True
+        self.x = x
+        self.y = y
+
+    def move(self, x, y):
+        self.x = x
+        self.y = y
+
+    def release(self):
+        self.state = False
+
+
+class Presto(DrawCounter):
+    """Presto board stand-in: a HostDisplay, a HostTouch and flush accounting."""
+    def __init__(self, full_res=False, palette=False, ambient_light=False, direct_to_fb=False, layers=None):
+        DrawCounter.__init__(self)
+        size = 480 if full_res else 240
+        self.display = HostDisplay(size, size)
+        self.touch = HostTouch()
+        self.flushed_pixels = 0
+
+    def update(self):
+        self.count("update")
+        self.flushed_pixels += self.display.width * self.display.height
+
+    def partial_update(self, x, y, w, h):
+        self.count("partial_update")
+        self.flushed_pixels += w * h
+
+    def set_backlight(self, brightness):
+        pass
+
+    def set_led_rgb(self, i, r, g, b):
+        pass
+
+    async def async_connect(self):
+        return False
+
+
+class Buzzer:
+    def __init__(self, pin):
+        pass
+
+    def set_tone(self, freq, duty=0.5):
+        return True
@@ -0,0 +1,54 @@
+"""
+Render every page from main.py once on the host and report draw calls.
+
+    python tools/host/render_pages.py [--full-res] [--ppm DIR]
+"""
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import host_env
+
+
+def build_pages(app):
+    """Register the pages main.py registers, in the same order."""
+    from config import UIConfig
+
+    for module, class_name in UIConfig.PAGES:
+        app.register_page(module, class_name)
+
+
+async def render_all(args):
+    presto, vector, app = host_env.make_app(full_res=args.full_res)
+    build_pages(app)
+    display = presto.display
+    width, height = display.get_bounds()
+
+    for index in range(len(app.pages)):
+        page = app.get_page(index)
+        app.current_page_index = index
+        display.reset_counts()
+        page.invalidate()
+        app.draw_normal(page, vector, width, height)
+        print(f"{page.name:<10} {display.total():>4} calls  {display.calls}")
+        if args.ppm:
+            display.save_ppm(os.path.join(args.ppm, f"{index}_{page.name}.ppm"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--full-res", action="store_true", help="Render at 480x480")
+    parser.add_argument("--ppm", help="Directory to save one PPM screenshot per page")
+    args = parser.parse_args()
+    if args.ppm:
+        args.ppm = os.path.abspath(args.ppm)
+        os.makedirs(args.ppm, exist_ok=True)
+
+    host_env.install()
+    asyncio.run(render_all(args))
+
+
+if __name__ == "__main__":
+    main()
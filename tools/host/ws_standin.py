@@ -0,0 +1,319 @@
+"""
+Plain-WebSocket stand-in server for exercising src/simple_websocket.py
+on the host.
+
+    python tools/host/ws_standin.py            # run the client checks
+    python tools/host/ws_standin.py --serve 8081
+
+Paths:
+    /trades?n=N  N Binance-style trade messages, then a close frame
+    /ping        pings the client, then sends one trade message
+    /fragmented  one trade message in three fragments, a ping in between
+    /oversize    a fragmented message larger than the client accepts
+    /nopong      upgrades, then ignores the client's pings
+    /badaccept   101 response with a wrong Sec-WebSocket-Accept
+    /reject      plain 404 instead of an upgrade
+    /silent      accepts the TCP connection and never answers
+
+Pings from the client are answered (except on /nopong) and a client
+close is echoed; received pongs and close codes are recorded.
+"""
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import struct
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import host_env
+
+WS_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+
+def trade_message(i):
+    symbol = "BTCUSDT" if i % 2 == 0 else "ETHUSDT"
+    price = (67000.0 if i % 2 == 0 else 3500.0) + i * 0.01
+    return json.dumps({"stream": symbol.lower() + "@trade",
+                       "data": {"e": "trade", "s": symbol, "p": f"{price:.2f}", "q": "0.001"}})
+
+
+def frame(opcode, payload, fin=True):
+    """Encode one unmasked server frame."""
+    if isinstance(payload, str):
+        payload = payload.encode()
+    head = bytes([(0x80 if fin else 0) | opcode])
+    n = len(payload)
+    if n < 126:
+        head += bytes([n])
+    elif n < 65536:
+        head += bytes([126]) + struct.pack(">H", n)
+    else:
+        head += bytes([127]) + struct.pack(">Q", n)
+    return head + payload
+
+
+async def read_client_frame(reader):
+    """Read one masked client frame; returns (fin, opcode, payload)."""
+    b0, b1 = await reader.readexactly(2)
+    n = b1 & 0x7F
+    if n == 126:
+        n = struct.unpack(">H", await reader.readexactly(2))[0]
+    elif n == 127:
+        n = struct.unpack(">Q", await reader.readexactly(8))[0]
+    mask = await reader.readexactly(4) if b1 & 0x80 else b"\0\0\0\0"
+    data = await reader.readexactly(n)
+    payload = bytes(c ^ mask[i % 4] for i, c in enumerate(data))
+    return b0 & 0x80, b0 & 0x0F, payload
+
+
+class StandinServer:
+    """Minimal WebSocket server; counts accepted connections."""
+    def __init__(self):
+        self.connections = 0
+        self.pongs = []         # Payloads of pongs from the client
+        self.pings = 0          # Pings from the client
+        self.close_codes = []   # Status codes of client close frames
+        self.disconnects = 0    # Client connections that ended without a close frame
+        self.port = None
+        self._server = None
+        self._handlers = set()
+
+    async def start(self, host="127.0.0.1", port=0):
+        self._server = await asyncio.start_server(self._handle, host, port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    def url(self, path):
+        return f"ws://127.0.0.1:{self.port}{path}"
+
+    async def stop(self):
+        self._server.close()
+        for task in self._handlers:
+            task.cancel()
+        await asyncio.gather(*self._handlers)
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        task = asyncio.current_task()
+        self._handlers.add(task)
+        try:
+            line = await reader.readline()
+            target = line.decode().split(" ")[1]
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b""):
+                    break
+                name, _, value = line.decode().partition(":")
+                headers[name.strip().lower()] = value.strip()
+            await self._session(reader, writer, target, headers)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            self.disconnects += 1
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self._handlers.discard(task)
+            writer.close()
+
+    async def _session(self, reader, writer, target, headers):
+        path, _, query = target.partition("?")
+        if path == "/silent":
+            await asyncio.sleep(3600)
+            return
+        if path == "/reject":
+            writer.write(b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\n\r\n")
+            await writer.drain()
+            return
+
+        key = headers.get("sec-websocket-key", "").encode()
+        accept = base64.b64encode(hashlib.sha1(key + WS_GUID).digest())
+        if path == "/badaccept":
+            accept = base64.b64encode(b"not the right digest!")
+        writer.write(b"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\n"
+                     b"Connection: Upgrade\r\nSec-WebSocket-Accept: " + accept + b"\r\n\r\n")
+        await writer.drain()
+
+        if path == "/trades":
+            count = int(query.partition("=")[2] or 10)
+            for i in range(count):
+                writer.write(frame(0x1, trade_message(i)))
+            writer.write(frame(0x8, struct.pack(">H", 1000)))
+        elif path == "/ping":
+            writer.write(frame(0x9, b"are you there"))
+            writer.write(frame(0x1, trade_message(0)))
+        elif path == "/fragmented":
+            msg = trade_message(1).encode()
+            writer.write(frame(0x1, msg[:20], fin=False))
+            writer.write(frame(0x9, b"mid"))
+            writer.write(frame(0x0, msg[20:40], fin=False))
+            writer.write(frame(0x0, msg[40:]))
+        elif path == "/oversize":
+            chunk = b"x" * 3000
+            writer.write(frame(0x1, chunk, fin=False))
+            for _ in range(3):
+                writer.write(frame(0x0, chunk, fin=False))
+            writer.write(frame(0x0, chunk))
+        await writer.drain()
+
+        # Serve the client's frames until it closes
+        while True:
+            fin, opcode, payload = await read_client_frame(reader)
+            if opcode == 0x9:
+                self.pings += 1
+                if path != "/nopong":
+                    writer.write(frame(0xA, payload))
+                    await writer.drain()
+            elif opcode == 0xA:
+                self.pongs.append(payload)
+            elif opcode == 0x8:
+                self.close_codes.append(struct.unpack(">H", payload[:2])[0] if payload else None)
+                writer.write(frame(0x8, payload))
+                await writer.drain()
+                return
+
+
+async def run_checks():
+    """Exercise WebSocket against the stand-in; returns the number of failures."""
+    from simple_websocket import WebSocket
+    from reactor import get_reactor
+    import uasyncio
+
+    server = await StandinServer().start()
+    failures = 0
+
+    def check(name, ok):
+        nonlocal failures
+        print(f"{'ok  ' if ok else 'FAIL'} {name}")
+        if not ok:
+            failures += 1
+
+    ws = WebSocket(server.url("/trades?n=5"))
+    await ws.connect()
+    messages = []
+    while True:
+        msg = await ws.recv()
+        if not msg:
+            break
+        messages.append(msg)
+    ws.close()
+    check("handshake and messages", messages == [trade_message(i) for i in range(5)])
+    reads, _ = get_reactor().stats().get("websocket", (0, 0))
+    check("reads counted by the reactor", 0 < reads <= 6)
+
+    for path, name in (("/badaccept", "bad Sec-WebSocket-Accept rejected"),
+                       ("/reject", "non-101 response rejected")):
+        ws = WebSocket(server.url(path))
+        try:
+            await ws.connect()
+            check(name, False)
+        except OSError as e:
+            check(name, ws.writer is None and "handshake" in str(e))
+
+    # Server ping answered, then the data message arrives
+    ws = WebSocket(server.url("/ping"))
+    await ws.connect()
+    msg = await ws.recv()
+    await asyncio.sleep(0.05)
+    check("pong reply to server ping", server.pongs == [b"are you there"] and msg == trade_message(0))
+    disconnects = server.disconnects
+    ws.close()
+    await asyncio.sleep(0.05)
+    check("close releases the socket", server.disconnects == disconnects + 1)
+
+    ws = WebSocket(server.url("/fragmented"))
+    await ws.connect()
+    msg = await ws.recv()
+    await asyncio.sleep(0.05)
+    check("fragments reassembled around a ping", msg == trade_message(1) and b"mid" in server.pongs)
+    # Client ping round trip; pongs are handled inside recv()
+    await ws.ping()
+    pending = asyncio.create_task(ws.recv())
+    await asyncio.sleep(0.1)
+    check("client ping measures RTT", ws.rtt_ms is not None and ws.missed_pongs == 0)
+    pending.cancel()
+    ws.close()
+
+    ws = WebSocket(server.url("/oversize"))
+    await ws.connect()
+    try:
+        await ws.recv()
+        check("oversized message rejected", False)
+    except OSError as e:
+        check("oversized message rejected", "bytes" in str(e))
+    ws.close()
+
+    # Missed pongs, not a socket error, end a silent connection. The
+    # keepalive closes the socket, which wakes the waiting recv()
+    from config import WebSocketConfig
+    interval = WebSocketConfig.PING_INTERVAL_MS
+    WebSocketConfig.PING_INTERVAL_MS = 50
+    ws = WebSocket(server.url("/nopong"))
+    await ws.connect()
+    disconnects = server.disconnects
+    try:
+        await asyncio.wait_for(ws.recv(), 1)
+        check("dead connection from missed pongs", False)
+    except asyncio.TimeoutError:
+        check("dead connection from missed pongs", False)
+    except OSError as e:
+        check("dead connection from missed pongs", "pong" in str(e) and ws.writer is None)
+    await asyncio.sleep(0.05)
+    check("dead connection's socket closed", server.disconnects == disconnects + 1)
+    WebSocketConfig.PING_INTERVAL_MS = interval
+
+    # Server close is echoed
+    ws = WebSocket(server.url("/trades?n=1"))
+    await ws.connect()
+    while await ws.recv():
+        pass
+    await asyncio.sleep(0.05)
+    check("close echoed", server.close_codes[-1:] == [1000])
+
+    # A server that never answers times out without stalling other tasks
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    task = asyncio.create_task(ticker())
+    ws = WebSocket(server.url("/silent"))
+    try:
+        await ws.connect(timeout_ms=300)
+        check("connect timeout", False)
+    except uasyncio.TimeoutError:
+        check("connect timeout", ws.writer is None)
+    task.cancel()
+    check("event loop not blocked during connect", ticks >= 10)
+
+    await server.stop()
+    return failures
+
+
+async def serve(port):
+    server = await StandinServer().start(port=port)
+    print(f"Serving on {server.url('/')}")
+    await asyncio.Event().wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--serve", type=int, metavar="PORT", help="Only run the server")
+    args = parser.parse_args()
+
+    host_env.install()
+    if args.serve:
+        asyncio.run(serve(args.serve))
+        return
+    failures = asyncio.run(run_checks())
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()